@@ -10,6 +10,9 @@ from agents.agent_behaviors import (
     StrategicNegotiationBehavior,
     AdaptiveLearningBehavior
 )
+from agents.deception_detector import DeceptivePatternDetector
+from agents.heuristic_agent import HeuristicProcessorAgent
+from agents.situation_index import SituationIndex, ContextEncoder
 
 __version__ = "1.0.0"
 __author__ = "Deepali Jain"
@@ -21,7 +24,11 @@ __all__ = [
     "CoalitionFormationBehavior",
     "CompetitiveBiddingBehavior", 
     "StrategicNegotiationBehavior",
-    "AdaptiveLearningBehavior"
+    "AdaptiveLearningBehavior",
+    "DeceptivePatternDetector",
+    "HeuristicProcessorAgent",
+    "SituationIndex",
+    "ContextEncoder"
 ]
 
 AGENT_CAPABILITIES = [
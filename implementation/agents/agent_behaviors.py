@@ -1,8 +1,9 @@
 
 from typing import Dict, List, Any, Optional
 from coordination_framework.shared_types import ProcessorState
+from coordination_framework.ranking import top_k_indices
 from abc import ABC, abstractmethod
-import random
+import numpy as np
 
 class AgentBehavior(ABC):
     def __init__(self, agent):
@@ -192,6 +193,8 @@ class CoalitionFormationBehavior(AgentBehavior):
     
     def _evaluate_potential_coalitions(self, potential_partners: List[str]) -> Dict[str, Any]:
         """Evaluate potential coalition partnerships"""
+        if self.agent.peer_table is not None:
+            return self._evaluate_potential_coalitions_batched(potential_partners)
         evaluations = {}
         
         for partner_id in potential_partners:
@@ -209,6 +212,55 @@ class CoalitionFormationBehavior(AgentBehavior):
             "coalition_strategy": self._determine_coalition_strategy(evaluations)
         }
     
+    def _evaluate_potential_coalitions_batched(self, potential_partners: List[str], top_k: int = 2) -> Dict[str, Any]:
+        """
+        Same result as the per-partner path, scores computed for all
+        candidates at once from the coordinator's PeerStateTable: an
+        evaluation for every candidate in potential_partners order, and the
+        top_k recommendations with ties in that order, as the stable sort does.
+        """
+        if not potential_partners:
+            return {"evaluations": {}, "recommended_partners": [], "coalition_strategy": "individual_competition"}
+        peer_table = self.agent.peer_table
+        if not peer_table.observed:
+            evaluations = {
+                partner_id: {"attractiveness_score": 0.3, "reliability": 0.5, "strategic_value": 0.3}
+                for partner_id in potential_partners
+            }
+            return {
+                "evaluations": evaluations,
+                "recommended_partners": list(potential_partners[:top_k]),
+                "coalition_strategy": self._determine_coalition_strategy(evaluations)
+            }
+        rows = peer_table.rows(potential_partners)
+        trust_compatibility = 1.0 - np.abs(self.agent.state.trust_score - peer_table.trust_scores[rows])
+        my_remaining = getattr(self.agent.state, 'execution_slots_used', 0)
+        time_compatibility = 1.0 - np.abs(peer_table.remaining_times[rows] - my_remaining) / 10.0
+        reliability = np.where(peer_table.in_coalition()[rows], 0.7, 0.3)
+        memory_manager = self.agent.memory_manager
+        if memory_manager is not None:
+            history, interactions = memory_manager.relationships.lookup(potential_partners)
+            reliability = np.where(interactions > 0, history, reliability)
+        attractiveness = trust_compatibility * 0.4 + time_compatibility * 0.3 + reliability * 0.3
+        
+        evaluations = {
+            partner_id: {
+                "attractiveness_score": score,
+                "trust_compatibility": trust,
+                "strategic_value": strategic,
+                "reliability": partner_reliability
+            }
+            for partner_id, score, trust, strategic, partner_reliability in zip(
+                potential_partners, attractiveness.tolist(), trust_compatibility.tolist(),
+                time_compatibility.tolist(), reliability.tolist()
+            )
+        }
+        return {
+            "evaluations": evaluations,
+            "recommended_partners": [potential_partners[position] for position in top_k_indices(attractiveness, top_k).tolist()],
+            "coalition_strategy": self._determine_coalition_strategy(evaluations)
+        }
+    
     def _evaluate_single_partner(self, partner_id: str) -> Dict[str, float]:
         """Evaluate a single potential coalition partner"""
         if partner_id not in self.agent.state.observed_opponents:
@@ -225,10 +277,14 @@ class CoalitionFormationBehavior(AgentBehavior):
         my_remaining = getattr(self.agent.state, 'execution_slots_used', 0)
         time_compatibility = 1.0 - abs(remaining_time - my_remaining) / 10.0
         
-        # Historical reliability
+        # Historical reliability: own past dealings with the partner, else whether it keeps allies
         coalition_success_rate = 0.5 
         if "coalition_members" in partner_data:
             coalition_success_rate = 0.7 if len(partner_data["coalition_members"]) > 0 else 0.3
+        memory_manager = self.agent.memory_manager
+        history = memory_manager.relationships.get(partner_id) if memory_manager is not None else None
+        if history is not None:
+            coalition_success_rate = history["trust_assessment"]
         
         attractiveness_score = (
             trust_compatibility * 0.4 +
@@ -0,0 +1,136 @@
+"""
+Deception Detector - Streaming per-processor deceptive-pattern classification.
+
+Incremental replacement for TrustBasedBehavior.detect_deceptive_pattern: keeps a
+fixed window of claim discrepancies with running aggregates so that each update
+and each classification is O(1) instead of rescanning reputation_history.
+"""
+
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+class DeceptivePatternDetector:
+    """
+    Rolling window of discrepancy ratios |claimed - actual| / max(actual, 1).
+
+    With the defaults (window=5, decay=1.0) classification is identical to
+    detect_deceptive_pattern(reputation_history). A decay < 1.0 weights older
+    entries by decay**age, and window=None keeps an unbounded exponentially
+    decayed horizon.
+    """
+
+    # Averages closer than this to a classification threshold are re-summed
+    # exactly so the running sum's rounding can never flip a pattern.
+    BOUNDARY_TOLERANCE = 1e-9
+
+    def __init__(self, window: Optional[int] = 5, decay: float = 1.0,
+                 min_history: int = 3, deception_threshold: float = 0.3):
+        if window is None and decay >= 1.0:
+            raise ValueError("An unbounded window requires decay < 1.0")
+        if window is not None and window < 1:
+            raise ValueError("window must be at least 1")
+        if not 0.0 < decay <= 1.0:
+            raise ValueError("decay must be in (0, 1]")
+        self.window = window
+        self.decay = decay
+        self.min_history = min_history
+        self.deception_threshold = deception_threshold
+        self.history_length = 0
+        self._entries = deque(maxlen=window) if window is not None else None
+        self._eviction_weight = decay ** (window - 1) if window is not None else 0.0
+        self._weighted_sum = 0.0
+        self._weighted_count = 0.0
+        self._weighted_above = 0.0
+        self._valid_count = 0
+        self._above_count = 0
+        self._updates_since_resync = 0
+
+    @classmethod
+    def from_history(cls, reputation_history: List[Dict], **kwargs) -> "DeceptivePatternDetector":
+        detector = cls(**kwargs)
+        for entry in reputation_history:
+            detector.observe(entry.get("claimed_burst_time"), entry.get("actual_remaining"))
+        return detector
+
+    def observe(self, claimed: Optional[int], actual: Optional[int]):
+        """Add one reputation entry; entries without a claim count toward history only"""
+        self.history_length += 1
+        discrepancy = None
+        if claimed is not None and actual is not None:
+            discrepancy = abs(claimed - actual) / max(actual, 1)
+
+        if self._entries is not None and len(self._entries) == self.window:
+            evicted = self._entries[0]
+            if evicted is not None:
+                self._weighted_sum -= evicted * self._eviction_weight
+                self._weighted_count -= self._eviction_weight
+                self._valid_count -= 1
+                if evicted > self.deception_threshold:
+                    self._weighted_above -= self._eviction_weight
+                    self._above_count -= 1
+
+        if self.decay != 1.0:
+            self._weighted_sum *= self.decay
+            self._weighted_count *= self.decay
+            self._weighted_above *= self.decay
+        if discrepancy is not None:
+            self._weighted_sum += discrepancy
+            self._weighted_count += 1.0
+            self._valid_count += 1
+            if discrepancy > self.deception_threshold:
+                self._weighted_above += 1.0
+                self._above_count += 1
+        if self._entries is not None:
+            self._entries.append(discrepancy)
+            self._updates_since_resync += 1
+            if self._updates_since_resync >= self.window:
+                self._resync()
+
+    def classify(self) -> Dict[str, Any]:
+        """Same pattern/severity dictionary as detect_deceptive_pattern"""
+        if self.history_length < self.min_history:
+            return {"pattern": "insufficient_data", "severity": 0.0}
+        if self._valid_count == 0:
+            return {"pattern": "no_data", "severity": 0.0}
+
+        if self.decay == 1.0:
+            avg_discrepancy = self._weighted_sum / self._valid_count
+            consistency = self._above_count / self._valid_count
+            if self._near_threshold(avg_discrepancy):
+                avg_discrepancy = self._exact_sum() / self._valid_count
+        else:
+            avg_discrepancy = self._weighted_sum / self._weighted_count
+            consistency = self._weighted_above / self._weighted_count
+
+        if avg_discrepancy > 0.6 and consistency > 0.6:
+            return {"pattern": "chronic_deception", "severity": 1.0}
+        elif avg_discrepancy > 0.4 and consistency > 0.4:
+            return {"pattern": "frequent_deception", "severity": 0.7}
+        elif avg_discrepancy > 0.2:
+            return {"pattern": "occasional_deception", "severity": 0.3}
+        else:
+            return {"pattern": "mostly_honest", "severity": 0.0}
+
+    def _near_threshold(self, value: float) -> bool:
+        return any(abs(value - threshold) <= self.BOUNDARY_TOLERANCE for threshold in (0.2, 0.4, 0.6))
+
+    def _exact_sum(self) -> float:
+        """Oldest-to-newest sum, matching the float order of the scalar detector"""
+        return sum(d for d in self._entries if d is not None)
+
+    def _resync(self):
+        """Re-anchor the running sum once per window so rounding drift stays bounded"""
+        self._updates_since_resync = 0
+        if self.decay == 1.0:
+            self._weighted_sum = self._exact_sum()
+            return
+        weighted_sum = weighted_count = weighted_above = 0.0
+        weight = 1.0
+        for discrepancy in reversed(self._entries):
+            if discrepancy is not None:
+                weighted_sum += discrepancy * weight
+                weighted_count += weight
+                if discrepancy > self.deception_threshold:
+                    weighted_above += weight
+            weight *= self.decay
+        self._weighted_sum, self._weighted_count, self._weighted_above = weighted_sum, weighted_count, weighted_above
@@ -0,0 +1,49 @@
+"""
+Heuristic Agent - LLM-free processor agent for large-scale simulations.
+"""
+
+from typing import Dict, List
+from agents.processor_agent import ProcessorLLMAgent
+from agents.agent_behaviors import CoalitionFormationBehavior, StrategicNegotiationBehavior
+
+class HeuristicProcessorAgent(ProcessorLLMAgent):
+    """
+    ProcessorLLMAgent whose negotiation and coalition decisions come from the
+    rule-based behaviors instead of a model, so thousands of agents can run
+    without API access. Claims, observations and bidding are unchanged.
+
+    llm_calls still counts the decisions the LLM agent would have sent to the
+    model, so per-slot protocol cost stays comparable between the two.
+    """
+
+    def _create_llm(self):
+        return None
+
+    def negotiate_with_peers(self, other_processors: List[Dict], negotiation_context: Dict) -> str:
+        self.llm_calls += 1
+        crafted = StrategicNegotiationBehavior(self).execute({
+            "action": "craft_message",
+            "round": negotiation_context.get("round", 0),
+            "other_processors": other_processors
+        })
+        message = f"Processor {self.state.processor_id}: {crafted['message']}"
+        self.state.negotiation_history.append({
+            'round': negotiation_context.get('round', 0),
+            'message': message,
+            'context': negotiation_context,
+            'my_trust': self.state.trust_score,
+            'remaining_time': self._get_my_remaining_time()
+        })
+        return message
+
+    def propose_coalition(self, potential_partners: List[str], context: Dict) -> Dict:
+        self.llm_calls += 1
+        behavior = CoalitionFormationBehavior(self)
+        evaluation = behavior.execute({"action": "evaluate_coalitions", "potential_partners": potential_partners})
+        if evaluation["coalition_strategy"] not in ("strong_alliance", "selective_cooperation"):
+            return {"partners": [], "proposal": "no coalition", "terms": "none"}
+        return behavior.execute({"action": "propose_coalition", "target_partners": evaluation["recommended_partners"][:1]})
+
+    def bid_for_execution_slot(self, slot_position: int, competition_info: Dict) -> float:
+        self.llm_calls += 1
+        return self._fallback_bid(slot_position)
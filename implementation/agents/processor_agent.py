@@ -6,28 +6,41 @@ import sys
 # print(f"Loading processor_agent.py, modules: {list(sys.modules.keys())}")
 import json
 import random
-from typing import Dict, List, Any
-from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
+from typing import Dict, List, Any, Optional, Tuple
 from coordination_framework.shared_types import ProcessorState
+from coordination_framework.event_log import get_event_logger, DEBUG
+from coordination_framework.tracing import get_tracer
+from coordination_framework.relationship_store import RelationshipStore
+from agents.situation_index import SituationIndex
+
+_event_log = get_event_logger()
+
+def _human_message(content: str):
+    # langchain is imported on the first LLM call so heuristic-only runs never load it
+    from langchain_core.messages import HumanMessage
+    return HumanMessage(content=content)
 
 class ProcessorLLMAgent:
     """
     LLM-powered processor agent that coordinates with peer processors.
     """
     
-    def __init__(self, processor_id: str, true_burst_time: int, strategy_type: str = "cooperative", bias_level: float = 0.0):
+    def __init__(self, processor_id: str, true_burst_time: int, strategy_type: str = "cooperative", bias_level: float = 0.0,
+                 rng: Optional[random.Random] = None):
+        # Source of claim noise; the coordinator installs a per-run seeded generator
+        self.rng = rng if rng is not None else random
         self.state = ProcessorState(
             processor_id=processor_id,
             true_burst_time=true_burst_time,
             strategy_type=strategy_type,
             bias_level=bias_level
         )
-        self.llm = ChatOpenAI(
-            model="gpt-4o",
-            temperature=0.0,
-            max_tokens=500
-        )
+        self.llm_calls = 0
+        # Shared columnar peer snapshot, installed by a coordinator running batched partner ranking
+        self.peer_table = None
+        # AgentMemoryManager over the coordinator's shared relationship store, installed by the coordinator
+        self.memory_manager = None
+        self.llm = self._create_llm()
         self.personality_prompts = {
             "cooperative": f"""You are Processor {processor_id}, a cooperative distributed computing node.
             Your true burst time is {true_burst_time}ms and you arrived at t=0 with equal priority.
@@ -48,6 +61,14 @@ class ProcessorLLMAgent:
             You think several steps ahead and build reputation when it serves your long-term goals."""
                     }
 
+    def _create_llm(self):
+        from langchain_openai import ChatOpenAI
+        return ChatOpenAI(
+            model="gpt-4o",
+            temperature=0.0,
+            max_tokens=500
+        )
+
     def get_personality_prompt(self) -> str:
         return self.personality_prompts[self.state.strategy_type]
     
@@ -56,41 +77,59 @@ class ProcessorLLMAgent:
         if self.state.strategy_type == "cooperative":
             if self.state.bias_level <= 0.1:
                 claimed_time = actual_remaining
-                print(f"  DEBUG: {self.state.processor_id} (cooperative, bias={self.state.bias_level:.1f}): Being completely honest")
+                self._log_claim("Being completely honest")
             elif self.state.bias_level <= 0.3:
                 max_reduction = max(1, int(actual_remaining * 0.2))
-                reduction = random.randint(0, max_reduction)
+                reduction = self.rng.randint(0, max_reduction)
                 claimed_time = max(1, actual_remaining - reduction)
-                print(f"  DEBUG: {self.state.processor_id} (cooperative, bias={self.state.bias_level:.1f}): Minor underestimate by {reduction}")
+                self._log_claim("Minor underestimate by {reduction}", reduction=reduction)
             else:
                 max_reduction = max(1, int(actual_remaining * 0.4))
-                reduction = random.randint(0, max_reduction)
+                reduction = self.rng.randint(0, max_reduction)
                 claimed_time = max(1, actual_remaining - reduction)
-                print(f"  DEBUG: {self.state.processor_id} (cooperative, bias={self.state.bias_level:.1f}): Moderate underestimate by {reduction}")
+                self._log_claim("Moderate underestimate by {reduction}", reduction=reduction)
         
         elif self.state.strategy_type == "aggressive":
             if self.state.bias_level >= 0.8:
-                claimed_time = max(1, int(actual_remaining * random.uniform(0.2, 0.4)))
-                print(f"  DEBUG: {self.state.processor_id} (aggressive, bias={self.state.bias_level:.1f}): Major lie - claiming {claimed_time} vs actual {actual_remaining}")
+                claimed_time = max(1, int(actual_remaining * self.rng.uniform(0.2, 0.4)))
+                self._log_claim("Major lie - claiming {claimed} vs actual {actual}", claimed=claimed_time, actual=actual_remaining)
             elif self.state.bias_level >= 0.5:
-                claimed_time = max(1, int(actual_remaining * random.uniform(0.4, 0.6)))
-                print(f"  DEBUG: {self.state.processor_id} (aggressive, bias={self.state.bias_level:.1f}): Moderate lie - claiming {claimed_time} vs actual {actual_remaining}")
+                claimed_time = max(1, int(actual_remaining * self.rng.uniform(0.4, 0.6)))
+                self._log_claim("Moderate lie - claiming {claimed} vs actual {actual}", claimed=claimed_time, actual=actual_remaining)
             else:
-                claimed_time = max(1, int(actual_remaining * random.uniform(0.6, 0.8)))
-                print(f"  DEBUG: {self.state.processor_id} (aggressive, bias={self.state.bias_level:.1f}): Minor lie - claiming {claimed_time} vs actual {actual_remaining}")
+                claimed_time = max(1, int(actual_remaining * self.rng.uniform(0.6, 0.8)))
+                self._log_claim("Minor lie - claiming {claimed} vs actual {actual}", claimed=claimed_time, actual=actual_remaining)
         
         else: 
             other_processors = system_context.get("other_processors", [])
             if len(other_processors) > 1 and self.state.bias_level > 0.3:
                 reduction_factor = 1.0 - (self.state.bias_level * 0.5)
                 claimed_time = max(1, int(actual_remaining * reduction_factor))
-                print(f"  DEBUG: {self.state.processor_id} (strategic, bias={self.state.bias_level:.1f}): Competitive underestimate")
+                self._log_claim("Competitive underestimate")
             else:
                 claimed_time = actual_remaining
-                print(f"  DEBUG: {self.state.processor_id} (strategic, bias={self.state.bias_level:.1f}): Being honest")
+                self._log_claim("Being honest")
         self.state.claimed_burst_time = claimed_time
         return claimed_time
 
+    def _log_claim(self, note: str, **fields):
+        if _event_log.enabled(DEBUG, "agent"):
+            _event_log.debug(
+                "agent", "burst_claim",
+                "  DEBUG: {processor_id} ({strategy}, bias={bias:.1f}): " + note,
+                processor_id=self.state.processor_id,
+                strategy=self.state.strategy_type,
+                bias=self.state.bias_level,
+                **fields
+            )
+
+    def _invoke_llm(self, call_type: str, messages: List):
+        """Single entry point for LLM calls so each one can be counted and traced per agent"""
+        self.llm_calls += 1
+        with get_tracer().span(f"llm.{call_type}", "llm", track=self.state.processor_id,
+                               processor_id=self.state.processor_id, call_type=call_type):
+            return self.llm.invoke(messages)
+
     def negotiate_with_peers(self, other_processors: List[Dict], negotiation_context: Dict) -> str:
         """
         Generate negotiation message with full memory context.
@@ -122,8 +161,8 @@ class ProcessorLLMAgent:
                     """
         
         try:
-            messages = [HumanMessage(content=self.get_personality_prompt() + "\n\n" + context)]
-            response = self.llm.invoke(messages)
+            messages = [_human_message(self.get_personality_prompt() + "\n\n" + context)]
+            response = self._invoke_llm("negotiate", messages)
             message = response.content.strip()
             self.state.negotiation_history.append({
                 'round': negotiation_context.get('round', 0),
@@ -135,7 +174,8 @@ class ProcessorLLMAgent:
             return message
             
         except Exception as e:
-            print(f"LLM negotiation error for processor {self.state.processor_id}: {e}")
+            _event_log.warning("agent", "llm_error", "LLM negotiation error for processor {processor_id}: {error}",
+                               processor_id=self.state.processor_id, call="negotiation", error=str(e))
             return f"Processor {self.state.processor_id}: Requesting time slot based on {self._get_my_remaining_time()}ms remaining."
 
     def bid_for_execution_slot(self, slot_position: int, competition_info: Dict) -> float:
@@ -168,8 +208,8 @@ class ProcessorLLMAgent:
                     """
         
         try:
-            messages = [HumanMessage(content=self.get_personality_prompt() + "\n\n" + context)]
-            response = self.llm.invoke(messages)
+            messages = [_human_message(self.get_personality_prompt() + "\n\n" + context)]
+            response = self._invoke_llm("bid", messages)
             bid = self._parse_number_response(response.content, 50.0, 0.0, 100.0)
             if self.state.trust_score <= 0.1:
                 effective_bid = bid * 0.01 
@@ -183,16 +223,21 @@ class ProcessorLLMAgent:
             return effective_bid
             
         except Exception as e:
-            print(f"LLM bidding error for processor {self.state.processor_id}: {e}")
-            base_bid = 50.0 if slot_position == 1 else 30.0 if slot_position == 2 else 10.0
-            if self.state.trust_score <= 0.1:
-                return base_bid * 0.01
-            elif self.state.trust_score <= 0.2:
-                return base_bid * 0.05
-            elif self.state.trust_score <= 0.4:
-                return base_bid * 0.3
-            else:
-                return base_bid
+            _event_log.warning("agent", "llm_error", "LLM bidding error for processor {processor_id}: {error}",
+                               processor_id=self.state.processor_id, call="bidding", error=str(e))
+            return self._fallback_bid(slot_position)
+
+    def _fallback_bid(self, slot_position: int) -> float:
+        """Position-based bid scaled down by trust, used when no model answer is available"""
+        base_bid = 50.0 if slot_position == 1 else 30.0 if slot_position == 2 else 10.0
+        if self.state.trust_score <= 0.1:
+            return base_bid * 0.01
+        elif self.state.trust_score <= 0.2:
+            return base_bid * 0.05
+        elif self.state.trust_score <= 0.4:
+            return base_bid * 0.3
+        else:
+            return base_bid
 
     def propose_coalition(self, potential_partners: List[str], context: Dict) -> Dict:
         """
@@ -212,6 +257,7 @@ class ProcessorLLMAgent:
                             YOUR ANALYSIS:
                             - Your claimed burst: {self.state.claimed_burst_time}ms
                             - Your trust score: {self.state.trust_score:.2f}
+                            - Partners you trust most from past dealings: {self._trusted_partners_summary()}
                             - Current situation: {context.get('situation', 'Initial round')}
 
                             COALITION PROPOSAL:
@@ -222,8 +268,8 @@ class ProcessorLLMAgent:
                             """
         
         try:
-            messages = [HumanMessage(content=self.get_personality_prompt() + "\n\n" + coalition_context)]
-            response = self.llm.invoke(messages)
+            messages = [_human_message(self.get_personality_prompt() + "\n\n" + coalition_context)]
+            response = self._invoke_llm("coalition", messages)
             try:
                 coalition_data = json.loads(response.content)
             except:
@@ -236,9 +282,16 @@ class ProcessorLLMAgent:
             return coalition_data
             
         except Exception as e:
-            print(f"LLM coalition error for processor {self.state.processor_id}: {e}")
+            _event_log.warning("agent", "llm_error", "LLM coalition error for processor {processor_id}: {error}",
+                               processor_id=self.state.processor_id, call="coalition", error=str(e))
             return {"partners": [], "proposal": "no coalition", "terms": "none"}
 
+    def _trusted_partners_summary(self, k: int = 3) -> str:
+        if self.memory_manager is None:
+            return "none yet"
+        trusted = self.memory_manager.get_most_trusted_partners(k)
+        return ", ".join(f"{partner_id} ({trust:.2f})" for partner_id, trust in trusted) or "none yet"
+
     def update_observations(self, other_processor_behaviors: Dict):
         """
         Update observations about other processors' behaviors.
@@ -380,11 +433,22 @@ class AgentMemoryManager:
     Manages sophisticated memory systems for processor agents.
     """
     
-    def __init__(self, agent: ProcessorLLMAgent):
+    def __init__(self, agent: ProcessorLLMAgent, relationship_store: Optional[RelationshipStore] = None):
         self.agent = agent
         self.strategic_patterns = {}
-        self.relationship_models = {}
+        # Pass the coordination system's relationship_store to share one store fleet-wide
+        self.relationship_store = relationship_store if relationship_store is not None else RelationshipStore()
+        self.relationships = self.relationship_store.view(agent.state.processor_id)
         self.performance_metrics = {}
+        # Negotiation contexts encoded once each, searchable over the whole history; built on first query
+        self._situation_index: Optional[SituationIndex] = None
+        self._indexed_history = 0
+
+    @property
+    def situation_index(self) -> SituationIndex:
+        if self._situation_index is None:
+            self._situation_index = SituationIndex()
+        return self._situation_index
     
     def update_strategic_pattern(self, pattern_type: str, context: Dict, outcome: Dict):
         if pattern_type not in self.strategic_patterns:
@@ -398,53 +462,49 @@ class AgentMemoryManager:
         }
         self.strategic_patterns[pattern_type].append(pattern_entry)
     
-    def get_similar_situations(self, current_context: Dict, limit: int = 3) -> List[Dict]:
-        similar_situations = []
-        
-        for history_entry in self.agent.state.negotiation_history[-10:]:
-            similarity = self._calculate_context_similarity(current_context, history_entry.get('context', {}))
-            if similarity > 0.5: 
-                similar_situations.append({
-                    'entry': history_entry,
-                    'similarity': similarity
-                })
-        similar_situations.sort(key=lambda x: x['similarity'], reverse=True)
-        return similar_situations[:limit]
+    def _sync_situation_index(self):
+        history = self.agent.state.negotiation_history
+        if len(history) < self._indexed_history:
+            # History was replaced or trimmed; re-encode it from scratch
+            self.situation_index.clear()
+            self._indexed_history = 0
+        for history_entry in history[self._indexed_history:]:
+            self.situation_index.add(history_entry.get('context', {}), history_entry)
+        self._indexed_history = len(history)
+    
+    def get_similar_situations(self, current_context: Dict, limit: int = 3, min_similarity: float = 0.5,
+                               metric: Optional[str] = None) -> List[Dict]:
+        """
+        Most similar past negotiation contexts across the full history, by
+        cosine similarity of hashed context features (metric="l1" for
+        weighted-L1). Only entries above min_similarity are returned.
+        """
+        self._sync_situation_index()
+        matches = self.situation_index.query(current_context, k=limit, metric=metric, min_similarity=min_similarity)
+        return [{'entry': history_entry, 'similarity': similarity} for _, similarity, history_entry in matches]
     
     def update_relationship_model(self, processor_id: str, interaction_type: str, outcome: str):
         """Update relationship model with another processor"""
-        if processor_id not in self.relationship_models:
-            self.relationship_models[processor_id] = {
-                'interactions': [],
-                'trust_assessment': 0.5,
-                'cooperation_likelihood': 0.5,
-                'reliability_score': 0.5
-            }
-        
-        interaction = {
-            'type': interaction_type,
-            'outcome': outcome,
-            'round': len(self.agent.state.negotiation_history)
-        }
-        self.relationship_models[processor_id]['interactions'].append(interaction)
-        self._update_relationship_metrics(processor_id)
+        self.relationships.record(processor_id, interaction_type, outcome)
     
     def get_relationship_advice(self, processor_id: str) -> Dict[str, Any]:
-        if processor_id not in self.relationship_models:
+        model = self.relationships.get(processor_id)
+        if model is None:
             return {"advice": "no_prior_interaction", "confidence": 0.0}
         
-        model = self.relationship_models[processor_id]
-        
         advice = {
             'trust_level': model['trust_assessment'],
             'cooperation_recommended': model['cooperation_likelihood'] > 0.6,
             'reliability_expected': model['reliability_score'],
             'strategic_approach': self._recommend_strategy(model),
-            'confidence': min(1.0, len(model['interactions']) / 5.0)
+            'confidence': min(1.0, model['interaction_count'] / 5.0)
         }
         
         return advice
     
+    def get_most_trusted_partners(self, k: int = 3, min_interactions: int = 1) -> List[Tuple[str, float]]:
+        return self.relationships.top_trusted(k, min_interactions)
+    
     def _calculate_pattern_effectiveness(self, outcome: Dict) -> float:
         if outcome.get('won_slot', False):
             return 1.0
@@ -472,19 +532,6 @@ class AgentMemoryManager:
         
         return similarity_score / len(common_keys)
     
-    def _update_relationship_metrics(self, processor_id: str):
-        model = self.relationship_models[processor_id]
-        interactions = model['interactions'][-5:] 
-        
-        if not interactions:
-            return
-        positive_outcomes = sum(1 for i in interactions if i['outcome'] in ['success', 'cooperation', 'reliable'])
-        model['trust_assessment'] = positive_outcomes / len(interactions)
-        cooperative_interactions = sum(1 for i in interactions if i['type'] in ['coalition', 'negotiation'])
-        model['cooperation_likelihood'] = cooperative_interactions / len(interactions)
-        reliable_outcomes = sum(1 for i in interactions if i['outcome'] in ['reliable', 'honest', 'kept_promise'])
-        model['reliability_score'] = reliable_outcomes / len(interactions)
-    
     def _recommend_strategy(self, relationship_model: Dict) -> str:
         trust = relationship_model['trust_assessment']
         cooperation = relationship_model['cooperation_likelihood']
@@ -0,0 +1,220 @@
+"""
+Situation Index - Vectorised similarity search over an agent's past coordination contexts.
+
+Each context dict is encoded once into a fixed-length feature vector by
+feature hashing: numeric values land in a bucket chosen by their key,
+categorical values in a bucket chosen by key and value, lists as a bag of
+their items plus their length. Vectors are appended to a growing NumPy
+matrix and queried with top-k cosine similarity or weighted-L1 distance
+over the whole history.
+"""
+
+import math
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from coordination_framework.ranking import top_k_indices
+
+METRICS = ("cosine", "l1")
+
+def _bucket(token: str, dim: int) -> Tuple[int, float]:
+    """Stable (process-independent) bucket and sign for a feature token"""
+    digest = zlib.crc32(token.encode("utf-8"))
+    return digest % dim, (1.0 if digest & 0x80000000 else -1.0)
+
+class ContextEncoder:
+    """
+    Feature-hashing encoder for coordination context dicts. Numeric values are
+    squashed with sign(x) * log1p(|x|) so round numbers and burst times do not
+    swamp categorical features.
+    """
+
+    def __init__(self, dim: int = 64, max_depth: int = 2):
+        if dim < 1:
+            raise ValueError("dim must be positive")
+        self.dim = dim
+        self.max_depth = max_depth
+        self._buckets: Dict[str, Tuple[int, float]] = {}
+
+    def _slot(self, token: str) -> Tuple[int, float]:
+        slot = self._buckets.get(token)
+        if slot is None:
+            slot = self._buckets[token] = _bucket(token, self.dim)
+        return slot
+
+    def _add(self, vector: np.ndarray, token: str, value: float):
+        index, sign = self._slot(token)
+        vector[index] += sign * value
+
+    def _encode_value(self, vector: np.ndarray, key: str, value: Any, depth: int):
+        if isinstance(value, bool) or value is None or isinstance(value, str):
+            self._add(vector, f"{key}={value}", 1.0)
+        elif isinstance(value, (int, float)):
+            if math.isfinite(value):
+                self._add(vector, key, math.copysign(math.log1p(abs(value)), value))
+        elif isinstance(value, dict):
+            if depth < self.max_depth:
+                for sub_key, sub_value in value.items():
+                    self._encode_value(vector, f"{key}.{sub_key}", sub_value, depth + 1)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            self._add(vector, f"len({key})", math.log1p(len(value)))
+            if value and depth < self.max_depth:
+                weight = 1.0 / len(value)
+                for item in value:
+                    if isinstance(item, (str, int, bool)) or item is None:
+                        self._add(vector, f"{key}[]={item}", weight)
+                    elif isinstance(item, dict):
+                        for sub_key, sub_value in item.items():
+                            if isinstance(sub_value, (int, float)) and not isinstance(sub_value, bool):
+                                self._add(vector, f"{key}[].{sub_key}", weight * math.log1p(abs(sub_value)))
+        else:
+            self._add(vector, f"{key}={value!r}", 1.0)
+
+    def encode(self, context: Dict[str, Any]) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for key, value in context.items():
+            self._encode_value(vector, str(key), value, 0)
+        return vector
+
+class SituationIndex:
+    """
+    Growing matrix of encoded contexts with their payloads, stored feature-major
+    (one contiguous row per feature) with per-entry inverse L2 and weighted-L1
+    norms. Hashed contexts are sparse, so a query only reads the rows of its
+    own non-zero features S:
+
+        cosine:  (V[S] . q[S]) / (|v| |q|)
+        L1:      sum_j w_j |v_j - q_j| = |v|_w1 + sum_{j in S} w_j (|v_j - q_j| - |v_j|)
+
+    where S is the query's support. Both are exact. Top-k uses argpartition
+    and breaks ties by insertion order.
+    """
+
+    def __init__(self, dim: int = 64, metric: str = "cosine", weights: Optional[Sequence[float]] = None,
+                 initial_capacity: int = 256, encoder: Optional[ContextEncoder] = None):
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {METRICS}")
+        self.encoder = encoder or ContextEncoder(dim)
+        self.dim = self.encoder.dim
+        self.metric = metric
+        self.weights = np.ones(self.dim, dtype=np.float32) if weights is None else np.asarray(weights, dtype=np.float32)
+        if self.weights.shape != (self.dim,):
+            raise ValueError(f"weights must have length {self.dim}")
+        capacity = max(1, initial_capacity)
+        self._features = np.zeros((self.dim, capacity), dtype=np.float32)
+        self._inverse_l2_norms = np.zeros(capacity, dtype=np.float32)
+        self._l1_norms = np.zeros(capacity, dtype=np.float32)
+        self._score_buffer = np.empty(capacity, dtype=np.float32)
+        self._scratch_buffer = np.empty(capacity, dtype=np.float32)
+        self._payloads: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def _grow(self, needed: int):
+        capacity = self._features.shape[1]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        count = len(self)
+        features = np.zeros((self.dim, capacity), dtype=np.float32)
+        features[:, :count] = self._features[:, :count]
+        inverse_l2_norms = np.zeros(capacity, dtype=np.float32)
+        inverse_l2_norms[:count] = self._inverse_l2_norms[:count]
+        l1_norms = np.zeros(capacity, dtype=np.float32)
+        l1_norms[:count] = self._l1_norms[:count]
+        self._features, self._inverse_l2_norms, self._l1_norms = features, inverse_l2_norms, l1_norms
+        self._score_buffer = np.empty(capacity, dtype=np.float32)
+        self._scratch_buffer = np.empty(capacity, dtype=np.float32)
+
+    def add_vector(self, vector: np.ndarray, payload: Any = None) -> int:
+        vector = np.asarray(vector, dtype=np.float32)
+        row = len(self)
+        self._grow(row + 1)
+        self._features[:, row] = vector
+        norm = float(np.linalg.norm(vector))
+        # Empty contexts get a zero inverse norm and so score 0 against everything
+        self._inverse_l2_norms[row] = 1.0 / norm if norm > 0 else 0.0
+        self._l1_norms[row] = np.abs(vector) @ self.weights
+        self._payloads.append(payload)
+        return row
+
+    def add(self, context: Dict[str, Any], payload: Any = None) -> int:
+        """Encode a context once and append it; returns its row"""
+        return self.add_vector(self.encoder.encode(context), payload)
+
+    def clear(self):
+        count = len(self)
+        self._features[:, :count] = 0.0
+        self._inverse_l2_norms[:count] = 0.0
+        self._l1_norms[:count] = 0.0
+        self._payloads = []
+
+    def payload(self, row: int) -> Any:
+        return self._payloads[row]
+
+    def _scores(self, query: np.ndarray, metric: str) -> np.ndarray:
+        """
+        Per-entry ranking scores (higher is more similar) in a reused buffer:
+        cosine without the constant query norm, or minus the weighted L1 distance.
+        """
+        count = len(self)
+        scores = self._score_buffer[:count]
+        scratch = self._scratch_buffer[:count]
+        support = np.flatnonzero(query)
+        if metric == "cosine":
+            scores[:] = 0.0
+            for feature in support:
+                np.multiply(self._features[feature, :count], query[feature], out=scratch)
+                scores += scratch
+            scores *= self._inverse_l2_norms[:count]
+            return scores
+        # |v - q| - |v| per feature is |q| - 2 * clip(v, 0, q) (q > 0) or |q| + 2 * clip(v, q, 0) (q < 0)
+        np.negative(self._l1_norms[:count], out=scores)
+        offset = 0.0
+        for feature in support:
+            value, weight = float(query[feature]), float(self.weights[feature])
+            offset += weight * abs(value)
+            if value > 0:
+                np.clip(self._features[feature, :count], 0.0, value, out=scratch)
+                scratch *= 2.0 * weight
+            else:
+                np.clip(self._features[feature, :count], value, 0.0, out=scratch)
+                scratch *= -2.0 * weight
+            scores += scratch
+        scores -= offset
+        return scores
+
+    def _similarity(self, score: float, query: np.ndarray, metric: str) -> float:
+        if metric == "cosine":
+            query_norm = float(np.linalg.norm(query))
+            return score / query_norm if query_norm > 0 else 0.0
+        return 1.0 / (1.0 + max(0.0, -score))
+
+    def query_vector(self, query: np.ndarray, k: int = 3, metric: Optional[str] = None,
+                     min_similarity: Optional[float] = None) -> List[Tuple[int, float, Any]]:
+        """
+        Top-k (row, similarity, payload), most similar first. Similarity is
+        cosine, or 1 / (1 + weighted L1 distance) for metric="l1".
+        """
+        count = len(self)
+        if count == 0 or k <= 0:
+            return []
+        metric = metric or self.metric
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {METRICS}")
+        query = np.asarray(query, dtype=np.float32)
+        scores = self._scores(query, metric)
+        order = top_k_indices(scores, k).tolist()
+        results = [(row, self._similarity(float(scores[row]), query, metric), self._payloads[row]) for row in order]
+        if min_similarity is not None:
+            results = [result for result in results if result[1] > min_similarity]
+        return results
+
+    def query(self, context: Dict[str, Any], k: int = 3, metric: Optional[str] = None,
+              min_similarity: Optional[float] = None) -> List[Tuple[int, float, Any]]:
+        """Top-k (row, similarity, payload) for a context, most similar first"""
+        return self.query_vector(self.encoder.encode(context), k, metric, min_similarity)
@@ -0,0 +1,6 @@
+"""
+Benchmarks - Performance harnesses for coordination hot paths.
+
+Benchmarks use synthetic, LLM-free processors so they measure coordination
+bookkeeping only and can run without API credentials.
+"""
@@ -0,0 +1,235 @@
+"""
+Hierarchical Auction Benchmark - Per-round auction cost and fairness, flat vs sharded.
+
+Cost: one bidding step (calculate_enhanced_bids vs calculate_hierarchical_bids)
+and one observation update on synthetic fleets of 1k-100k processors with
+spread-out trust scores, plus one full five-phase round of heuristic agents
+(claims, negotiation and coalition partners are shard-scoped too, so the
+whole round is sharded). Flat bidding above --flat-limit is not run; its
+time is extrapolated quadratically from the largest measured flat step and
+marked as such. Flat full rounds only run up to --flat-round-limit, since
+flat observations (n - 1 per agent) stop fitting in memory beyond a few
+thousand agents. Competitor entries count the competitor dicts handed to
+bidders, the quantity that is O(n²) in a flat auction.
+
+Fairness: full heuristic (LLM-free) simulations to completion under the flat
+auction and both shard strategies, comparing response time, waiting time and
+Jain's index of slowdown, plus how often the sharded first-slot winners match
+the flat ones on the measured synthetic fleets.
+
+Usage (from implementation/):
+    python -m benchmarks.hierarchical_auction --sizes 1000 10000 100000 --shard-size 64
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Dict, List, Optional, Sequence
+
+from agents.heuristic_agent import HeuristicProcessorAgent
+from benchmarks.quantum_tradeoff import measure_quantum
+from benchmarks.suite import PHASE_ORDER
+from benchmarks.synthetic import build_synthetic_fleet
+from coordination_framework.event_log import configure_event_logging
+from coordination_framework.scheduling import SchedulingConfig
+from coordination_framework.system_coordinator import DistributedCoordinationSystem
+from coordination_framework.workflow_engine import CoordinationWorkflowEngine
+from scenarios.population import generate_processor_configs
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+def _build_system(count: int, scheduling: SchedulingConfig, seed: int) -> DistributedCoordinationSystem:
+    processors = build_synthetic_fleet(count, seed=seed)
+    rng = random.Random(seed)
+    for processor in processors:
+        processor.state.trust_score = rng.uniform(0.05, 1.0)
+        processor.state.execution_slots_used = rng.randint(0, processor.state.true_burst_time - 1)
+        processor.claim_burst_time()
+    return DistributedCoordinationSystem(processors, seed=seed, scheduling=scheduling)
+
+def _timed(function) -> Dict:
+    start = time.perf_counter()
+    result = function()
+    return {"time": time.perf_counter() - start, "result": result}
+
+def _competitor_entries(group_sizes: Sequence[int]) -> int:
+    return sum(size * (size - 1) for size in group_sizes)
+
+def measure_full_round(count: int, scheduling: SchedulingConfig, seed: int = 0) -> float:
+    """Seconds for one full round of heuristic agents, after a warm-up round fills observations"""
+    configure_event_logging(quiet=True)
+    processors = [
+        HeuristicProcessorAgent(config["id"], config["burst_time"], config["strategy"], config["bias"])
+        for config in generate_processor_configs(count, burst_range=(20, 40), seed=seed)
+    ]
+    for processor in processors:
+        processor.state.execution_slots_used = 0
+    system = DistributedCoordinationSystem(processors, seed=seed, scheduling=scheduling)
+    phases = CoordinationWorkflowEngine(system).build_phase_functions()
+    state = system.system_state
+    for phase in PHASE_ORDER:
+        state = phases[phase](state)
+    start = time.perf_counter()
+    for phase in PHASE_ORDER:
+        state = phases[phase](state)
+    return time.perf_counter() - start
+
+def measure_round(count: int, shard_size: int = 64, shard_by: str = "hash", cores: int = 1,
+                  measure_flat: bool = True, measure_flat_round: bool = True, seed: int = 0) -> Dict:
+    """One bidding step, one observation update and one full round, sharded and (optionally) flat"""
+    configure_event_logging(quiet=True)
+    context = {"round_number": 0, "competition_info": {}}
+    row = {"processors": count}
+
+    system = _build_system(count, SchedulingConfig(cores=cores, auction="hierarchical",
+                                                   shard_size=shard_size, shard_by=shard_by), seed)
+    bidding = _timed(lambda: system.calculate_hierarchical_bids(context))
+    observations = _timed(lambda: system._update_processor_observations(system.system_state))
+    shard_sizes = [len(members) for members in system.shard_map.shards().values()]
+    finalists = bidding["result"]
+    row["hierarchical"] = {
+        "bidding_time": bidding["time"],
+        "observation_time": observations["time"],
+        "shards": len(shard_sizes),
+        "largest_shard": max(shard_sizes),
+        "finalists": len(finalists),
+        "competitor_entries": _competitor_entries(shard_sizes + [len(finalists)]),
+        "observations_per_processor": sum(size * (size - 1) for size in shard_sizes) / count
+    }
+    hierarchical_winners = set(sorted(finalists, key=finalists.get, reverse=True)[:cores])
+    del system
+    sharded = SchedulingConfig(cores=cores, auction="hierarchical", shard_size=shard_size, shard_by=shard_by)
+    row["hierarchical"]["round_time"] = measure_full_round(count, sharded, seed)
+
+    row["flat"] = {"competitor_entries": _competitor_entries([count]), "observations_per_processor": count - 1}
+    if measure_flat:
+        system = _build_system(count, SchedulingConfig(cores=cores), seed)
+        bidding = _timed(lambda: system.calculate_enhanced_bids(context))
+        bids = bidding["result"]
+        flat_order = sorted(bids, key=bids.get, reverse=True)
+        flat_winners = set(flat_order[:cores])
+        row["flat"].update({"bidding_time": bidding["time"], "extrapolated": False})
+        row["winner_overlap"] = len(hierarchical_winners & flat_winners) / len(flat_winners)
+        # Where the sharded winners sit in the flat ranking (0 = flat winner)
+        row["winner_flat_rank"] = max(flat_order.index(proc_id) for proc_id in hierarchical_winners)
+        del system
+    if measure_flat_round:
+        row["flat"]["round_time"] = measure_full_round(count, SchedulingConfig(cores=cores), seed)
+    return row
+
+def compare_fairness(count: int = 48, shard_size: int = 12, cores: int = 4, seeds: Sequence[int] = (0, 1, 2),
+                     max_rounds: int = 400) -> List[Dict]:
+    """Heuristic simulations to completion under each auction, averaged over seeds"""
+    configs = [
+        ("flat", SchedulingConfig(cores=cores)),
+        ("hierarchical/hash", SchedulingConfig(cores=cores, auction="hierarchical", shard_size=shard_size)),
+        ("hierarchical/coalition", SchedulingConfig(cores=cores, auction="hierarchical", shard_size=shard_size,
+                                                    shard_by="coalition"))
+    ]
+    keys = ("time_slots", "mean_response_time", "max_response_time", "mean_waiting_time",
+            "slowdown_fairness", "wall_time")
+    rows = []
+    for label, scheduling in configs:
+        runs = [measure_quantum(count, scheduling, max_rounds, seed) for seed in seeds]
+        row = {"auction": label, "completed": all(run["completed"] for run in runs)}
+        row.update({key: sum(run[key] for run in runs) / len(runs) for key in keys})
+        rows.append(row)
+    return rows
+
+def run_benchmark(sizes: Sequence[int] = DEFAULT_SIZES, shard_size: int = 64, shard_by: str = "hash",
+                  cores: int = 1, flat_limit: int = 10000, flat_round_limit: int = 2000, seed: int = 0,
+                  fairness_processors: int = 48, fairness_shard_size: int = 12, fairness_cores: int = 4,
+                  fairness_seeds: Sequence[int] = (0, 1, 2)) -> Dict:
+    rows = [
+        measure_round(count, shard_size, shard_by, cores, count <= flat_limit, count <= flat_round_limit, seed)
+        for count in sizes
+    ]
+    measured = [row for row in rows if "bidding_time" in row["flat"]]
+    for row in rows:
+        if "bidding_time" not in row["flat"] and measured:
+            reference = measured[-1]
+            row["flat"]["bidding_time"] = reference["flat"]["bidding_time"] * (row["processors"] / reference["processors"]) ** 2
+            row["flat"]["extrapolated"] = True
+        if "bidding_time" in row["flat"]:
+            row["speedup"] = row["flat"]["bidding_time"] / row["hierarchical"]["bidding_time"]
+    return {
+        "config": {
+            "sizes": list(sizes),
+            "shard_size": shard_size,
+            "shard_by": shard_by,
+            "cores": cores,
+            "flat_limit": flat_limit,
+            "flat_round_limit": flat_round_limit,
+            "seed": seed
+        },
+        "rows": rows,
+        "fairness": {
+            "processors": fairness_processors,
+            "shard_size": fairness_shard_size,
+            "cores": fairness_cores,
+            "seeds": list(fairness_seeds),
+            "rows": compare_fairness(fairness_processors, fairness_shard_size, fairness_cores, fairness_seeds)
+        }
+    }
+
+def format_benchmark(results: Dict) -> str:
+    config = results["config"]
+    lines = [
+        f"HIERARCHICAL AUCTION (shard_size={config['shard_size']}, by {config['shard_by']}, cores={config['cores']})",
+        f"{'N':>8} {'shards':>7} {'final':>6} {'flat bid s':>11} {'shard bid s':>12} {'speedup':>8} "
+        f"{'obs s':>7} {'flat round s':>13} {'shard round s':>14} {'flat entries':>13} {'shard entries':>14} "
+        f"{'overlap':>8} {'rank':>5}"
+    ]
+    for row in results["rows"]:
+        flat, sharded = row["flat"], row["hierarchical"]
+        flat_round = f"{flat['round_time']:.3f}" if "round_time" in flat else "n/a"
+        flat_time = f"{flat['bidding_time']:.3f}{'*' if flat.get('extrapolated') else ''}" if "bidding_time" in flat else "n/a"
+        lines.append(
+            f"{row['processors']:>8} {sharded['shards']:>7} {sharded['finalists']:>6} {flat_time:>11} "
+            f"{sharded['bidding_time']:>12.3f} {row.get('speedup', 0.0):>7.1f}x {sharded['observation_time']:>7.3f} "
+            f"{flat_round:>13} {sharded['round_time']:>14.3f} "
+            f"{flat['competitor_entries']:>13} {sharded['competitor_entries']:>14} "
+            f"{row['winner_overlap'] if 'winner_overlap' in row else 'n/a':>8} {row.get('winner_flat_rank', 'n/a'):>5}"
+        )
+    lines.append("* extrapolated as N^2 from the largest measured flat round")
+    fairness = results["fairness"]
+    lines.append("")
+    lines.append(f"FAIRNESS ({fairness['processors']} heuristic agents, shard_size={fairness['shard_size']}, "
+                 f"cores={fairness['cores']}, seeds {fairness['seeds']})")
+    lines.append(f"{'auction':>23} {'done':>5} {'slots':>6} {'resp':>6} {'max resp':>9} {'wait':>6} {'Jain':>6} {'wall s':>7}")
+    for row in fairness["rows"]:
+        lines.append(
+            f"{row['auction']:>23} {'yes' if row['completed'] else 'no':>5} {row['time_slots']:>6.1f} "
+            f"{row['mean_response_time']:>6.1f} {row['max_response_time']:>9.1f} {row['mean_waiting_time']:>6.1f} "
+            f"{row['slowdown_fairness']:>6.3f} {row['wall_time']:>7.2f}"
+        )
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Per-round cost and fairness of hierarchical vs flat auctions")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--shard-size", type=int, default=64)
+    parser.add_argument("--shard-by", choices=("hash", "coalition"), default="hash")
+    parser.add_argument("--cores", type=int, default=1)
+    parser.add_argument("--flat-limit", type=int, default=10000, help="Largest fleet to run a flat bidding step for")
+    parser.add_argument("--flat-round-limit", type=int, default=2000, help="Largest fleet to run a flat full round for")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fairness-processors", type=int, default=48)
+    parser.add_argument("--fairness-shard-size", type=int, default=12)
+    parser.add_argument("--fairness-cores", type=int, default=4)
+    parser.add_argument("--fairness-seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--output", help="Write the results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.sizes, args.shard_size, args.shard_by, args.cores, args.flat_limit,
+                            args.flat_round_limit, args.seed,
+                            args.fairness_processors, args.fairness_shard_size, args.fairness_cores,
+                            args.fairness_seeds)
+    print(format_benchmark(results))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Import Time - Startup cost of main.py and the package roots from `python -X importtime`.
+
+Each target is imported in a fresh interpreter; the importtime log gives the
+cumulative cost, the slowest modules, and whether the LLM / graph libraries
+were loaded at import (they should only load on first use).
+
+Usage (from implementation/):
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --targets main agents --top 10 --output imports.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+DEFAULT_TARGETS = ("main", "agents", "coordination_framework", "scenarios",
+                   "coordination_framework.system_coordinator")
+HEAVY_MODULES = ("langchain_openai", "langchain_core", "langgraph", "openai")
+
+_IMPLEMENTATION_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def parse_importtime(log: str) -> List[Dict]:
+    """Rows of `import time: self [us] | cumulative | imported package`"""
+    rows = []
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us)
+        })
+    return rows
+
+def measure_import(target: str, repeats: int = 3) -> Dict:
+    """Best-of-`repeats` wall time plus the importtime breakdown of that run"""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+            cwd=_IMPLEMENTATION_DIR, capture_output=True, text=True
+        )
+        wall = time.perf_counter() - start
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "import failed"
+            return {"target": target, "error": error}
+        if best is None or wall < best[0]:
+            best = (wall, completed.stderr)
+
+    wall, log = best
+    rows = parse_importtime(log)
+    loaded = {row["module"] for row in rows}
+    target_row = next((row for row in rows if row["module"] == target), None)
+    return {
+        "target": target,
+        "wall_time": wall,
+        "import_us": target_row["cumulative_us"] if target_row else sum(row["self_us"] for row in rows),
+        "modules_loaded": len(rows),
+        "heavy_modules_loaded": sorted(
+            heavy for heavy in HEAVY_MODULES
+            if heavy in loaded or any(module.startswith(heavy + ".") for module in loaded)
+        ),
+        "slowest": sorted(rows, key=lambda row: row["self_us"], reverse=True)
+    }
+
+def run_import_benchmark(targets: Sequence[str] = DEFAULT_TARGETS, repeats: int = 3, top: int = 10) -> List[Dict]:
+    results = []
+    for target in targets:
+        result = measure_import(target, repeats)
+        if "slowest" in result:
+            result["slowest"] = result["slowest"][:top]
+        results.append(result)
+    return results
+
+def format_import_report(results: List[Dict]) -> str:
+    lines = ["IMPORT TIME REPORT", f"{'target':<42} {'wall s':>8} {'import ms':>10} {'modules':>8}  heavy deps loaded"]
+    for result in results:
+        if "error" in result:
+            lines.append(f"{result['target']:<42} ERROR: {result['error']}")
+            continue
+        lines.append(
+            f"{result['target']:<42} {result['wall_time']:>8.3f} {result['import_us'] / 1000:>10.1f} "
+            f"{result['modules_loaded']:>8}  {', '.join(result['heavy_modules_loaded']) or '-'}"
+        )
+    for result in results:
+        if result.get("slowest"):
+            lines.append(f"\nSlowest modules importing {result['target']} (self time):")
+            for row in result["slowest"]:
+                lines.append(f"  {row['self_us'] / 1000:>8.1f} ms  {row['module']}")
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Import-time report for main.py and the package roots")
+    parser.add_argument("--targets", nargs="+", default=list(DEFAULT_TARGETS))
+    parser.add_argument("--repeats", type=int, default=3, help="Fresh interpreters per target; the fastest is reported")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--output", help="Write the results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    results = run_import_benchmark(args.targets, args.repeats, args.top)
+    print(format_import_report(results))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
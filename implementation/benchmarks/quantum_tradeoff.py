@@ -0,0 +1,120 @@
+"""
+Quantum Trade-off - Coordination overhead against responsiveness by auction quantum.
+
+Runs the same ScalabilityTestScenario population of heuristic (LLM-free)
+agents under each quantum setting and records, per setting, the coordination
+cost (auctions, agent decisions per executed slot, wall time) next to the
+responsiveness of the schedule (slots until each processor first runs, mean
+turnaround and waiting time). Longer quanta mean fewer auctions but a bid
+change, or a deceptive claim, waits longer before the next auction sees it.
+
+Usage (from implementation/):
+    python -m benchmarks.quantum_tradeoff --processors 12 --quanta 1 2 4 8 --adaptive
+"""
+
+import argparse
+import json
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from agents.heuristic_agent import HeuristicProcessorAgent
+from coordination_framework.event_log import configure_event_logging
+from coordination_framework.scheduling import SchedulingConfig
+from coordination_framework.system_coordinator import DistributedCoordinationSystem
+from scenarios.resource_contention_scenario import ScalabilityTestScenario
+
+DEFAULT_QUANTA = (1, 2, 4, 8)
+
+def measure_quantum(count: int, scheduling: SchedulingConfig, max_rounds: int = 200, seed: int = 0,
+                    burst_range: Tuple[int, int] = (3, 5)) -> Dict:
+    """Run one population to completion or max_rounds under a scheduling config"""
+    configure_event_logging(quiet=True)
+    scenario = ScalabilityTestScenario(
+        count,
+        burst_range=burst_range,
+        seed=seed,
+        agent_class=HeuristicProcessorAgent
+    )
+    processors = scenario.setup_processors()
+    system = DistributedCoordinationSystem(processors, seed=seed, max_rounds=max_rounds, scheduling=scheduling)
+
+    start = time.perf_counter()
+    system.workflow.invoke(
+        system.system_state,
+        config={"recursion_limit": 5 * max_rounds + 10}
+    )
+    wall_time = time.perf_counter() - start
+
+    report = system.scheduling_report()
+    report.update({
+        "processors": count,
+        "completed": not system._get_active_processors_only(),
+        "wall_time": wall_time,
+        "wall_time_per_slot": wall_time / report["time_slots"] if report["time_slots"] else 0.0
+    })
+    return report
+
+def run_tradeoff(count: int = 12, quanta: Sequence[int] = DEFAULT_QUANTA, adaptive: bool = True,
+                 max_quantum: int = 16, cores: int = 1, max_rounds: int = 200, seed: int = 0,
+                 burst_range: Tuple[int, int] = (3, 5)) -> Dict:
+    """Fixed quanta first, then (if adaptive) the adaptive quantum starting from 1"""
+    configs = [SchedulingConfig(slots_per_round=quantum, cores=cores) for quantum in quanta]
+    if adaptive:
+        configs.append(SchedulingConfig(slots_per_round=1, cores=cores, adaptive_quantum=True, max_quantum=max_quantum))
+    # Warm-up run so imports and first-call costs are not charged to the first quantum
+    measure_quantum(count, configs[0], max_rounds, seed, burst_range)
+    rows = [measure_quantum(count, config, max_rounds, seed, burst_range) for config in configs]
+    return {
+        "config": {
+            "processors": count,
+            "quanta": list(quanta),
+            "adaptive": adaptive,
+            "max_quantum": max_quantum,
+            "cores": cores,
+            "max_rounds": max_rounds,
+            "seed": seed,
+            "burst_range": list(burst_range)
+        },
+        "rows": rows
+    }
+
+def format_tradeoff(results: Dict) -> str:
+    lines = [
+        "QUANTUM TRADE-OFF",
+        f"{'quantum':>10} {'auctions':>9} {'slots':>6} {'done':>5} {'LLM/slot':>9} {'wall s':>8} "
+        f"{'resp':>6} {'max resp':>9} {'turnaround':>11} {'wait':>6}"
+    ]
+    for row in results["rows"]:
+        label = f"adaptive<={row['max_quantum_granted']}" if row["adaptive_quantum"] else str(row["quantum"])
+        lines.append(
+            f"{label:>10} {row['auctions']:>9} {row['time_slots']:>6} {'yes' if row['completed'] else 'no':>5} "
+            f"{row['llm_calls_per_slot']:>9.1f} {row['wall_time']:>8.3f} "
+            f"{row['mean_response_time']:>6.1f} {row['max_response_time']:>9} "
+            f"{row['mean_turnaround']:>11.1f} {row['mean_waiting_time']:>6.1f}"
+        )
+    lines.append("")
+    lines.append("resp = time slot of first execution; turnaround and wait in slots, over completed processors")
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Coordination overhead vs responsiveness by auction quantum")
+    parser.add_argument("--processors", type=int, default=12)
+    parser.add_argument("--quanta", type=int, nargs="+", default=list(DEFAULT_QUANTA))
+    parser.add_argument("--adaptive", action="store_true", help="Also run the adaptive quantum")
+    parser.add_argument("--max-quantum", type=int, default=16)
+    parser.add_argument("--cores", type=int, default=1)
+    parser.add_argument("--max-rounds", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--burst-range", type=int, nargs=2, default=[3, 5], metavar=("MIN", "MAX"))
+    parser.add_argument("--output", help="Write the trade-off results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    results = run_tradeoff(args.processors, args.quanta, args.adaptive, args.max_quantum, args.cores,
+                           args.max_rounds, args.seed, tuple(args.burst_range))
+    print(format_tradeoff(results))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Scalability Sweep - Scaling table and per-phase complexity exponents by population size.
+
+Runs ScalabilityTestScenario populations of heuristic (LLM-free) agents through
+the real coordination workflow, one fresh process per size, and records wall
+time per round and per phase, peak RSS, LLM calls per slot and rounds to
+completion.
+
+Usage (from implementation/):
+    python -m benchmarks.scalability_sweep --sizes 3 10 100 1000 --max-rounds 20
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import resource
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from agents.heuristic_agent import HeuristicProcessorAgent
+from coordination_framework.event_log import configure_event_logging
+from coordination_framework.profiling import PHASES, PhaseProfiler, set_phase_profiler
+from coordination_framework.system_coordinator import DistributedCoordinationSystem
+from scenarios.resource_contention_scenario import ScalabilityTestScenario
+
+DEFAULT_SIZES = (3, 10, 100, 1000)
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def measure_population(count: int, max_rounds: int = 20, seed: int = 0,
+                       burst_range: Tuple[int, int] = (3, 5),
+                       strategy_weights: Optional[Dict[str, float]] = None) -> Dict:
+    """Run one population size to completion or max_rounds and collect its metrics"""
+    configure_event_logging(quiet=True)
+    scenario = ScalabilityTestScenario(
+        count,
+        burst_range=burst_range,
+        strategy_weights=strategy_weights,
+        seed=seed,
+        agent_class=HeuristicProcessorAgent
+    )
+    processors = scenario.setup_processors()
+    system = DistributedCoordinationSystem(processors, seed=seed, max_rounds=max_rounds)
+
+    profiler = PhaseProfiler(cpu=False)
+    set_phase_profiler(profiler)
+    start = time.perf_counter()
+    final_state = system.workflow.invoke(
+        system.system_state,
+        config={"recursion_limit": 5 * max_rounds + 10}
+    )
+    wall_time = time.perf_counter() - start
+    set_phase_profiler(None)
+
+    rounds = final_state["round_number"]
+    slots = len(system.execution_history)
+    llm_calls = sum(processor.llm_calls for processor in processors)
+    return {
+        "processors": count,
+        "rounds": rounds,
+        "completed": not system._get_active_processors_only(),
+        "rounds_to_completion": rounds if not system._get_active_processors_only() else None,
+        "wall_time": wall_time,
+        "wall_time_per_round": wall_time / rounds if rounds else 0.0,
+        "phase_time_per_round": {
+            phase: timing["total_time"] / timing["calls"]
+            for phase, timing in profiler.timings.items()
+        },
+        "peak_rss_mb": _peak_rss_mb(),
+        "llm_calls": llm_calls,
+        "llm_calls_per_slot": llm_calls / slots if slots else 0.0
+    }
+
+def fit_exponent(sizes: Sequence[int], times: Sequence[float]) -> Optional[float]:
+    """Least-squares slope of log(time) against log(size), i.e. time ~ size**k"""
+    points = [(n, t) for n, t in zip(sizes, times) if n > 0 and t > 0]
+    # Tiny populations are dominated by fixed per-round overhead
+    large = [(n, t) for n, t in points if n >= 10]
+    if len(large) >= 2:
+        points = large
+    if len(points) < 2:
+        return None
+    slope, _ = np.polyfit([math.log(n) for n, _ in points], [math.log(t) for _, t in points], 1)
+    return float(slope)
+
+def run_sweep(sizes: Sequence[int] = DEFAULT_SIZES, max_rounds: int = 20, seed: int = 0,
+              burst_range: Tuple[int, int] = (3, 5),
+              strategy_weights: Optional[Dict[str, float]] = None) -> Dict:
+    """Measure each size in its own process so peak RSS is per size"""
+    rows = []
+    with multiprocessing.Pool(processes=1, maxtasksperchild=1) as pool:
+        for count in sizes:
+            rows.append(pool.apply(measure_population, (count, max_rounds, seed, burst_range, strategy_weights)))
+
+    measured_sizes = [row["processors"] for row in rows]
+    exponents = {
+        phase: fit_exponent(measured_sizes, [row["phase_time_per_round"].get(phase, 0.0) for row in rows])
+        for phase in PHASES
+    }
+    exponents["round"] = fit_exponent(measured_sizes, [row["wall_time_per_round"] for row in rows])
+    return {
+        "config": {
+            "sizes": list(sizes),
+            "max_rounds": max_rounds,
+            "seed": seed,
+            "burst_range": list(burst_range),
+            "strategy_weights": strategy_weights
+        },
+        "rows": rows,
+        "complexity_exponents": exponents
+    }
+
+def format_sweep(results: Dict) -> str:
+    lines = [
+        "SCALABILITY SWEEP",
+        f"{'N':>7} {'rounds':>7} {'done':>5} {'s/round':>10} {'init':>9} {'negot':>9} {'coal':>9} "
+        f"{'bid':>9} {'exec':>9} {'RSS MB':>8} {'LLM/slot':>9}"
+    ]
+    for row in results["rows"]:
+        phase = row["phase_time_per_round"]
+        lines.append(
+            f"{row['processors']:>7} {row['rounds']:>7} {'yes' if row['completed'] else 'no':>5} "
+            f"{row['wall_time_per_round']:>10.4f} "
+            + " ".join(f"{phase.get(name, 0.0):>9.4f}" for name in PHASES)
+            + f" {row['peak_rss_mb']:>8.1f} {row['llm_calls_per_slot']:>9.1f}"
+        )
+    lines.append("")
+    lines.append("Fitted complexity exponent (time per round ~ N^k):")
+    for name, exponent in results["complexity_exponents"].items():
+        lines.append(f"  {name:<15} {'n/a' if exponent is None else f'{exponent:.2f}'}")
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Scalability sweep over processor population sizes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--max-rounds", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--burst-range", type=int, nargs=2, default=[3, 5], metavar=("MIN", "MAX"))
+    parser.add_argument("--output", help="Write the sweep results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    results = run_sweep(args.sizes, args.max_rounds, args.seed, tuple(args.burst_range))
+    print(format_sweep(results))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Situation Index Benchmark - Query latency of SituationIndex against history size.
+
+Fills an index with synthetic negotiation contexts, times top-k queries for
+each metric, and checks the results against a brute-force scan of the same
+vectors.
+
+Usage: python -m benchmarks.situation_index_benchmark --sizes 1000 10000 100000
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from agents.situation_index import METRICS, SituationIndex
+
+STRATEGIES = ("cooperative", "aggressive", "strategic")
+
+def synthetic_context(rng: random.Random) -> Dict:
+    competitors = rng.randint(1, 8)
+    return {
+        "round_number": rng.randint(0, 50),
+        "remaining_burst": rng.randint(0, 40),
+        "strategy": rng.choice(STRATEGIES),
+        "phase": rng.choice(("bidding", "negotiation", "coalition")),
+        "in_coalition": rng.random() < 0.3,
+        "competitors": [{"burst_time": rng.randint(1, 40), "trust": rng.random()} for _ in range(competitors)]
+    }
+
+def _brute_force_similarities(index: SituationIndex, query: np.ndarray, metric: str, k: int) -> List[float]:
+    vectors = index._features[:, :len(index)].T.astype(np.float64)
+    query = query.astype(np.float64)
+    if metric == "cosine":
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+        similarities = np.divide(vectors @ query, norms, out=np.zeros(len(index)), where=norms > 0)
+    else:
+        similarities = 1.0 / (1.0 + np.abs(vectors - query) @ index.weights.astype(np.float64))
+    return sorted(similarities.tolist(), reverse=True)[:k]
+
+def run_benchmark(size: int, queries: int = 200, k: int = 3, seed: int = 0) -> Dict:
+    rng = random.Random(seed)
+    index = SituationIndex()
+    start = time.perf_counter()
+    for _ in range(size):
+        index.add(synthetic_context(rng))
+    result = {"size": size, "add_us": (time.perf_counter() - start) / size * 1e6}
+
+    probes = [index.encoder.encode(synthetic_context(rng)) for _ in range(queries)]
+    for metric in METRICS:
+        timings = []
+        for probe in probes:
+            start = time.perf_counter()
+            index.query_vector(probe, k, metric)
+            timings.append(time.perf_counter() - start)
+        result[f"{metric}_median_ms"] = float(np.median(timings)) * 1000
+        result[f"{metric}_p95_ms"] = float(np.percentile(timings, 95)) * 1000
+        # Compare similarities rather than rows: float32 and float64 can order near-ties differently
+        exact = all(
+            np.allclose([similarity for _, similarity, _ in index.query_vector(probe, k, metric)],
+                        _brute_force_similarities(index, probe, metric, k), rtol=1e-4, atol=1e-5)
+            for probe in probes[:5]
+        )
+        result[f"{metric}_exact"] = bool(exact)
+    return result
+
+def format_results(results: List[Dict]) -> str:
+    lines = ["SITUATION INDEX BENCHMARK",
+             f"{'entries':>9} {'add us':>8} " + " ".join(f"{m + ' med ms':>14} {m + ' p95 ms':>14}" for m in METRICS) + "  exact"]
+    for result in results:
+        lines.append(
+            f"{result['size']:>9} {result['add_us']:>8.1f} "
+            + " ".join(f"{result[m + '_median_ms']:>14.3f} {result[m + '_p95_ms']:>14.3f}" for m in METRICS)
+            + "  " + ("yes" if all(result[m + "_exact"] for m in METRICS) else "NO")
+        )
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="SituationIndex query latency benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    results = [run_benchmark(size, args.queries, args.k, args.seed) for size in args.sizes]
+    print(format_results(results))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+"""
+Benchmark Suite - Micro-benchmarks for coordination hot paths with baseline comparison.
+
+Each benchmark runs against a warmed-up population of heuristic (LLM-free)
+agents at several sizes. Benchmarks that mutate the simulation get the state
+they mutate restored before every call, outside the timed region, and phases
+are timed in place inside consecutive full rounds of their own copy of the
+simulation, so every call sees a state a real run could produce. Results are written as JSON; passing a previous
+results file as --baseline reports the median-time ratio per benchmark and
+flags regressions beyond the threshold.
+
+Usage (from implementation/):
+    python -m benchmarks.suite --sizes 10 100 500 --output bench.json
+    python -m benchmarks.suite --baseline bench.json --fail-on-regression
+"""
+
+import argparse
+import copy
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+from agents.agent_behaviors import CoalitionFormationBehavior, CompetitiveBiddingBehavior, TrustBasedBehavior
+from agents.heuristic_agent import HeuristicProcessorAgent
+from coordination_framework.event_log import configure_event_logging
+from coordination_framework.peer_state import PeerStateTable
+from coordination_framework.shared_types import SystemState
+from coordination_framework.state_management import StateRepository
+from coordination_framework.system_coordinator import DistributedCoordinationSystem
+from coordination_framework.workflow_engine import CoordinationWorkflowEngine
+from scenarios.population import generate_processor_configs
+
+DEFAULT_SIZES = (10, 100, 500)
+PHASE_ORDER = ("initialization", "negotiation", "coalition", "bidding", "execution")
+
+class BenchmarkContext:
+    """
+    A coordination system warmed up by a few full rounds so histories,
+    observations and trust scores look like a running simulation.
+    """
+
+    def __init__(self, size: int, seed: int = 0, warmup_rounds: int = 3):
+        self.size = size
+        self.seed = seed
+        configs = generate_processor_configs(size, burst_range=(20, 40), seed=seed)
+        self.processors = [
+            HeuristicProcessorAgent(c["id"], c["burst_time"], c["strategy"], c["bias"])
+            for c in configs
+        ]
+        for processor in self.processors:
+            processor.state.execution_slots_used = 0
+        self.system = DistributedCoordinationSystem(self.processors, seed=seed)
+        self.state = self.system.system_state
+        self.phases = CoordinationWorkflowEngine(self.system).build_phase_functions()
+        for _ in range(warmup_rounds):
+            self.run_round()
+
+    def run_round(self):
+        for phase in PHASE_ORDER:
+            self.state = self.phases[phase](self.state)
+
+    def fork(self) -> "BenchmarkContext":
+        """Independent deep copy of the simulation (agents included) with its own phase functions"""
+        fork = copy.copy(self)
+        fork.system, fork.state = copy.deepcopy((self.system, self.state))
+        fork.processors = list(fork.system.processors.values())
+        fork.phases = CoordinationWorkflowEngine(fork.system).build_phase_functions()
+        return fork
+
+    def competition_info(self) -> Dict:
+        active = self.system._get_active_processors_only()
+        return {
+            "total_competitors": len(active),
+            "competitors": [
+                {
+                    "id": proc_id,
+                    "claimed_burst": proc.state.claimed_burst_time,
+                    "trust": proc.state.trust_score,
+                    "remaining": self.system._get_remaining_time(proc)
+                }
+                for proc_id, proc in active.items()
+            ]
+        }
+
+    def bidding_context(self, processor) -> Dict:
+        return {
+            "action": "calculate_bid",
+            "round_number": self.state.round_number,
+            "current_round": self.state.round_number,
+            "competitors": [
+                {
+                    "id": other.state.processor_id,
+                    "trust": other.state.trust_score,
+                    "remaining_time": self.system._get_remaining_time(other)
+                }
+                for other in self.processors if other is not processor
+            ]
+        }
+
+def _trust_restorer(system: DistributedCoordinationSystem) -> Callable[[], None]:
+    """Undo _update_trust_scores: trust scores, appended history, detector/engine state and allies' verdicts"""
+    saved = [(p.state, p.state.trust_score, len(p.state.reputation_history)) for p in system.processors.values()]
+    detectors = copy.deepcopy(system.pattern_detectors)
+    engine = copy.deepcopy(system.batch_trust_engine)
+    relationships = copy.deepcopy(system.relationship_store.__dict__)
+
+    def restore():
+        for state, trust, length in saved:
+            state.trust_score = trust
+            del state.reputation_history[length:]
+        system.pattern_detectors = copy.deepcopy(detectors)
+        system.batch_trust_engine = copy.deepcopy(engine)
+        system.relationship_store.__dict__.update(copy.deepcopy(relationships))
+    return restore
+
+def _coalition_restorer(system: DistributedCoordinationSystem) -> Callable[[], None]:
+    """
+    Undo _process_coalitions_strict: registry and relationship store contents
+    (keeping the objects views and memory managers hold) and the RNG
+    """
+    registry = copy.deepcopy(system.coalitions.__dict__)
+    relationships = copy.deepcopy(system.relationship_store.__dict__)
+    rng_state = system.rng.getstate()
+
+    def restore():
+        system.coalitions.__dict__.update(copy.deepcopy(registry))
+        system.relationship_store.__dict__.update(copy.deepcopy(relationships))
+        system.rng.setstate(rng_state)
+    return restore
+
+def _benchmarks(ctx: BenchmarkContext) -> Dict[str, Callable[[], object]]:
+    """
+    Name -> zero-argument callable, or (setup, callable) where setup runs
+    untimed before every call to restore the state the callable mutates
+    """
+    system = ctx.system
+    # The vectorised trust engine gets its own copy of the warmed-up agents
+    batched_ctx = ctx.fork()
+    batched_system = DistributedCoordinationSystem(batched_ctx.processors, trust_engine="batched", seed=ctx.seed)
+    sample = ctx.processors[0]
+    bid_context = ctx.bidding_context(sample)
+    bidding_behavior = CompetitiveBiddingBehavior(sample)
+    trust_behavior = TrustBasedBehavior(sample)
+    history = sample.state.reputation_history
+    competition = {"round_number": ctx.state.round_number, "competition_info": ctx.competition_info()}
+    repositories = {}
+    # A round's coalition proposals: every processor proposes to its successor
+    ids = [p.state.processor_id for p in ctx.processors]
+    formations = [
+        {"proposer": ids[i], "partners": [ids[(i + 1) % len(ids)]], "proposal": "benchmark", "round": 0}
+        for i in range(len(ids))
+    ]
+    coalition_state = SystemState(processors=ctx.state.processors, coalition_formations=formations)
+    partners = [proc_id for proc_id in ids if proc_id != sample.state.processor_id]
+    coalition_behavior = CoalitionFormationBehavior(sample)
+    peer_table = PeerStateTable(ids, system.coalitions)
+    peer_table.update((p.state.trust_score for p in ctx.processors), (system._get_remaining_time(p) for p in ctx.processors))
+
+    def rank_partners(table):
+        sample.peer_table = table
+        try:
+            return coalition_behavior._evaluate_potential_coalitions(partners)
+        finally:
+            sample.peer_table = None
+
+    def fresh_repositories():
+        repositories["full"] = StateRepository()
+        repositories["incremental"] = StateRepository(incremental=True)
+
+    return {
+        "calculate_enhanced_bids": lambda: system.calculate_enhanced_bids(competition),
+        "CompetitiveBiddingBehavior._calculate_optimal_bid": lambda: bidding_behavior._calculate_optimal_bid(bid_context),
+        "TrustBasedBehavior.detect_deceptive_pattern": lambda: trust_behavior.detect_deceptive_pattern(history),
+        "_update_trust_scores": (_trust_restorer(system), lambda: system._update_trust_scores(ctx.state)),
+        "_update_trust_scores[batched]": (_trust_restorer(batched_system),
+                                          lambda: batched_system._update_trust_scores(batched_ctx.state)),
+        # Re-observing an unchanged fleet writes the same values, so no restore is needed
+        "_update_processor_observations": lambda: system._update_processor_observations(ctx.state),
+        "_process_coalitions_strict": (_coalition_restorer(system), lambda: system._process_coalitions_strict(coalition_state)),
+        "CoalitionFormationBehavior._evaluate_potential_coalitions": lambda: rank_partners(None),
+        "CoalitionFormationBehavior._evaluate_potential_coalitions[batched]": lambda: rank_partners(peer_table),
+        "StateRepository.record_state_evolution": (
+            fresh_repositories, lambda: repositories["full"].record_state_evolution(ctx.state, system.processors)
+        ),
+        "StateRepository.record_state_evolution[incremental]": (
+            fresh_repositories, lambda: repositories["incremental"].record_state_evolution(ctx.state, system.processors, [])
+        )
+    }
+
+def _time_phases(ctx: BenchmarkContext, repeats: int, min_time: float, max_rounds_per_sample: int = 10) -> Dict[str, Dict]:
+    """
+    Per-phase timings from consecutive full rounds of a forked simulation:
+    each sample runs up to max_rounds_per_sample rounds (enough for min_time)
+    and averages every phase, check_termination included, over them.
+    """
+    fork = ctx.fork()
+    names = PHASE_ORDER + ("check_termination",)
+
+    def timed_round() -> Dict[str, float]:
+        times = {}
+        for phase in PHASE_ORDER:
+            start = time.perf_counter()
+            fork.state = fork.phases[phase](fork.state)
+            times[phase] = time.perf_counter() - start
+        start = time.perf_counter()
+        fork.phases["check_termination"](fork.state)
+        times["check_termination"] = time.perf_counter() - start
+        return times
+
+    first = sum(timed_round().values())
+    number = min(max_rounds_per_sample, max(1, int(min_time / first))) if first > 0 else max_rounds_per_sample
+    samples = {name: [] for name in names}
+    for _ in range(repeats):
+        totals = dict.fromkeys(names, 0.0)
+        for _ in range(number):
+            for name, elapsed in timed_round().items():
+                totals[name] += elapsed
+        for name in names:
+            samples[name].append(totals[name] / number)
+    return {f"phase.{name}": _summarize(samples[name], repeats, number) for name in names}
+
+def _summarize(samples: List[float], repeats: int, number: int) -> Dict[str, float]:
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "repeats": repeats,
+        "number": number
+    }
+
+def _time_calls(function: Callable[[], object], repeats: int, min_time: float,
+                setup: Optional[Callable[[], None]] = None) -> Dict[str, float]:
+    """
+    Time `repeats` samples; each sample loops until it has run for at least
+    min_time. setup, if given, runs before every call outside the timed region.
+    """
+    def timed_call() -> float:
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        return time.perf_counter() - start
+
+    single = timed_call()
+    number = max(1, int(min_time / single)) if single > 0 else 1000
+    samples = []
+    for _ in range(repeats):
+        if setup is None:
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            elapsed = time.perf_counter() - start
+        else:
+            elapsed = sum(timed_call() for _ in range(number))
+        samples.append(elapsed / number)
+    if setup is not None:
+        # Leave the state as the next benchmark expects to find it
+        setup()
+    return _summarize(samples, repeats, number)
+
+def run_suite(sizes: Sequence[int] = DEFAULT_SIZES, repeats: int = 5, min_time: float = 0.05,
+              seed: int = 0, only: Optional[List[str]] = None) -> Dict:
+    configure_event_logging(quiet=True)
+    results = {}
+    for size in sizes:
+        ctx = BenchmarkContext(size, seed=seed)
+        for name, entry in _benchmarks(ctx).items():
+            if only and not any(pattern in name for pattern in only):
+                continue
+            setup, function = entry if isinstance(entry, tuple) else (None, entry)
+            results[f"{name}[n={size}]"] = dict(_time_calls(function, repeats, min_time, setup), benchmark=name, size=size)
+        if not only or any(pattern in "phase." + phase for pattern in only
+                           for phase in PHASE_ORDER + ("check_termination",)):
+            for name, timing in _time_phases(ctx, repeats, min_time).items():
+                if only and not any(pattern in name for pattern in only):
+                    continue
+                results[f"{name}[n={size}]"] = dict(timing, benchmark=name, size=size)
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": list(sizes),
+            "repeats": repeats,
+            "seed": seed
+        },
+        "results": results
+    }
+
+def compare_to_baseline(current: Dict, baseline: Dict, threshold: float = 0.10) -> Dict[str, Dict]:
+    """Median-time ratio current/baseline per benchmark present in both runs"""
+    comparison = {}
+    for key, result in current["results"].items():
+        reference = baseline.get("results", {}).get(key)
+        if not reference or reference["median"] <= 0:
+            continue
+        ratio = result["median"] / reference["median"]
+        comparison[key] = {
+            "baseline_median": reference["median"],
+            "current_median": result["median"],
+            "ratio": ratio,
+            "status": "regression" if ratio > 1 + threshold else "improvement" if ratio < 1 - threshold else "unchanged"
+        }
+    return comparison
+
+def format_results(results: Dict, comparison: Optional[Dict] = None) -> str:
+    lines = [f"{'benchmark':<60} {'median':>12} {'stdev':>10}" + (f" {'vs base':>9}" if comparison else "")]
+    for key, result in results["results"].items():
+        line = f"{key:<60} {result['median'] * 1e6:>10.1f}us {result['stdev'] * 1e6:>8.1f}us"
+        if comparison and key in comparison:
+            entry = comparison[key]
+            marker = {"regression": " !", "improvement": " +", "unchanged": ""}[entry["status"]]
+            line += f" {entry['ratio']:>8.2f}x{marker}"
+        lines.append(line)
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for coordination hot paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="Minimum seconds per timing sample")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="+", help="Run benchmarks whose name contains any of these substrings")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", help="Compare against a previously written results file")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown counted as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.repeats, args.min_time, args.seed, args.only)
+    comparison = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            comparison = compare_to_baseline(results, json.load(f), args.threshold)
+        results["comparison"] = comparison
+    print(format_results(results, comparison))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    regressions = [key for key, entry in (comparison or {}).items() if entry["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        if args.fail_on_regression:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Synthetic Processors - LLM-free stand-ins for ProcessorLLMAgent used in benchmarks.
+"""
+
+import random
+from typing import List
+from coordination_framework.shared_types import ProcessorState
+
+STRATEGIES = ["cooperative", "aggressive", "strategic"]
+BIAS_LEVELS = [0.1, 0.7, 0.4]
+
+class SyntheticProcessor:
+    """
+    Minimal processor exposing the attributes the coordinator reads.
+    """
+
+    def __init__(self, processor_id: str, true_burst_time: int, strategy_type: str, bias_level: float, seed: int = 0):
+        self.state = ProcessorState(
+            processor_id=processor_id,
+            true_burst_time=true_burst_time,
+            strategy_type=strategy_type,
+            bias_level=bias_level
+        )
+        self.state.execution_slots_used = 0
+        self.rng = random.Random(f"{seed}:{processor_id}")
+
+    def _get_my_remaining_time(self) -> int:
+        return max(0, self.state.true_burst_time - self.state.execution_slots_used)
+
+    def claim_burst_time(self, system_context: dict = None) -> int:
+        """Bias-driven claim without LLM or logging"""
+        actual = self._get_my_remaining_time()
+        if self.state.bias_level <= 0.1:
+            claimed = actual
+        else:
+            claimed = max(1, int(actual * self.rng.uniform(1.0 - self.state.bias_level, 1.0)))
+        self.state.claimed_burst_time = claimed
+        return claimed
+
+    def update_observations(self, other_processor_behaviors: dict):
+        for proc_id, behavior in other_processor_behaviors.items():
+            if proc_id not in self.state.observed_opponents:
+                self.state.observed_opponents[proc_id] = {}
+            self.state.observed_opponents[proc_id].update(behavior)
+
+def build_synthetic_fleet(count: int, seed: int = 0) -> List[SyntheticProcessor]:
+    """Create `count` synthetic processors with the standard strategy/bias rotation"""
+    rng = random.Random(seed)
+    return [
+        SyntheticProcessor(
+            processor_id=f"P{i}",
+            true_burst_time=rng.randint(3, 12),
+            strategy_type=STRATEGIES[i % 3],
+            bias_level=BIAS_LEVELS[i % 3],
+            seed=seed
+        )
+        for i in range(count)
+    ]
@@ -0,0 +1,76 @@
+"""
+Trust Engine Benchmark - Scalar vs batched _update_trust_scores.
+
+Runs identical synthetic fleets through both trust paths, checks that every
+trust score is bit-identical, and reports the per-round speedup.
+
+Usage: python -m benchmarks.trust_engine_benchmark --processors 10000 --rounds 10
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import time
+from typing import Dict, List
+from benchmarks.synthetic import build_synthetic_fleet
+from coordination_framework.shared_types import SystemState
+from coordination_framework.system_coordinator import DistributedCoordinationSystem
+
+def _timed_trust_updates(system: DistributedCoordinationSystem, rounds: int, seed: int) -> List[float]:
+    rng = random.Random(seed)
+    state = SystemState(processors=[p.state for p in system.processors.values()])
+    timings = []
+    for round_number in range(rounds):
+        state.round_number = round_number
+        active = list(system._get_active_processors_only().values())
+        if not active:
+            break
+        for processor in active:
+            processor.claim_burst_time()
+        winner = rng.choice(active)
+        winner.state.execution_slots_used += 1
+        state.execution_order = [winner.state.processor_id]
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            system._update_trust_scores(state)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+def run_benchmark(processor_count: int, rounds: int, seed: int = 0) -> Dict[str, float]:
+    scalar_system = DistributedCoordinationSystem(build_synthetic_fleet(processor_count, seed))
+    batched_system = DistributedCoordinationSystem(build_synthetic_fleet(processor_count, seed), trust_engine="batched")
+
+    scalar_times = _timed_trust_updates(scalar_system, rounds, seed)
+    batched_times = _timed_trust_updates(batched_system, rounds, seed)
+
+    mismatches = sum(
+        1 for proc_id, processor in scalar_system.processors.items()
+        if processor.state.trust_score != batched_system.processors[proc_id].state.trust_score
+    )
+    scalar_avg = sum(scalar_times) / len(scalar_times)
+    batched_avg = sum(batched_times) / len(batched_times)
+    return {
+        "processors": processor_count,
+        "rounds": len(scalar_times),
+        "scalar_ms_per_round": scalar_avg * 1000,
+        "batched_ms_per_round": batched_avg * 1000,
+        "speedup": scalar_avg / batched_avg if batched_avg > 0 else float("inf"),
+        "trust_mismatches": mismatches
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs batched trust updates")
+    parser.add_argument("--processors", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'Processors':>10} {'Scalar ms':>10} {'Batched ms':>11} {'Speedup':>8} {'Mismatches':>11}")
+    for count in args.processors:
+        result = run_benchmark(count, args.rounds, args.seed)
+        print(f"{result['processors']:>10} {result['scalar_ms_per_round']:>10.2f} "
+              f"{result['batched_ms_per_round']:>11.2f} {result['speedup']:>7.1f}x {result['trust_mismatches']:>11}")
+
+if __name__ == "__main__":
+    main()
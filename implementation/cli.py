@@ -0,0 +1,315 @@
+"""
+Batch CLI - Headless entry point for running scenarios from names or config files.
+
+Every scenario argument is either a registered scenario name (see
+STANDARD_SCENARIOS) or a .json/.toml scenario file. Each scenario runs once
+per seed through a worker pool whose processes import the dependencies once
+and are reused for every run. Results are machine-readable: one JSON file per
+run plus results.json in the output directory, and --json prints the summary
+to stdout.
+
+Usage (from implementation/):
+    python cli.py standard trust_crisis --replications 10 --engine heuristic --workers 4
+    python cli.py scenarios/*.toml --seeds 1 2 3 --output-dir runs/ --json
+"""
+
+import argparse
+import functools
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from contextlib import redirect_stdout, redirect_stderr
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from main import load_environment
+from coordination_framework.event_log import LEVELS, configure_event_logging
+
+ENGINES = ("llm", "heuristic")
+TRUST_ENGINES = ("scalar", "batched")
+AUCTIONS = ("flat", "hierarchical")
+SHARD_STRATEGIES = ("hash", "coalition")
+
+def _agent_class(engine: str):
+    if engine == "heuristic":
+        from agents.heuristic_agent import HeuristicProcessorAgent
+        return HeuristicProcessorAgent
+    from agents.processor_agent import ProcessorLLMAgent
+    return ProcessorLLMAgent
+
+def resolve_scenarios(specs: List[str]) -> List[Tuple[str, Any, Dict[str, Any]]]:
+    """(key, scenario, run settings) for each name or file, in argument order"""
+    from scenarios.resource_contention_scenario import STANDARD_SCENARIO_FACTORIES
+    from scenarios.scenario_files import load_scenario_file
+
+    resolved = []
+    keys = set()
+    for spec in specs:
+        if spec in STANDARD_SCENARIO_FACTORIES:
+            key, scenario, settings = spec, STANDARD_SCENARIO_FACTORIES[spec](), {}
+        elif os.path.isfile(spec):
+            scenario, settings = load_scenario_file(spec)
+            key = os.path.splitext(os.path.basename(spec))[0]
+        else:
+            raise ValueError(f"'{spec}' is neither a registered scenario ({', '.join(STANDARD_SCENARIO_FACTORIES)}) nor a file")
+        # Same file name in different directories must not overwrite each other's output
+        base, suffix = key, 2
+        while key in keys:
+            key, suffix = f"{base}_{suffix}", suffix + 1
+        keys.add(key)
+        resolved.append((key, scenario, settings))
+    return resolved
+
+def replication_seeds(base_seed: int, replications: int) -> List[int]:
+    """The seeds ScenarioRunner.run_replications would use; a single run uses base_seed itself"""
+    if replications == 1:
+        return [base_seed]
+    return [int(seed) for seed in np.random.SeedSequence(base_seed).generate_state(replications, dtype=np.uint64)]
+
+def preload_dependencies(engine: str):
+    """
+    Import what every run needs up front. Called before the pool starts so
+    forked workers inherit the loaded modules; spawned workers repeat it once
+    in their initializer rather than once per run.
+    """
+    import langgraph.graph  # noqa: F401
+    import coordination_framework.system_coordinator  # noqa: F401
+    import scenarios.parameter_sweep  # noqa: F401
+    if engine == "llm":
+        import langchain_core.messages  # noqa: F401
+        import langchain_openai  # noqa: F401
+
+def _init_worker(log_level: str, engine: str):
+    configure_event_logging(level=log_level)
+    preload_dependencies(engine)
+
+def run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one (scenario, seed) job and return a JSON-serialisable record plus captured output"""
+    from coordination_framework.scheduling import SchedulingConfig
+    from coordination_framework.system_coordinator import DistributedCoordinationSystem
+    from scenarios.parameter_sweep import summarize_run
+    from scenarios.resource_contention_scenario import ScenarioRunner
+
+    scenario = job["scenario"]
+    scenario.agent_class = _agent_class(job["engine"])
+    output = io.StringIO()
+    start = time.perf_counter()
+    try:
+        # A run setting the file and command line only reject in combination is this run's error, not the batch's
+        system_class = functools.partial(
+            DistributedCoordinationSystem,
+            trust_engine=job["trust_engine"],
+            max_rounds=job["max_rounds"],
+            scheduling=SchedulingConfig(
+                slots_per_round=job["slots_per_round"],
+                cores=job["cores"],
+                adaptive_quantum=job["adaptive_quantum"],
+                max_quantum=job["max_quantum"],
+                auction=job["auction"],
+                shard_size=job["shard_size"],
+                shard_by=job["shard_by"]
+            )
+        )
+        with redirect_stdout(output), redirect_stderr(output):
+            runner = ScenarioRunner()
+            runner.register_scenario(job["scenario_key"], scenario)
+            result = runner.run_scenario(job["scenario_key"], system_class, seed=job["seed"])
+    except Exception as e:
+        result = {"scenario_name": job["scenario_key"], "error": f"{type(e).__name__}: {e}", "success": False}
+    record = {
+        "run_id": job["run_id"],
+        "scenario": job["scenario_key"],
+        "scenario_name": scenario.config.name,
+        "seed": job["seed"],
+        "engine": job["engine"],
+        "trust_engine": job["trust_engine"],
+        "max_rounds": job["max_rounds"],
+        "slots_per_round": job["slots_per_round"],
+        "cores": job["cores"],
+        "adaptive_quantum": job["adaptive_quantum"],
+        "max_quantum": job["max_quantum"],
+        "auction": job["auction"],
+        "shard_size": job["shard_size"],
+        "shard_by": job["shard_by"],
+        "wall_time": time.perf_counter() - start,
+        "llm_calls": sum(getattr(processor, "llm_calls", 0) for processor in scenario.processors),
+        "criteria": {
+            criterion: {key: entry[key] for key in ("threshold", "actual", "met")}
+            for criterion, entry in result.get("evaluation", {}).get("success_criteria_met", {}).items()
+        },
+        **summarize_run(result)
+    }
+    return {"record": record, "output": output.getvalue()}
+
+def _build_jobs(scenarios, seeds: List[int], engine: str, trust_engine: str, max_rounds: int,
+                slots_per_round: int = 1, cores: int = 1, adaptive_quantum: bool = False,
+                max_quantum: int = 16, auction: str = "flat", shard_size: int = 64,
+                shard_by: str = "hash") -> List[Dict[str, Any]]:
+    jobs = []
+    for key, scenario, settings in scenarios:
+        for seed in seeds:
+            jobs.append({
+                "run_id": f"{key}-{seed}",
+                "scenario_key": key,
+                "scenario": scenario,
+                "seed": seed,
+                "engine": engine,
+                "trust_engine": settings.get("trust_engine", trust_engine),
+                "max_rounds": int(settings.get("max_rounds", max_rounds)),
+                "slots_per_round": int(settings.get("slots_per_round", slots_per_round)),
+                "cores": int(settings.get("cores", cores)),
+                "adaptive_quantum": bool(settings.get("adaptive_quantum", adaptive_quantum)),
+                "max_quantum": int(settings.get("max_quantum", max_quantum)),
+                "auction": settings.get("auction", auction),
+                "shard_size": int(settings.get("shard_size", shard_size)),
+                "shard_by": settings.get("shard_by", shard_by)
+            })
+    return jobs
+
+def run_batch(jobs: List[Dict[str, Any]], workers: int, log_level: str, output_dir: Optional[str] = None):
+    """Yield each finished job's record; workers <= 1 runs in this process"""
+    if output_dir:
+        os.makedirs(os.path.join(output_dir, "runs"), exist_ok=True)
+        os.makedirs(os.path.join(output_dir, "logs"), exist_ok=True)
+
+    def finished(payload):
+        record = payload["record"]
+        if output_dir:
+            with open(os.path.join(output_dir, "runs", f"{record['run_id']}.json"), "w", encoding="utf-8") as f:
+                json.dump(record, f, indent=2, allow_nan=False)
+            with open(os.path.join(output_dir, "logs", f"{record['run_id']}.log"), "w", encoding="utf-8") as f:
+                f.write(payload["output"])
+        return record
+
+    engine = jobs[0]["engine"] if jobs else "heuristic"
+    _init_worker(log_level, engine)
+    if workers <= 1:
+        for job in jobs:
+            yield finished(run_job(job))
+        return
+    with multiprocessing.Pool(processes=min(workers, len(jobs)), initializer=_init_worker,
+                              initargs=(log_level, engine)) as pool:
+        for payload in pool.imap_unordered(run_job, jobs):
+            yield finished(payload)
+
+def summarize_batch(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    from scenarios.resource_contention_scenario import _metric_statistics
+
+    by_scenario: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        by_scenario.setdefault(record["scenario"], []).append(record)
+    scenarios = {}
+    for key, runs in by_scenario.items():
+        runs.sort(key=lambda record: record["seed"])
+        completed = [record for record in runs if not record["error"]]
+        metrics = {}
+        for name in ("rounds", "coordination_effectiveness", "completion_fraction", "wall_time"):
+            values = [record[name] for record in completed if record[name] is not None]
+            if values:
+                metrics[name] = _metric_statistics(values)
+        for criterion in (completed[0]["criteria"] if completed else {}):
+            values = [record["criteria"][criterion]["actual"] for record in completed
+                      if record["criteria"].get(criterion, {}).get("actual") is not None]
+            if values:
+                metrics[criterion] = _metric_statistics(values)
+        scenarios[key] = {
+            "runs": len(runs),
+            "errors": len(runs) - len(completed),
+            "success_rate": sum(1 for record in runs if record["success"]) / len(runs),
+            "seeds": [record["seed"] for record in runs],
+            "metrics": metrics
+        }
+    return {"scenarios": scenarios, "runs": len(records), "errors": sum(1 for record in records if record["error"])}
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run coordination scenarios headlessly")
+    parser.add_argument("scenarios", nargs="+", help="Registered scenario names or .json/.toml scenario files")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed for replications")
+    parser.add_argument("--seeds", type=int, nargs="+", help="Explicit seeds (overrides --seed/--replications)")
+    parser.add_argument("--replications", type=int, default=1)
+    parser.add_argument("--engine", choices=ENGINES, default="llm", help="Agent engine: LLM-backed or heuristic")
+    parser.add_argument("--trust-engine", choices=TRUST_ENGINES, default="scalar")
+    parser.add_argument("--max-rounds", type=int, default=50, help="Maximum time slots per run")
+    parser.add_argument("--slots-per-round", type=int, default=1,
+                        help="Time slots allocated by each auction (fewer agent decisions per executed slot)")
+    parser.add_argument("--adaptive-quantum", action="store_true",
+                        help="Double the auction quantum while winners and bids stay stable")
+    parser.add_argument("--max-quantum", type=int, default=16, help="Upper bound for --adaptive-quantum")
+    parser.add_argument("--cores", type=int, default=1, help="Identical execution units per time slot")
+    parser.add_argument("--auction", choices=AUCTIONS, default="flat",
+                        help="Flat auction, or per-shard auctions followed by a final among shard winners")
+    parser.add_argument("--shard-size", type=int, default=64, help="Target processors per shard (hierarchical)")
+    parser.add_argument("--shard-by", choices=SHARD_STRATEGIES, default="hash", help="Shard by id hash or by coalition")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (1 runs in-process)")
+    parser.add_argument("--output-dir", help="Write runs/<run>.json, logs/<run>.log and results.json here")
+    parser.add_argument("--log-level", choices=sorted(LEVELS, key=LEVELS.get), default="info")
+    parser.add_argument("--env-file", help="dotenv file with API keys (default: search from the working directory)")
+    parser.add_argument("--json", action="store_true", help="Print the results summary as JSON")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.replications < 1:
+        raise SystemExit("--replications must be at least 1")
+    if args.slots_per_round < 1:
+        raise SystemExit("--slots-per-round must be at least 1")
+    if args.cores < 1:
+        raise SystemExit("--cores must be at least 1")
+    if args.adaptive_quantum and args.max_quantum < args.slots_per_round:
+        raise SystemExit("--max-quantum must be at least --slots-per-round")
+    if args.shard_size < 1:
+        raise SystemExit("--shard-size must be at least 1")
+    load_environment(args.env_file)
+    configure_event_logging(level=args.log_level)
+
+    try:
+        scenarios = resolve_scenarios(args.scenarios)
+    except (ValueError, OSError, RuntimeError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    seeds = args.seeds or replication_seeds(args.seed, args.replications)
+    jobs = _build_jobs(scenarios, seeds, args.engine, args.trust_engine, args.max_rounds,
+                       args.slots_per_round, args.cores, args.adaptive_quantum, args.max_quantum,
+                       args.auction, args.shard_size, args.shard_by)
+
+    records = []
+    for record in run_batch(jobs, args.workers, args.log_level, args.output_dir):
+        records.append(record)
+        if not args.json:
+            status = f"error: {record['error']}" if record["error"] else \
+                f"{'success' if record['success'] else 'criteria not met'}, {record['rounds']} rounds"
+            print(f"[{len(records)}/{len(jobs)}] {record['run_id']}: {status} ({record['wall_time']:.2f}s)", flush=True)
+
+    results = {
+        "config": {
+            "scenarios": [key for key, _, _ in scenarios],
+            "seeds": seeds,
+            "engine": args.engine,
+            "trust_engine": args.trust_engine,
+            "max_rounds": args.max_rounds,
+            "slots_per_round": args.slots_per_round,
+            "cores": args.cores,
+            "adaptive_quantum": args.adaptive_quantum,
+            "max_quantum": args.max_quantum,
+            "auction": args.auction,
+            "shard_size": args.shard_size,
+            "shard_by": args.shard_by,
+            "workers": args.workers
+        },
+        "summary": summarize_batch(records),
+        "runs": sorted(records, key=lambda record: (record["scenario"], record["seed"]))
+    }
+    if args.output_dir:
+        with open(os.path.join(args.output_dir, "results.json"), "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, allow_nan=False)
+    if args.json:
+        json.dump(results, sys.stdout, indent=2, allow_nan=False)
+        print()
+    return 1 if results["summary"]["errors"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,6 @@ autonomous agents to coordinate without central control through emergent
 trust-based mechanisms.
 """
 
-# from coordination_framework.system_coordinator import DistributedCoordinationSystem
 
 from coordination_framework.state_management import (
     ProcessorState, 
@@ -19,6 +18,31 @@ from coordination_framework.state_management import (
     StateRepository
 )
 from coordination_framework.workflow_engine import CoordinationWorkflowEngine, WorkflowMetrics
+from coordination_framework.state_backends import (
+    StateHistoryBackend,
+    InMemoryStateBackend,
+    JSONLStateBackend,
+    SQLiteStateBackend,
+    create_state_backend
+)
+from coordination_framework.incremental_metrics import IncrementalStateAggregator, StreamingVocabulary, HyperLogLog
+from coordination_framework.trust_engine import BatchTrustEngine, compute_trust_batch
+from coordination_framework.relationship_store import RelationshipStore, RelationshipView
+from coordination_framework.ranking import top_k_indices
+from coordination_framework.coalition_registry import CoalitionRegistry, CoalitionMembersView
+from coordination_framework.peer_state import PeerStateTable
+from coordination_framework.scheduling import QuantumController, SchedulingConfig, allocate_slots
+from coordination_framework.sharding import ShardMap
+from coordination_framework.event_log import (
+    EventLogger,
+    ConsoleSink,
+    JSONLSink,
+    get_event_logger,
+    configure_event_logging
+)
+from coordination_framework.tracing import ChromeTracer, NullTracer, get_tracer, set_tracer, tracing
+from coordination_framework.profiling import PhaseProfiler, get_phase_profiler, set_phase_profiler
+from coordination_framework.memory_tracking import MemoryTracker, deep_sizeof, get_memory_tracker, set_memory_tracker
 
 __version__ = "1.0.0"
 __author__ = "Deepali Jain - Tech9 Assessment"
@@ -36,12 +60,74 @@ __all__ = [
     "StateLogger",
     "StateMetrics", 
     "StateRepository",
+    "StateHistoryBackend",
+    "InMemoryStateBackend",
+    "JSONLStateBackend",
+    "SQLiteStateBackend",
+    "create_state_backend",
+    "IncrementalStateAggregator",
+    "StreamingVocabulary",
+    "HyperLogLog",
     
     # Workflow engine
     "CoordinationWorkflowEngine",
-    "WorkflowMetrics"
+    "WorkflowMetrics",
+
+    # Batched trust updates
+    "BatchTrustEngine",
+    "compute_trust_batch",
+
+    # Shared pairwise relationships
+    "RelationshipStore",
+    "RelationshipView",
+    "top_k_indices",
+
+    # Coalition membership
+    "CoalitionRegistry",
+    "CoalitionMembersView",
+    "PeerStateTable",
+
+    # Slot allocation
+    "QuantumController",
+    "SchedulingConfig",
+    "allocate_slots",
+    "ShardMap",
+
+    # Event logging
+    "EventLogger",
+    "ConsoleSink",
+    "JSONLSink",
+    "get_event_logger",
+    "configure_event_logging",
+
+    # Chrome trace / Perfetto export
+    "ChromeTracer",
+    "NullTracer",
+    "get_tracer",
+    "set_tracer",
+    "tracing",
+
+    # Per-phase profiling
+    "PhaseProfiler",
+    "get_phase_profiler",
+    "set_phase_profiler",
+
+    # Per-round memory accounting
+    "MemoryTracker",
+    "deep_sizeof",
+    "get_memory_tracker",
+    "set_memory_tracker"
 ]
 
+def __getattr__(name: str):
+    # The coordinator imports the agents package, which imports this one; resolving it
+    # on first access avoids the cycle and keeps `import coordination_framework` light
+    if name == "DistributedCoordinationSystem":
+        from coordination_framework.system_coordinator import DistributedCoordinationSystem
+        globals()[name] = DistributedCoordinationSystem
+        return DistributedCoordinationSystem
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Package metadata
 COORDINATION_PRINCIPLES = [
     "Emergent coordination through trust-based reputation",
@@ -0,0 +1,202 @@
+"""
+Coalition Registry - Coordinator-owned coalition structure on a disjoint-set forest.
+
+Each processor starts as a singleton; forming a coalition unions the proposer
+with its accepted partners, so memberships are symmetric and duplicate-free
+by construction. Find uses path halving and union goes by size, making "are
+A and B allied" O(α(n)); each root also keeps its member list (merged
+small-into-large), so "members of A's coalition" is a view, not a scan.
+
+A coalition keeps its id while it grows: a merge keeps the id of the larger
+side. Dissolving a coalition or removing one member costs O(size).
+"""
+
+from collections.abc import Sequence
+from typing import Dict, Iterable, Iterator, List, Optional
+
+class CoalitionRegistry:
+    """
+    Disjoint-set coalition membership keyed by processor id. Processors are
+    registered on first use; a processor alone is not in a coalition.
+    """
+
+    def __init__(self, member_ids: Iterable[str] = ()):
+        self._index: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._parent: List[int] = []
+        self._size: List[int] = []
+        self._members: Dict[int, List[int]] = {}
+        self._coalition_of_root: Dict[int, int] = {}
+        self._root_of_coalition: Dict[int, int] = {}
+        self._next_coalition_id = 0
+        # Bumped on every membership change so derived caches know when to refresh
+        self.version = 0
+        for member_id in member_ids:
+            self.add(member_id)
+
+    def __contains__(self, member_id: str) -> bool:
+        return member_id in self._index
+
+    def __len__(self) -> int:
+        """Number of coalitions (two or more members)"""
+        return len(self._root_of_coalition)
+
+    def add(self, member_id: str) -> int:
+        index = self._index.get(member_id)
+        if index is None:
+            index = len(self._ids)
+            self._index[member_id] = index
+            self._ids.append(member_id)
+            self._parent.append(index)
+            self._size.append(1)
+        return index
+
+    def _find(self, index: int) -> int:
+        parent = self._parent
+        while parent[index] != index:
+            # Path halving: point every other node on the path at its grandparent
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def _root(self, member_id: str) -> Optional[int]:
+        index = self._index.get(member_id)
+        return None if index is None else self._find(index)
+
+    def _union(self, a: int, b: int) -> int:
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a == root_b:
+            return root_a
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.version += 1
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
+        members = self._members.setdefault(root_a, [root_a])
+        members.extend(self._members.pop(root_b, [root_b]))
+        absorbed_id = self._coalition_of_root.pop(root_b, None)
+        if absorbed_id is not None:
+            del self._root_of_coalition[absorbed_id]
+        if root_a not in self._coalition_of_root:
+            coalition_id = absorbed_id if absorbed_id is not None else self._new_coalition_id()
+            self._coalition_of_root[root_a] = coalition_id
+            self._root_of_coalition[coalition_id] = root_a
+        return root_a
+
+    def _new_coalition_id(self) -> int:
+        coalition_id = self._next_coalition_id
+        self._next_coalition_id += 1
+        return coalition_id
+
+    def form(self, proposer: str, partners: Iterable[str]) -> Optional[int]:
+        """Merge the proposer's coalition with each partner's; returns the resulting coalition id"""
+        root = self.add(proposer)
+        for partner in partners:
+            root = self._union(root, self.add(partner))
+        return self._coalition_of_root.get(self._find(root))
+
+    def coalition_id(self, member_id: str) -> Optional[int]:
+        root = self._root(member_id)
+        return None if root is None else self._coalition_of_root.get(root)
+
+    def allied(self, a: str, b: str) -> bool:
+        if a == b:
+            return False
+        root_a, root_b = self._root(a), self._root(b)
+        return root_a is not None and root_a == root_b
+
+    def size(self, member_id: str) -> int:
+        """Size of the member's coalition, counting the member (1 when alone)"""
+        root = self._root(member_id)
+        return 0 if root is None else self._size[root]
+
+    def members(self, member_id: str) -> List[str]:
+        """All members of the member's coalition, including it, in joining order"""
+        root = self._root(member_id)
+        if root is None:
+            return []
+        return [self._ids[index] for index in self._members.get(root, [root])]
+
+    def coalition_members(self, coalition_id: int) -> List[str]:
+        root = self._root_of_coalition.get(coalition_id)
+        if root is None:
+            raise KeyError(f"No coalition with id {coalition_id}")
+        return [self._ids[index] for index in self._members[root]]
+
+    def coalitions(self) -> Dict[int, List[str]]:
+        return {coalition_id: self.coalition_members(coalition_id) for coalition_id in sorted(self._root_of_coalition)}
+
+    def _dissolve_root(self, root: int) -> List[int]:
+        self.version += 1
+        coalition_id = self._coalition_of_root.pop(root)
+        del self._root_of_coalition[coalition_id]
+        members = self._members.pop(root)
+        for index in members:
+            self._parent[index] = index
+            self._size[index] = 1
+        return members
+
+    def dissolve(self, coalition_id: int) -> List[str]:
+        """Return every member of the coalition to a singleton; returns the former members"""
+        root = self._root_of_coalition.get(coalition_id)
+        if root is None:
+            raise KeyError(f"No coalition with id {coalition_id}")
+        return [self._ids[index] for index in self._dissolve_root(root)]
+
+    def leave(self, member_id: str):
+        """Remove one member from its coalition; the rest keep the coalition id if two or more remain"""
+        root = self._root(member_id)
+        if root is None or self._size[root] == 1:
+            return
+        coalition_id = self._coalition_of_root[root]
+        leaving = self._index[member_id]
+        remaining = [index for index in self._dissolve_root(root) if index != leaving]
+        if len(remaining) < 2:
+            return
+        new_root = remaining[0]
+        for index in remaining[1:]:
+            self._parent[index] = new_root
+        self._size[new_root] = len(remaining)
+        self._members[new_root] = remaining
+        self._coalition_of_root[new_root] = coalition_id
+        self._root_of_coalition[coalition_id] = new_root
+
+    def view(self, member_id: str) -> "CoalitionMembersView":
+        self.add(member_id)
+        return CoalitionMembersView(self, member_id)
+
+class CoalitionMembersView(Sequence):
+    """
+    Read-only, always-current list of a processor's coalition partners
+    (excluding itself). len() and `in` are O(α(n)); iteration is O(size).
+    """
+
+    __slots__ = ("_registry", "_member_id")
+
+    def __init__(self, registry: CoalitionRegistry, member_id: str):
+        self._registry = registry
+        self._member_id = member_id
+
+    def __len__(self) -> int:
+        return max(0, self._registry.size(self._member_id) - 1)
+
+    def __contains__(self, partner_id) -> bool:
+        return self._registry.allied(self._member_id, partner_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return (member for member in self._registry.members(self._member_id) if member != self._member_id)
+
+    def __getitem__(self, position):
+        return list(self)[position]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (CoalitionMembersView, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    @property
+    def coalition_id(self) -> Optional[int]:
+        return self._registry.coalition_id(self._member_id)
@@ -0,0 +1,217 @@
+"""
+Event Log - Structured, leveled event logging for coordination hot paths.
+
+Every coordination event carries a level, a subsystem, an event name and raw
+fields. Sinks decide how to render them: ConsoleSink reproduces the familiar
+human-readable output, JSONLSink writes machine-readable lines from a
+background thread. Disabled events cost a single enabled() check.
+"""
+
+import json
+import queue
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+
+SUBSYSTEMS = (
+    "agent",
+    "workflow",
+    "negotiation",
+    "coalition",
+    "bidding",
+    "execution",
+    "trust",
+    "termination",
+    "state"
+)
+
+def parse_level(level) -> int:
+    if isinstance(level, int):
+        return level
+    try:
+        return LEVELS[level.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown log level '{level}'")
+
+class ConsoleFormatter:
+    """
+    Renders an event's message template with its fields, giving the same text
+    the coordinator used to print directly.
+    """
+
+    def format(self, event: Dict[str, Any]) -> str:
+        template = event.get("message") or event["event"]
+        fields = event.get("fields") or {}
+        return template.format(**fields) if fields else template
+
+class ConsoleSink:
+    """Synchronous stdout sink so console output keeps its ordering"""
+
+    def __init__(self, formatter: Optional[ConsoleFormatter] = None, stream=None):
+        self.formatter = formatter or ConsoleFormatter()
+        self.stream = stream
+
+    def write(self, event: Dict[str, Any]):
+        print(self.formatter.format(event), file=self.stream or sys.stdout)
+
+    def flush(self):
+        (self.stream or sys.stdout).flush()
+
+    def close(self):
+        self.flush()
+
+class JSONLSink:
+    """
+    Buffered asynchronous JSON Lines sink. Events are queued and written in
+    batches by a daemon thread; flush() blocks until the queue is drained.
+    """
+
+    def __init__(self, path: str, batch_size: int = 512, flush_interval: float = 0.5):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue" = queue.Queue()
+        self._file = open(path, "a", encoding="utf-8")
+        self._closed = False
+        self._thread = threading.Thread(target=self._drain, name="jsonl-event-sink", daemon=True)
+        self._thread.start()
+
+    def write(self, event: Dict[str, Any]):
+        self._queue.put(event)
+
+    def _drain(self):
+        while True:
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=self.flush_interval))
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            lines = []
+            for event in batch:
+                if event is None:
+                    stop = True
+                else:
+                    lines.append(json.dumps(event, default=str))
+            if lines:
+                self._file.write("\n".join(lines) + "\n")
+                self._file.flush()
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self):
+        if not self._closed:
+            self._queue.join()
+
+    def close(self):
+        if self._closed:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+        self._closed = True
+
+class EventLogger:
+    """
+    Leveled logger with per-subsystem filtering. quiet=True disables every
+    event (benchmark mode); hot paths should guard expensive field
+    construction with enabled().
+    """
+
+    def __init__(self, level="debug", subsystems: Optional[Iterable[str]] = None,
+                 quiet: bool = False, sinks: Optional[List] = None):
+        self.sinks = sinks if sinks is not None else [ConsoleSink()]
+        self.configure(level=level, subsystems=subsystems, quiet=quiet)
+
+    def configure(self, level=None, subsystems: Optional[Iterable[str]] = None, quiet: Optional[bool] = None):
+        if level is not None:
+            self.level = parse_level(level)
+        if subsystems is not None:
+            self.subsystems = frozenset(subsystems) or None
+        elif not hasattr(self, "subsystems"):
+            self.subsystems = None
+        if quiet is not None:
+            self.quiet = quiet
+        # Single threshold checked first: anything below it is dropped immediately
+        self._threshold = float("inf") if self.quiet or not self.sinks else self.level
+
+    def enabled(self, level: int, subsystem: str) -> bool:
+        return level >= self._threshold and (self.subsystems is None or subsystem in self.subsystems)
+
+    def log(self, level: int, subsystem: str, event: str, message: str = "", /, **fields):
+        if level < self._threshold or (self.subsystems is not None and subsystem not in self.subsystems):
+            return
+        record = {
+            "ts": time.time(),
+            "level": LEVEL_NAMES.get(level, str(level)),
+            "subsystem": subsystem,
+            "event": event,
+            "message": message,
+            "fields": fields
+        }
+        for sink in self.sinks:
+            sink.write(record)
+
+    def debug(self, subsystem: str, event: str, message: str = "", /, **fields):
+        self.log(DEBUG, subsystem, event, message, **fields)
+
+    def info(self, subsystem: str, event: str, message: str = "", /, **fields):
+        self.log(INFO, subsystem, event, message, **fields)
+
+    def warning(self, subsystem: str, event: str, message: str = "", /, **fields):
+        self.log(WARNING, subsystem, event, message, **fields)
+
+    def error(self, subsystem: str, event: str, message: str = "", /, **fields):
+        self.log(ERROR, subsystem, event, message, **fields)
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+        self.configure()
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+_event_logger = EventLogger()
+
+def get_event_logger() -> EventLogger:
+    """Process-wide logger used by agents, coordinator and workflow"""
+    return _event_logger
+
+def configure_event_logging(level="debug", subsystems: Optional[Iterable[str]] = None, quiet: bool = False,
+                            jsonl_path: Optional[str] = None, console: bool = True) -> EventLogger:
+    """
+    Replace the sinks and filters of the process-wide logger. The console sink
+    is the human-readable formatter; jsonl_path adds the async JSONL sink.
+    """
+    logger = get_event_logger()
+    logger.close()
+    sinks = []
+    if console:
+        sinks.append(ConsoleSink())
+    if jsonl_path:
+        sinks.append(JSONLSink(jsonl_path))
+    logger.sinks = sinks
+    logger.subsystems = None
+    logger.configure(level=level, subsystems=subsystems, quiet=quiet)
+    return logger
@@ -0,0 +1,368 @@
+"""
+Incremental Metrics - Delta-updated aggregators for per-round state recording.
+
+Maintains the quantities behind StateRepository.record_state_evolution (trust
+distribution, coalition patterns, execution efficiency, coordination
+effectiveness, emergence indicators) from per-round changes, so recording costs
+roughly O(changes) instead of rescanning every processor, formation and message.
+"""
+
+import hashlib
+import heapq
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from coordination_framework.shared_types import ProcessorState, SystemState
+
+class RunningStats:
+    """
+    Welford mean/variance with value replacement, plus running min/max backed
+    by lazily-pruned heaps so removals stay O(log n).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._live: Dict[Any, float] = {}
+        self._min_heap: List = []
+        self._max_heap: List = []
+        self._removals_since_resync = 0
+
+    def set(self, key: Any, value: float):
+        """Insert or replace the value tracked for `key`"""
+        old = self._live.get(key)
+        if old is not None:
+            if old == value:
+                return
+            del self._live[key]
+            self._remove_value(old)
+        self._live[key] = value
+        self._add_value(value)
+        heapq.heappush(self._min_heap, (value, key))
+        heapq.heappush(self._max_heap, (-value, key))
+
+    def discard(self, key: Any):
+        old = self._live.pop(key, None)
+        if old is not None:
+            self._remove_value(old)
+
+    def _add_value(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def _remove_value(self, value: float):
+        if self.count <= 1:
+            self.count, self.mean, self._m2 = 0, 0.0, 0.0
+            return
+        delta = value - self.mean
+        self.mean = (self.mean * self.count - value) / (self.count - 1)
+        self._m2 -= delta * (value - self.mean)
+        self.count -= 1
+        self._removals_since_resync += 1
+        if self._removals_since_resync > max(64, self.count):
+            self._resync()
+
+    def _resync(self):
+        """Recompute exactly from live values; amortised O(1) per removal"""
+        values = list(self._live.values())
+        self.count = len(values)
+        self.mean = sum(values) / self.count if values else 0.0
+        self._m2 = sum((v - self.mean) ** 2 for v in values)
+        self._removals_since_resync = 0
+        self._min_heap = [(v, k) for k, v in self._live.items()]
+        self._max_heap = [(-v, k) for k, v in self._live.items()]
+        heapq.heapify(self._min_heap)
+        heapq.heapify(self._max_heap)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance, matching StateAnalytics._calculate_std"""
+        if self.count <= 1:
+            return 0.0
+        return max(0.0, self._m2 / (self.count - 1))
+
+    @property
+    def std(self) -> float:
+        return self.variance ** 0.5
+
+    @property
+    def min(self) -> float:
+        while self._min_heap and self._live.get(self._min_heap[0][1]) != self._min_heap[0][0]:
+            heapq.heappop(self._min_heap)
+        return self._min_heap[0][0] if self._min_heap else 0.0
+
+    @property
+    def max(self) -> float:
+        while self._max_heap and self._live.get(self._max_heap[0][1]) != -self._max_heap[0][0]:
+            heapq.heappop(self._max_heap)
+        return -self._max_heap[0][0] if self._max_heap else 0.0
+
+class _ListCursor:
+    """
+    Tracks how far into a SystemState list (which the workflow replaces each
+    round) has already been consumed.
+    """
+
+    def __init__(self):
+        self._list = None
+        self._consumed = 0
+
+    def new_items(self, items: List) -> Tuple[bool, List]:
+        """Returns (reset, unseen_items); reset is True when the list was replaced"""
+        reset = items is not self._list or len(items) < self._consumed
+        if reset:
+            self._list = items
+            self._consumed = 0
+        fresh = items[self._consumed:]
+        self._consumed = len(items)
+        return reset, fresh
+
+class CoalitionParticipationCounter:
+    """
+    Incremental analyze_coalition_patterns over the current round's formations.
+    """
+
+    def __init__(self):
+        self._cursor = _ListCursor()
+        self._reset()
+
+    def _reset(self):
+        self.total = 0
+        self.size_sum = 0
+        self.participation: Dict[str, int] = {}
+        self.proposers = set()
+        self._first_seen: Dict[str, int] = {}
+        self._most_active: Optional[str] = None
+
+    def update(self, formations: List[Dict]):
+        reset, fresh = self._cursor.new_items(formations)
+        if reset:
+            self._reset()
+        for formation in fresh:
+            proposer = formation.get("proposer")
+            partners = formation.get("partners", [])
+            self.total += 1
+            self.size_sum += len(partners) + 1
+            self.proposers.add(proposer)
+            self._count(proposer)
+            for partner in partners:
+                self._count(partner)
+
+    def _count(self, proc_id: str):
+        count = self.participation.get(proc_id, 0) + 1
+        self.participation[proc_id] = count
+        self._first_seen.setdefault(proc_id, len(self._first_seen))
+        best = self._most_active
+        if (best is None or count > self.participation[best] or
+                (count == self.participation[best] and self._first_seen[proc_id] < self._first_seen[best])):
+            self._most_active = proc_id
+
+    def patterns(self) -> Dict[str, Any]:
+        if self.total == 0:
+            return {"total": 0, "avg_size": 0, "most_active": None}
+        return {
+            "total": self.total,
+            "avg_size": self.size_sum / self.total,
+            "most_active": self._most_active,
+            "participation_distribution": dict(self.participation)
+        }
+
+class HyperLogLog:
+    """
+    Cardinality sketch with 2**precision one-byte registers. The relative
+    standard error is about 1.04 / sqrt(2**precision).
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.register_count = 1 << precision
+        self._alpha = 0.7213 / (1 + 1.079 / self.register_count)
+        self.clear()
+
+    @classmethod
+    def for_error(cls, relative_error: float) -> "HyperLogLog":
+        """Smallest sketch whose standard error is at most `relative_error`"""
+        precision = math.ceil(math.log2((1.04 / relative_error) ** 2))
+        return cls(min(18, max(4, precision)))
+
+    def add(self, item: str):
+        hashed = int.from_bytes(hashlib.blake2b(item.encode("utf-8"), digest_size=8).digest(), "big")
+        index = hashed >> (64 - self.precision)
+        remainder = hashed & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - remainder.bit_length() + 1
+        previous = self.registers[index]
+        if rank > previous:
+            self.registers[index] = rank
+            # Keep the harmonic sum and zero count current so estimate() is O(1)
+            self._harmonic += 2.0 ** -rank - 2.0 ** -previous
+            if previous == 0:
+                self._zeros -= 1
+
+    def estimate(self) -> float:
+        raw = self._alpha * self.register_count * self.register_count / self._harmonic
+        if raw <= 2.5 * self.register_count and self._zeros:
+            # Linear counting is more accurate for small cardinalities
+            return self.register_count * math.log(self.register_count / self._zeros)
+        return raw
+
+    def clear(self):
+        self.registers = bytearray(self.register_count)
+        self._harmonic = float(self.register_count)
+        self._zeros = self.register_count
+
+class StreamingVocabulary:
+    """
+    Vocabulary of negotiation messages updated once per message, for
+    calculate_strategic_diversity.
+
+    mode="exact" keeps the word set (fine for small runs); mode="approximate"
+    keeps a HyperLogLog sketch sized for `relative_error` plus a running token
+    count, so memory stays constant however long the run is.
+    """
+
+    def __init__(self, mode: str = "exact", relative_error: float = 0.01):
+        if mode not in ("exact", "approximate"):
+            raise ValueError(f"Unknown vocabulary mode '{mode}'")
+        self.mode = mode
+        self.relative_error = relative_error
+        self.unique_words = set() if mode == "exact" else None
+        self.sketch = HyperLogLog.for_error(relative_error) if mode == "approximate" else None
+        self.total_words = 0
+
+    @classmethod
+    def from_messages(cls, messages: List[Dict], **kwargs) -> "StreamingVocabulary":
+        vocabulary = cls(**kwargs)
+        for message in messages:
+            vocabulary.add_message(message.get('message', ''))
+        return vocabulary
+
+    def add_message(self, text: str):
+        words = text.lower().split()
+        if self.sketch is not None:
+            for word in words:
+                self.sketch.add(word)
+        else:
+            self.unique_words.update(words)
+        self.total_words += len(words)
+
+    @property
+    def unique_count(self) -> float:
+        if self.sketch is not None:
+            return self.sketch.estimate() if self.total_words else 0
+        return len(self.unique_words)
+
+    def reset(self):
+        if self.sketch is not None:
+            self.sketch.clear()
+        else:
+            self.unique_words = set()
+        self.total_words = 0
+
+    def diversity(self) -> float:
+        if self.total_words == 0:
+            return 0.0
+        return min(1.0, self.unique_count / max(1, self.total_words) * 10)
+
+class IncrementalStateAggregator:
+    """
+    Aggregates backing an incremental StateRepository. Call update() once per
+    recording with the ids of processors whose trust or execution changed.
+    """
+
+    def __init__(self, vocabulary: Optional[StreamingVocabulary] = None):
+        self.trust = RunningStats()
+        self.coalitions = CoalitionParticipationCounter()
+        self.vocabulary = vocabulary if vocabulary is not None else StreamingVocabulary()
+        self._message_cursor = _ListCursor()
+        self._slots: Dict[str, int] = {}
+        self._burst: Dict[str, int] = {}
+        self.total_burst_time = 0
+        self.total_executed = 0
+        self.completed_count = 0
+
+    def update(self, state: SystemState, changed: Optional[Iterable[str]] = None):
+        if changed is None or len(self._slots) != len(state.processors):
+            processor_states = state.processors
+        else:
+            by_id = self._states_by_id(state)
+            processor_states = [by_id[proc_id] for proc_id in changed if proc_id in by_id]
+        for processor_state in processor_states:
+            self._observe_processor(processor_state)
+
+        self.coalitions.update(state.coalition_formations)
+        reset, fresh = self._message_cursor.new_items(state.negotiation_messages)
+        if reset:
+            self.vocabulary.reset()
+        for message in fresh:
+            self.vocabulary.add_message(message.get('message', ''))
+
+    def _states_by_id(self, state: SystemState) -> Dict[str, ProcessorState]:
+        cached = getattr(self, '_state_index', None)
+        if cached is None or cached[0] is not state.processors or len(cached[1]) != len(state.processors):
+            cached = (state.processors, {p.processor_id: p for p in state.processors})
+            self._state_index = cached
+        return cached[1]
+
+    def _observe_processor(self, processor_state: ProcessorState):
+        proc_id = processor_state.processor_id
+        self.trust.set(proc_id, processor_state.trust_score)
+        slots = getattr(processor_state, 'execution_slots_used', 0)
+        burst = processor_state.true_burst_time
+        old_slots = self._slots.get(proc_id, 0)
+        old_burst = self._burst.get(proc_id)
+        if old_burst is not None:
+            self.total_burst_time -= old_burst
+            self.completed_count -= 1 if old_burst <= old_slots else 0
+        self.total_burst_time += burst
+        self.total_executed += slots - old_slots
+        self.completed_count += 1 if burst <= slots else 0
+        self._slots[proc_id] = slots
+        self._burst[proc_id] = burst
+
+    def trust_distribution(self) -> Dict[str, float]:
+        return {
+            "mean": self.trust.mean,
+            "min": self.trust.min,
+            "max": self.trust.max,
+            "std": self.trust.std
+        }
+
+    def execution_efficiency(self) -> Dict[str, float]:
+        processor_count = len(self._slots)
+        return {
+            "total_burst_time": self.total_burst_time,
+            "total_executed": self.total_executed,
+            "execution_progress": self.total_executed / self.total_burst_time if self.total_burst_time > 0 else 0,
+            "completion_rate": self.completed_count / processor_count if processor_count else 0
+        }
+
+    def coordination_effectiveness(self) -> float:
+        coalition_score = min(1.0, self.coalitions.total / 10.0)
+        execution_efficiency = self.total_executed / self.total_burst_time if self.total_burst_time > 0 else 0
+        effectiveness = (self.trust.variance * 0.3 + coalition_score * 0.3 + execution_efficiency * 0.4)
+        return min(1.0, effectiveness)
+
+    def emergence_indicators(self, state: SystemState) -> Dict[str, float]:
+        processor_count = len(self._slots)
+        return {
+            'trust_stratification': self.trust.max - self.trust.min if self.trust.count else 0,
+            'coalition_complexity': len(self.coalitions.proposers) / max(1, processor_count),
+            'communication_richness': self.vocabulary.diversity(),
+            'system_adaptation': min(1.0, state.round_number / 20.0)
+        }
+
+    def build_record(self, state: SystemState) -> Dict[str, Any]:
+        """Evolution record with the same shape as StateRepository.record_state_evolution"""
+        return {
+            'round': state.round_number,
+            'phase': state.current_phase,
+            'trust_distribution': self.trust_distribution(),
+            'coalition_patterns': self.coalitions.patterns(),
+            'execution_efficiency': self.execution_efficiency(),
+            'coordination_effectiveness': self.coordination_effectiveness(),
+            'emergence_indicators': self.emergence_indicators(state)
+        }
@@ -0,0 +1,258 @@
+"""
+Memory Tracking - Per-round memory accounting for agents, coordinator structures and state history.
+
+A MemoryTracker samples after every execution phase: deep-size estimates of
+each ProcessorState field (summed over agents), the coordinator's own
+histories and the StateRepository, plus the tracemalloc-traced total and its
+change since the previous round. Rows stream to a CSV; the summary fits a
+growth exponent per structure (growth ~ rounds^k) and flags superlinear ones.
+When no tracker is installed the round hook is a no-op.
+"""
+
+import csv
+import math
+import sys
+import tracemalloc
+from dataclasses import fields
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from coordination_framework.coalition_registry import CoalitionRegistry
+from coordination_framework.relationship_store import RelationshipStore
+from coordination_framework.shared_types import ProcessorState
+from coordination_framework.state_backends import InMemoryStateBackend
+
+PROCESSOR_FIELDS = tuple(f.name for f in fields(ProcessorState))
+CSV_COLUMNS = ("round", "category", "structure", "bytes", "bytes_per_agent", "items",
+               "traced_bytes", "traced_delta")
+
+# Objects that are shared program state rather than simulation data
+_OPAQUE_TYPES = (type, type(sys), type(len), type(lambda: None))
+# Coordinator-owned stores that agents reference through views; they are
+# measured once at coordinator level, never charged to a referrer
+SHARED_STORE_TYPES = (CoalitionRegistry, RelationshipStore)
+
+def deep_sizeof(obj: Any, seen: Optional[set] = None) -> int:
+    """
+    Approximate retained size of obj: sys.getsizeof over everything reachable
+    through containers, __dict__ and __slots__, counting each object once.
+    Shared stores (SHARED_STORE_TYPES) are only counted when obj is the store.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        marker = id(current)
+        if marker in seen or isinstance(current, _OPAQUE_TYPES):
+            continue
+        if current is not obj and isinstance(current, SHARED_STORE_TYPES):
+            continue
+        seen.add(marker)
+        total += sys.getsizeof(current)
+        if isinstance(current, (str, bytes, bytearray, int, float, bool, np.ndarray)) or current is None:
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        else:
+            if hasattr(current, "__dict__"):
+                stack.append(current.__dict__)
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return total
+
+def _item_count(obj: Any) -> int:
+    if isinstance(obj, (str, bytes)):
+        return 1
+    try:
+        return len(obj)
+    except TypeError:
+        return 1
+
+def fit_growth_exponent(rounds: List[int], sizes: List[int]) -> Optional[float]:
+    """
+    Least-squares slope of log(growth) against log(rounds elapsed), where
+    growth is bytes above the first sample, i.e. bytes - bytes0 ~ rounds**k
+    """
+    if not rounds:
+        return None
+    first_round, first_size = rounds[0], sizes[0]
+    points = [(r - first_round, s - first_size) for r, s in zip(rounds, sizes) if r > first_round and s > first_size]
+    if len(points) < 3 or len({r for r, _ in points}) < 3:
+        return None
+    slope, _ = np.polyfit([math.log(r) for r, _ in points], [math.log(s) for _, s in points], 1)
+    return float(slope)
+
+class NullMemoryTracker:
+    """Default tracker: rounds are not sampled"""
+
+    enabled = False
+
+    def record_round(self, coordinator, state):
+        pass
+
+class MemoryTracker:
+    """
+    Per-round memory accounting. every=k samples every k-th round; structures
+    growing faster than rounds**superlinear_exponent (and ending above
+    min_bytes) are flagged in the summary.
+    """
+
+    enabled = True
+
+    def __init__(self, csv_path: Optional[str] = None, every: int = 1, use_tracemalloc: bool = True,
+                 superlinear_exponent: float = 1.1, min_bytes: int = 64 * 1024):
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.csv_path = csv_path
+        self.every = every
+        self.use_tracemalloc = use_tracemalloc
+        self.superlinear_exponent = superlinear_exponent
+        self.min_bytes = min_bytes
+        self.rows: List[Dict[str, Any]] = []
+        self._series: Dict[tuple, Dict[str, list]] = {}
+        self._previous_traced = None
+        self._started_tracemalloc = False
+        self._csv_file = None
+        self._csv_writer = None
+
+    def start(self):
+        if self.use_tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.csv_path:
+            self._csv_file = open(self.csv_path, "w", newline="", encoding="utf-8")
+            self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=CSV_COLUMNS)
+            self._csv_writer.writeheader()
+
+    def stop(self):
+        if self._csv_file:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _structures(self, coordinator, state) -> List[tuple]:
+        """(category, structure, object) triples measured each round"""
+        agents = [processor.state for processor in coordinator.processors.values()]
+        structures = [
+            ("processor_state", name, [getattr(agent, name) for agent in agents])
+            for name in PROCESSOR_FIELDS
+        ]
+        structures.extend([
+            ("coordinator", "execution_history", coordinator.execution_history),
+            ("coordinator", "pattern_detectors", coordinator.pattern_detectors),
+            ("coordinator", "batch_trust_engine", coordinator.batch_trust_engine),
+            ("coordinator", "coalitions", coordinator.coalitions),
+            ("coordinator", "relationship_store", coordinator.relationship_store),
+            ("system_state", "negotiation_messages", state.negotiation_messages),
+            ("system_state", "coalition_formations", state.coalition_formations),
+            ("system_state", "execution_order", state.execution_order),
+            ("system_state", "trust_updates", state.trust_updates)
+        ])
+        repository = coordinator.state_repository
+        if repository is not None:
+            # Persistent backends hold their records on disk, only the in-memory one is counted
+            if isinstance(repository.backend, InMemoryStateBackend):
+                structures.append(("state_repository", "history", repository.backend.records))
+            structures.append(("state_repository", "aggregator", repository.aggregator))
+        return structures
+
+    def record_round(self, coordinator, state):
+        round_number = state.round_number
+        if round_number % self.every:
+            return
+        traced = traced_delta = None
+        if tracemalloc.is_tracing():
+            traced = tracemalloc.get_traced_memory()[0]
+            if self._previous_traced is not None:
+                traced_delta = traced - self._previous_traced
+            self._previous_traced = traced
+
+        agent_count = max(1, len(coordinator.processors))
+        for category, structure, obj in self._structures(coordinator, state):
+            if obj is None:
+                continue
+            if category == "processor_state":
+                # Summed per agent so objects shared between agents count for each owner
+                size = sum(deep_sizeof(value) for value in obj)
+                items = sum(_item_count(value) for value in obj)
+            else:
+                size = deep_sizeof(obj)
+                items = _item_count(obj)
+            row = {
+                "round": round_number,
+                "category": category,
+                "structure": structure,
+                "bytes": size,
+                "bytes_per_agent": round(size / agent_count, 1),
+                "items": items,
+                "traced_bytes": traced,
+                "traced_delta": traced_delta
+            }
+            self.rows.append(row)
+            series = self._series.setdefault((category, structure), {"rounds": [], "bytes": []})
+            series["rounds"].append(round_number)
+            series["bytes"].append(size)
+            if self._csv_writer:
+                self._csv_writer.writerow(row)
+        if self._csv_file:
+            self._csv_file.flush()
+
+    def summary(self) -> Dict[str, Any]:
+        structures = {}
+        for (category, structure), series in self._series.items():
+            exponent = fit_growth_exponent(series["rounds"], series["bytes"])
+            final_bytes = series["bytes"][-1]
+            structures[f"{category}.{structure}"] = {
+                "first_bytes": series["bytes"][0],
+                "final_bytes": final_bytes,
+                "growth_exponent": exponent,
+                "superlinear": exponent is not None and exponent > self.superlinear_exponent
+                               and final_bytes >= self.min_bytes
+            }
+        traced = [row["traced_bytes"] for row in self.rows if row["traced_bytes"] is not None]
+        return {
+            "rounds_sampled": len({row["round"] for row in self.rows}),
+            "peak_traced_bytes": max(traced) if traced else None,
+            "structures": structures,
+            "superlinear": sorted(name for name, entry in structures.items() if entry["superlinear"])
+        }
+
+    def format_summary(self, top_n: int = 12) -> str:
+        summary = self.summary()
+        lines = ["MEMORY GROWTH SUMMARY", "=" * 60,
+                 f"Rounds sampled: {summary['rounds_sampled']}"]
+        if summary["peak_traced_bytes"] is not None:
+            lines.append(f"Peak traced memory: {summary['peak_traced_bytes'] / 1024:.1f} KiB")
+        lines.append(f"  {'final KiB':>10} {'first KiB':>10} {'exponent':>9}  structure")
+        ranked = sorted(summary["structures"].items(), key=lambda item: item[1]["final_bytes"], reverse=True)
+        for name, entry in ranked[:top_n]:
+            exponent = entry["growth_exponent"]
+            lines.append(
+                f"  {entry['final_bytes'] / 1024:>10.1f} {entry['first_bytes'] / 1024:>10.1f} "
+                f"{'n/a' if exponent is None else f'{exponent:.2f}':>9}  {name}{'  SUPERLINEAR' if entry['superlinear'] else ''}"
+            )
+        if summary["superlinear"]:
+            lines.append(f"\nSuperlinear growth in rounds (k > {self.superlinear_exponent:g}): {', '.join(summary['superlinear'])}")
+        return "\n".join(lines)
+
+_active_tracker = NullMemoryTracker()
+
+def get_memory_tracker():
+    """Process-wide memory tracker consulted by the workflow engine after each round"""
+    return _active_tracker
+
+def set_memory_tracker(tracker) -> Any:
+    """Install a tracker (None restores the NullMemoryTracker) and return the previous one"""
+    global _active_tracker
+    previous = _active_tracker
+    _active_tracker = tracker if tracker is not None else NullMemoryTracker()
+    return previous
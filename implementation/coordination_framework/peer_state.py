@@ -0,0 +1,56 @@
+"""
+Peer State - Columnar snapshot of the fleet state agents observe about each other.
+
+_update_processor_observations hands every agent the same per-peer values
+(trust score, remaining time, coalition membership). PeerStateTable keeps one
+copy of those values as arrays so behaviors can score every candidate at once
+instead of reading one observed_opponents dict per peer.
+"""
+
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+
+from coordination_framework.coalition_registry import CoalitionRegistry
+
+class PeerStateTable:
+    """
+    Per-processor trust and remaining time as captured at the last
+    observation update, with coalition membership read live from the
+    registry (as the coalition_members views are). Rows follow the order
+    processor ids were given in.
+    """
+
+    def __init__(self, processor_ids: Iterable[str], coalitions: Optional[CoalitionRegistry] = None):
+        self.processor_ids: List[str] = list(processor_ids)
+        self._index: Dict[str, int] = {proc_id: row for row, proc_id in enumerate(self.processor_ids)}
+        self.coalitions = coalitions
+        n = len(self.processor_ids)
+        self.trust_scores = np.full(n, 0.5)
+        self.remaining_times = np.zeros(n)
+        # Nothing is observed until the first update, matching empty observed_opponents
+        self.observed = False
+        self._coalition_flags = np.zeros(n, dtype=bool)
+        self._coalition_version = None
+
+    def __len__(self) -> int:
+        return len(self.processor_ids)
+
+    def update(self, trust_scores: Iterable[float], remaining_times: Iterable[float]):
+        """Replace the snapshot; values in processor_ids order"""
+        self.trust_scores = np.fromiter(trust_scores, dtype=np.float64, count=len(self))
+        self.remaining_times = np.fromiter(remaining_times, dtype=np.float64, count=len(self))
+        self.observed = True
+
+    def rows(self, processor_ids: Iterable[str]) -> np.ndarray:
+        return np.fromiter(map(self._index.__getitem__, processor_ids), dtype=np.intp)
+
+    def in_coalition(self) -> np.ndarray:
+        """Whether each processor currently has coalition partners, recomputed only after the registry changes"""
+        if self.coalitions is None:
+            return self._coalition_flags
+        if self._coalition_version != self.coalitions.version:
+            self._coalition_flags = np.fromiter(
+                (self.coalitions.size(proc_id) > 1 for proc_id in self.processor_ids), dtype=bool, count=len(self)
+            )
+            self._coalition_version = self.coalitions.version
+        return self._coalition_flags
@@ -0,0 +1,190 @@
+"""
+Profiling - Per-phase cProfile and tracemalloc hooks for the coordination workflow.
+
+A PhaseProfiler wraps selected workflow phases, aggregates function timings
+and allocation sites across rounds and reports the top-N of each per phase.
+When no profiler is installed the phase hook is a shared no-op context.
+"""
+
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from typing import Any, Dict, Iterable, List, Optional
+
+PHASES = ("initialization", "negotiation", "coalition", "bidding", "execution")
+
+class _NullPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+# Allocations made by tracemalloc and the profiler itself are not phase costs
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__)
+)
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+class NullProfiler:
+    """Default profiler: phases run untouched"""
+
+    enabled = False
+
+    def phase(self, name: str):
+        return _NULL_PHASE
+
+class _ProfiledPhase:
+    __slots__ = ("profiler", "name", "start", "before")
+
+    def __init__(self, profiler: "PhaseProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.before = None
+
+    def __enter__(self):
+        profiler = self.profiler
+        if profiler.memory:
+            self.before = _take_snapshot()
+        if profiler.cpu:
+            profiler._cpu_profile(self.name).enable()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        profiler = self.profiler
+        if profiler.cpu:
+            profiler._cpu_profiles[self.name].disable()
+        if profiler.memory:
+            after = _take_snapshot()
+            profiler._record_allocations(self.name, after.compare_to(self.before, "lineno"))
+        timing = profiler.timings.setdefault(self.name, {"calls": 0, "total_time": 0.0})
+        timing["calls"] += 1
+        timing["total_time"] += elapsed
+        return False
+
+class PhaseProfiler:
+    """
+    Aggregates cProfile statistics (cpu=True) and tracemalloc allocation
+    deltas (memory=True) per workflow phase across all rounds.
+    """
+
+    enabled = True
+
+    def __init__(self, phases: Optional[Iterable[str]] = None, cpu: bool = True,
+                 memory: bool = False, top_n: int = 15, sort_by: str = "cumulative"):
+        self.phases = frozenset(phases) if phases is not None else frozenset(PHASES)
+        unknown = self.phases - set(PHASES)
+        if unknown:
+            raise ValueError(f"Unknown phases: {sorted(unknown)}")
+        self.cpu = cpu
+        self.memory = memory
+        self.top_n = top_n
+        self.sort_by = sort_by
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self._cpu_profiles: Dict[str, cProfile.Profile] = {}
+        self._allocations: Dict[str, Dict[str, List[int]]] = {}
+        self._started_tracemalloc = False
+
+    def start(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self):
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def phase(self, name: str):
+        if name not in self.phases:
+            return _NULL_PHASE
+        return _ProfiledPhase(self, name)
+
+    def _cpu_profile(self, phase: str) -> cProfile.Profile:
+        profile = self._cpu_profiles.get(phase)
+        if profile is None:
+            profile = self._cpu_profiles[phase] = cProfile.Profile()
+        return profile
+
+    def _record_allocations(self, phase: str, differences):
+        sites = self._allocations.setdefault(phase, {})
+        for stat in differences:
+            if stat.size_diff == 0 and stat.count_diff == 0:
+                continue
+            frame = stat.traceback[0]
+            site = f"{frame.filename}:{frame.lineno}"
+            totals = sites.setdefault(site, [0, 0])
+            totals[0] += stat.size_diff
+            totals[1] += stat.count_diff
+
+    def _top_functions(self, phase: str, top_n: int) -> List[Dict[str, Any]]:
+        profile = self._cpu_profiles.get(phase)
+        if profile is None:
+            return []
+        stats = pstats.Stats(profile, stream=io.StringIO())
+        column = {"cumulative": 3, "tottime": 2, "calls": 1}.get(self.sort_by, 3)
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][column], reverse=True)[:top_n]
+        return [
+            {
+                "function": f"{filename}:{lineno}({name})",
+                "calls": primitive_calls if primitive_calls == total_calls else f"{total_calls}/{primitive_calls}",
+                "total_time": total_time,
+                "cumulative_time": cumulative_time
+            }
+            for (filename, lineno, name), (primitive_calls, total_calls, total_time, cumulative_time, _) in rows
+        ]
+
+    def _top_allocations(self, phase: str, top_n: int) -> List[Dict[str, Any]]:
+        sites = self._allocations.get(phase, {})
+        rows = sorted(sites.items(), key=lambda item: abs(item[1][0]), reverse=True)[:top_n]
+        return [{"site": site, "size_diff": size, "count_diff": count} for site, (size, count) in rows]
+
+    def report(self, top_n: Optional[int] = None) -> Dict[str, Any]:
+        top_n = top_n or self.top_n
+        report = {}
+        for phase in PHASES:
+            if phase not in self.timings:
+                continue
+            entry = dict(self.timings[phase])
+            if self.cpu:
+                entry["top_functions"] = self._top_functions(phase, top_n)
+            if self.memory:
+                entry["top_allocations"] = self._top_allocations(phase, top_n)
+            report[phase] = entry
+        return report
+
+    def format_report(self, top_n: Optional[int] = None) -> str:
+        lines = ["PHASE PROFILE REPORT", "=" * 60]
+        for phase, entry in self.report(top_n).items():
+            lines.append(f"\n{phase.upper()}: {entry['calls']} calls, {entry['total_time']:.4f}s total")
+            if entry.get("top_functions"):
+                lines.append(f"  {'cumulative':>10} {'self':>10} {'calls':>10}  function")
+                for row in entry["top_functions"]:
+                    lines.append(f"  {row['cumulative_time']:>10.4f} {row['total_time']:>10.4f} {str(row['calls']):>10}  {row['function']}")
+            if entry.get("top_allocations"):
+                lines.append(f"  {'bytes':>12} {'blocks':>8}  allocation site")
+                for row in entry["top_allocations"]:
+                    lines.append(f"  {row['size_diff']:>+12} {row['count_diff']:>+8}  {row['site']}")
+        return "\n".join(lines)
+
+_active_profiler = NullProfiler()
+
+def get_phase_profiler():
+    """Process-wide phase profiler consulted by the workflow engine"""
+    return _active_profiler
+
+def set_phase_profiler(profiler) -> Any:
+    """Install a profiler (None restores the NullProfiler) and return the previous one"""
+    global _active_profiler
+    previous = _active_profiler
+    _active_profiler = profiler if profiler is not None else NullProfiler()
+    return previous
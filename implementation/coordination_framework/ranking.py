@@ -0,0 +1,28 @@
+"""
+Ranking - Deterministic top-k selection over score arrays.
+
+Shared by the similarity index, the relationship store and partner ranking so
+every "best k" query picks the same rows for the same scores: highest score
+first, ties broken by lowest index (insertion order).
+"""
+
+import numpy as np
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first, ties by lowest index; O(n + k log k)"""
+    count = scores.shape[0]
+    k = min(k, count)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < count:
+        candidates = np.argpartition(scores, count - k)[count - k:]
+        kth_score = scores[candidates].min()
+        if np.count_nonzero(scores >= kth_score) > k:
+            # argpartition picks arbitrarily among rows tied with the k-th score
+            above = np.flatnonzero(scores > kth_score)
+            tied = np.flatnonzero(scores == kth_score)[:k - len(above)]
+            candidates = np.concatenate((above, tied))
+    else:
+        candidates = np.arange(count)
+    # lexsort's last key is primary: descending score, then ascending index
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
@@ -0,0 +1,236 @@
+"""
+Relationship Store - Shared pairwise relationship records for a processor fleet.
+
+Each observer's row holds what it believes about the subjects it has
+interacted with: trust assessment, cooperation likelihood and reliability,
+each the fraction of qualifying interactions among the last WINDOW, plus the
+total interaction count. The last WINDOW outcomes of each pair are kept as a
+bitmask per metric, so recording an interaction is O(1) instead of a rescan
+of the interaction list.
+
+Rows are sparse: an observer's arrays are allocated on its first interaction
+and hold only the subjects it has met, growing by doubling. Memory is
+O(interacting pairs), about 40 bytes of arrays plus one dict entry per pair,
+instead of a dense n x n block (≈3 GB at 10,000 agents).
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+from coordination_framework.ranking import top_k_indices
+
+WINDOW = 5
+METRICS = ("trust_assessment", "cooperation_likelihood", "reliability_score")
+POSITIVE_OUTCOMES = frozenset({"success", "cooperation", "reliable"})
+COOPERATIVE_TYPES = frozenset({"coalition", "negotiation"})
+RELIABLE_OUTCOMES = frozenset({"reliable", "honest", "kept_promise"})
+NEUTRAL_ASSESSMENT = 0.5
+
+_WINDOW_MASK = (1 << WINDOW) - 1
+_POPCOUNT = [bin(bits).count("1") for bits in range(1 << WINDOW)]
+
+class _ObserverRow:
+    """One observer's relationships, columns in first-interaction order"""
+
+    __slots__ = ("positions", "subjects", "metrics", "windows", "counts")
+
+    def __init__(self, capacity: int = 4):
+        self.positions: Dict[int, int] = {}
+        self.subjects = np.zeros(capacity, dtype=np.intp)
+        self.metrics = np.full((len(METRICS), capacity), NEUTRAL_ASSESSMENT, dtype=np.float64)
+        self.windows = np.zeros((len(METRICS), capacity), dtype=np.uint8)
+        self.counts = np.zeros(capacity, dtype=np.uint32)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def position(self, subject: int) -> int:
+        """Column of a subject, appending it if new"""
+        position = self.positions.get(subject)
+        if position is not None:
+            return position
+        position = len(self.positions)
+        capacity = self.counts.shape[0]
+        if position == capacity:
+            capacity *= 2
+            self.subjects = np.resize(self.subjects, capacity)
+            metrics = np.full((len(METRICS), capacity), NEUTRAL_ASSESSMENT, dtype=np.float64)
+            metrics[:, :position] = self.metrics
+            windows = np.zeros((len(METRICS), capacity), dtype=np.uint8)
+            windows[:, :position] = self.windows
+            counts = np.zeros(capacity, dtype=np.uint32)
+            counts[:position] = self.counts
+            self.metrics, self.windows, self.counts = metrics, windows, counts
+        self.subjects[position] = subject
+        self.positions[subject] = position
+        return position
+
+class RelationshipStore:
+    """
+    Fleet-wide observer -> subject relationships. Pairs that have never
+    interacted read as NEUTRAL_ASSESSMENT with a zero count and take no space.
+    """
+
+    def __init__(self, agent_ids: Iterable[str] = ()):
+        self._index: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._rows: Dict[int, _ObserverRow] = {}
+        for agent_id in agent_ids:
+            self.register(agent_id)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self._index
+
+    @property
+    def agent_ids(self) -> List[str]:
+        return list(self._ids)
+
+    def pair_count(self) -> int:
+        """Observer/subject pairs with at least one recorded interaction"""
+        return sum(len(row) for row in self._rows.values())
+
+    def register(self, agent_id: str) -> int:
+        """Index of an agent, adding it if new"""
+        index = self._index.get(agent_id)
+        if index is None:
+            index = len(self._ids)
+            self._index[agent_id] = index
+            self._ids.append(agent_id)
+        return index
+
+    def _row(self, observer_id: str) -> Optional[_ObserverRow]:
+        index = self._index.get(observer_id)
+        return None if index is None else self._rows.get(index)
+
+    def record(self, observer_id: str, subject_id: str, interaction_type: str, outcome: str):
+        """Fold one interaction into the observer's view of the subject in O(1)"""
+        i, j = self.register(observer_id), self.register(subject_id)
+        row = self._rows.get(i)
+        if row is None:
+            row = self._rows[i] = _ObserverRow()
+        position = row.position(j)
+        count = int(row.counts[position]) + 1
+        row.counts[position] = count
+        observed = min(count, WINDOW)
+        bits = (outcome in POSITIVE_OUTCOMES, interaction_type in COOPERATIVE_TYPES, outcome in RELIABLE_OUTCOMES)
+        for metric, bit in enumerate(bits):
+            window = ((int(row.windows[metric, position]) << 1) | bit) & _WINDOW_MASK
+            row.windows[metric, position] = window
+            row.metrics[metric, position] = _POPCOUNT[window] / observed
+
+    def interaction_count(self, observer_id: str, subject_id: str) -> int:
+        row = self._row(observer_id)
+        position = None if row is None else row.positions.get(self._index.get(subject_id))
+        return 0 if position is None else int(row.counts[position])
+
+    def get(self, observer_id: str, subject_id: str) -> Optional[Dict[str, Any]]:
+        """The observer's model of the subject, or None if they have never interacted"""
+        row = self._row(observer_id)
+        position = None if row is None else row.positions.get(self._index.get(subject_id))
+        if position is None:
+            return None
+        model = {name: float(row.metrics[metric, position]) for metric, name in enumerate(METRICS)}
+        model["interaction_count"] = int(row.counts[position])
+        return model
+
+    def lookup(self, observer_id: str, subject_ids: Iterable[str],
+               metric: str = "trust_assessment") -> Tuple[np.ndarray, np.ndarray]:
+        """(metric values, interaction counts) of the given subjects, in their order; O(len(subject_ids))"""
+        subject_ids = list(subject_ids)
+        values = np.full(len(subject_ids), NEUTRAL_ASSESSMENT)
+        counts = np.zeros(len(subject_ids), dtype=np.int64)
+        row = self._row(observer_id)
+        if row is None:
+            return values, counts
+        metric_row = METRICS.index(metric)
+        for k, subject_id in enumerate(subject_ids):
+            position = row.positions.get(self._index.get(subject_id))
+            if position is not None:
+                values[k] = row.metrics[metric_row, position]
+                counts[k] = row.counts[position]
+        return values, counts
+
+    def dense_row(self, observer_id: str, metric: str) -> np.ndarray:
+        """The observer's values for every registered subject (counts for metric="interaction_count"); O(n)"""
+        n = len(self)
+        counts = metric == "interaction_count"
+        dense = np.zeros(n, dtype=np.uint32) if counts else np.full(n, NEUTRAL_ASSESSMENT)
+        row = self._row(observer_id)
+        if row is not None and len(row):
+            size = len(row)
+            dense[row.subjects[:size]] = row.counts[:size] if counts else row.metrics[METRICS.index(metric), :size]
+        return dense
+
+    def view(self, observer_id: str) -> "RelationshipView":
+        self.register(observer_id)
+        return RelationshipView(self, observer_id)
+
+    def top_partners(self, observer_id: str, k: int = 3, metric: str = "trust_assessment",
+                     min_interactions: int = 1) -> List[Tuple[str, float]]:
+        """
+        The observer's k highest-rated subjects by metric among those with at
+        least min_interactions interactions, best first, ties in registration
+        order. Only the observer's own interactions are scanned.
+        """
+        row = self._row(observer_id)
+        if row is None or not len(row):
+            return []
+        size = len(row)
+        # Registration order, so ties break as they would over a dense row
+        order = np.argsort(row.subjects[:size], kind="stable")
+        subjects = row.subjects[order]
+        scores = row.metrics[METRICS.index(metric), order].copy()
+        eligible = (row.counts[order] >= max(1, min_interactions)) & (subjects != self._index[observer_id])
+        scores[~eligible] = -np.inf
+        top = top_k_indices(scores, min(k, int(np.count_nonzero(eligible))))
+        return [(self._ids[subjects[position]], float(scores[position])) for position in top.tolist()]
+
+    def top_trusted(self, observer_id: str, k: int = 3, min_interactions: int = 1) -> List[Tuple[str, float]]:
+        return self.top_partners(observer_id, k, "trust_assessment", min_interactions)
+
+class RelationshipView:
+    """
+    One observer's row of a RelationshipStore. Row properties are dense NumPy
+    copies over every registered subject, built on access.
+    """
+
+    def __init__(self, store: RelationshipStore, observer_id: str):
+        self.store = store
+        self.observer_id = observer_id
+
+    @property
+    def trust(self) -> np.ndarray:
+        return self.store.dense_row(self.observer_id, "trust_assessment")
+
+    @property
+    def cooperation(self) -> np.ndarray:
+        return self.store.dense_row(self.observer_id, "cooperation_likelihood")
+
+    @property
+    def reliability(self) -> np.ndarray:
+        return self.store.dense_row(self.observer_id, "reliability_score")
+
+    @property
+    def interaction_counts(self) -> np.ndarray:
+        return self.store.dense_row(self.observer_id, "interaction_count")
+
+    def record(self, subject_id: str, interaction_type: str, outcome: str):
+        self.store.record(self.observer_id, subject_id, interaction_type, outcome)
+
+    def get(self, subject_id: str) -> Optional[Dict[str, Any]]:
+        return self.store.get(self.observer_id, subject_id)
+
+    def lookup(self, subject_ids: Iterable[str], metric: str = "trust_assessment") -> Tuple[np.ndarray, np.ndarray]:
+        return self.store.lookup(self.observer_id, subject_ids, metric)
+
+    def known_partners(self) -> List[str]:
+        row = self.store._row(self.observer_id)
+        if row is None:
+            return []
+        return [self.store._ids[j] for j in sorted(row.subjects[:len(row)].tolist())]
+
+    def top_trusted(self, k: int = 3, min_interactions: int = 1) -> List[Tuple[str, float]]:
+        return self.store.top_trusted(self.observer_id, k, min_interactions)
@@ -0,0 +1,88 @@
+"""
+Sharding - Partition of the processor fleet for hierarchical auctions.
+
+A flat auction hands every bidder the whole competitor list, and every agent
+observes every other agent, so one round is O(n²). In a hierarchical auction
+each shard of about shard_size processors bids among itself, only the shard
+winners meet in a final auction, and agents observe their shard peers only,
+which brings a round down to O(n · shard_size + shards²).
+
+Processors are sharded by a stable hash of their id (CRC-32, so assignments
+do not depend on PYTHONHASHSEED) or by coalition: coalition members share
+the shard of their coalition id, so allies always bid and observe locally.
+"""
+
+import math
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+from coordination_framework.coalition_registry import CoalitionRegistry
+
+SHARD_STRATEGIES = ("hash", "coalition")
+
+def stable_shard(key: str, shard_count: int) -> int:
+    return zlib.crc32(key.encode("utf-8")) % shard_count
+
+class ShardMap:
+    """
+    Shard of every processor. The shard count is fixed from the fleet size;
+    coalition sharding re-reads the registry only after it changes.
+    """
+
+    def __init__(self, processor_ids: Iterable[str], shard_size: int = 64, shard_by: str = "hash",
+                 coalitions: Optional[CoalitionRegistry] = None):
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        if shard_by not in SHARD_STRATEGIES:
+            raise ValueError(f"Unknown shard strategy '{shard_by}'")
+        if shard_by == "coalition" and coalitions is None:
+            raise ValueError("Coalition sharding needs a CoalitionRegistry")
+        self.processor_ids: List[str] = list(processor_ids)
+        self.shard_size = shard_size
+        self.shard_by = shard_by
+        self.coalitions = coalitions
+        self.shard_count = max(1, math.ceil(len(self.processor_ids) / shard_size))
+        self._shard_of: Dict[str, int] = {}
+        self._members: Dict[int, List[str]] = {}
+        self._version = None
+        self._refresh()
+
+    def _refresh(self):
+        if self.shard_by == "coalition":
+            if self._version == self.coalitions.version:
+                return
+            self._version = self.coalitions.version
+        elif self._shard_of:
+            return
+        shard_of = {}
+        for proc_id in self.processor_ids:
+            coalition_id = self.coalitions.coalition_id(proc_id) if self.shard_by == "coalition" else None
+            key = proc_id if coalition_id is None else f"coalition:{coalition_id}"
+            shard_of[proc_id] = stable_shard(key, self.shard_count)
+        members: Dict[int, List[str]] = {}
+        for proc_id in self.processor_ids:
+            members.setdefault(shard_of[proc_id], []).append(proc_id)
+        self._shard_of = shard_of
+        self._members = members
+
+    def shard_of(self, proc_id: str) -> int:
+        self._refresh()
+        return self._shard_of[proc_id]
+
+    def shards(self) -> Dict[int, List[str]]:
+        """Non-empty shards and their members in fleet order"""
+        self._refresh()
+        return {shard: list(self._members[shard]) for shard in sorted(self._members)}
+
+    def peers(self, proc_id: str) -> List[str]:
+        """Other processors in the same shard, in fleet order"""
+        self._refresh()
+        return [peer_id for peer_id in self._members[self._shard_of[proc_id]] if peer_id != proc_id]
+
+    def partition(self, proc_ids: Iterable[str]) -> Dict[int, List[str]]:
+        """Group the given processors by shard, keeping their order within each shard"""
+        self._refresh()
+        groups: Dict[int, List[str]] = {}
+        for proc_id in proc_ids:
+            groups.setdefault(self._shard_of[proc_id], []).append(proc_id)
+        return {shard: groups[shard] for shard in sorted(groups)}
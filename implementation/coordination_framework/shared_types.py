@@ -2,7 +2,7 @@
 Shared Types - Core data structures for distributed coordination system.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence
 from dataclasses import dataclass, field
 
 @dataclass
@@ -26,7 +26,8 @@ class ProcessorState:
     reputation_history: List[Dict] = field(default_factory=list)
     
     current_bid: float = 0.0
-    coalition_members: List[str] = field(default_factory=list)
+    # Replaced by a live CoalitionMembersView once the processor joins a coordination system
+    coalition_members: Sequence[str] = field(default_factory=list)
     execution_position: Optional[int] = None
     
     negotiation_history: List[Dict] = field(default_factory=list)
@@ -41,6 +42,8 @@ class SystemState:
     processors: List[ProcessorState]
     round_number: int = 0
     execution_order: List[str] = field(default_factory=list)
+    # Winners per time slot for the current round (one list per slot, one winner per core)
+    slot_allocation: List[List[str]] = field(default_factory=list)
     negotiation_messages: List[Dict] = field(default_factory=list)
     coalition_formations: List[Dict] = field(default_factory=list)
     trust_updates: Dict[str, float] = field(default_factory=dict)
@@ -0,0 +1,359 @@
+"""
+State Backends - Pluggable storage for StateRepository evolution history.
+
+Backends append evolution records as they are produced and maintain the
+aggregates needed by StateRepository.get_evolution_summary, so long runs never
+need the whole history in memory and a crash keeps everything already written.
+"""
+
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional
+
+class EvolutionAggregates:
+    """
+    Incremental aggregates over evolution records (first/last/peak effectiveness,
+    trust mean trend and its sample standard deviation via Welford's algorithm).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.max_round = 0
+        self.initial_effectiveness = 0
+        self.final_effectiveness = 0
+        self.peak_effectiveness = 0
+        self.initial_trust_mean = 0.5
+        self.final_trust_mean = 0.5
+        self._trust_mean_avg = 0.0
+        self._trust_mean_m2 = 0.0
+
+    def update(self, record: Dict):
+        effectiveness = record['coordination_effectiveness']
+        trust_mean = record['trust_distribution']['mean']
+        self.count += 1
+        if self.count == 1:
+            self.max_round = record['round']
+            self.initial_effectiveness = effectiveness
+            self.peak_effectiveness = effectiveness
+            self.initial_trust_mean = trust_mean
+        else:
+            self.max_round = max(self.max_round, record['round'])
+            self.peak_effectiveness = max(self.peak_effectiveness, effectiveness)
+        self.final_effectiveness = effectiveness
+        self.final_trust_mean = trust_mean
+        delta = trust_mean - self._trust_mean_avg
+        self._trust_mean_avg += delta / self.count
+        self._trust_mean_m2 += delta * (trust_mean - self._trust_mean_avg)
+
+    def trust_volatility(self) -> float:
+        if self.count <= 1:
+            return 0.0
+        return (self._trust_mean_m2 / (self.count - 1)) ** 0.5
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'total_rounds': self.max_round,
+            'effectiveness_trend': {
+                'initial': self.initial_effectiveness,
+                'final': self.final_effectiveness,
+                'peak': self.peak_effectiveness
+            },
+            'trust_evolution': {
+                'initial_mean': self.initial_trust_mean,
+                'final_mean': self.final_trust_mean,
+                'volatility': self.trust_volatility()
+            }
+        }
+
+class StateHistoryBackend(ABC):
+    """
+    Storage interface for evolution records and labelled snapshots.
+    """
+
+    @abstractmethod
+    def append(self, record: Dict):
+        pass
+
+    @abstractmethod
+    def iter_records(self) -> Iterator[Dict]:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def put_snapshot(self, label: str, snapshot: Dict):
+        pass
+
+    @abstractmethod
+    def get_snapshots(self) -> Dict[str, Dict]:
+        pass
+
+    @abstractmethod
+    def summary(self) -> Dict[str, Any]:
+        """Evolution summary without the snapshot list; empty dict if no records"""
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+class InMemoryStateBackend(StateHistoryBackend):
+    """
+    Default backend: keeps records in a list, as StateRepository always has.
+    """
+
+    def __init__(self):
+        self.records: List[Dict] = []
+        self.snapshots: Dict[str, Dict] = {}
+        self.aggregates = EvolutionAggregates()
+
+    def append(self, record: Dict):
+        self.records.append(record)
+        self.aggregates.update(record)
+
+    def iter_records(self) -> Iterator[Dict]:
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def put_snapshot(self, label: str, snapshot: Dict):
+        self.snapshots[label] = snapshot
+
+    def get_snapshots(self) -> Dict[str, Dict]:
+        return self.snapshots
+
+    def summary(self) -> Dict[str, Any]:
+        return self.aggregates.summary() if self.aggregates.count else {}
+
+class JSONLStateBackend(StateHistoryBackend):
+    """
+    Append-only JSON Lines file. Every line is flushed to the OS immediately and
+    fsync'd every `fsync_interval` lines. Reopening an existing file replays it
+    to restore aggregates and snapshots.
+    """
+
+    def __init__(self, path: str, fsync_interval: int = 50):
+        self.path = path
+        self.fsync_interval = max(1, fsync_interval)
+        self.snapshots: Dict[str, Dict] = {}
+        self.aggregates = EvolutionAggregates()
+        self._unsynced = 0
+        if os.path.exists(path):
+            self._repair_tail()
+            for entry in self._iter_lines():
+                if entry.get("type") == "snapshot":
+                    self.snapshots[entry["label"]] = entry["snapshot"]
+                else:
+                    self.aggregates.update(entry["record"])
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _repair_tail(self):
+        """
+        Cut a torn final line from a crash back to the last newline, so the next
+        record starts on a line of its own. A complete entry that only lost its
+        newline is kept.
+        """
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if not data or data.endswith(b"\n"):
+                return
+            cut = data.rfind(b"\n") + 1
+            try:
+                json.loads(data[cut:])
+            except ValueError:
+                f.truncate(cut)
+            else:
+                f.write(b"\n")
+
+    def _iter_lines(self) -> Iterator[Dict]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A corrupt line is skipped, not fatal
+                    continue
+
+    def _write(self, entry: Dict):
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_interval:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def append(self, record: Dict):
+        self._write({"type": "record", "record": record})
+        self.aggregates.update(record)
+
+    def iter_records(self) -> Iterator[Dict]:
+        self._file.flush()
+        for entry in self._iter_lines():
+            if entry.get("type") == "record":
+                yield entry["record"]
+
+    def __len__(self) -> int:
+        return self.aggregates.count
+
+    def put_snapshot(self, label: str, snapshot: Dict):
+        self._write({"type": "snapshot", "label": label, "snapshot": snapshot})
+        self.snapshots[label] = snapshot
+
+    def get_snapshots(self) -> Dict[str, Dict]:
+        return self.snapshots
+
+    def summary(self) -> Dict[str, Any]:
+        return self.aggregates.summary() if self.aggregates.count else {}
+
+    def flush(self):
+        if not self._file.closed:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+class SQLiteStateBackend(StateHistoryBackend):
+    """
+    SQLite database in WAL mode with indexed round/phase columns. The summary is
+    computed with SQL queries over the indexed scalar columns.
+    """
+
+    def __init__(self, path: str, commit_interval: int = 50):
+        self.path = path
+        self.commit_interval = max(1, commit_interval)
+        self._uncommitted = 0
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS evolution (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                round INTEGER NOT NULL,
+                phase TEXT NOT NULL,
+                coordination_effectiveness REAL,
+                trust_mean REAL,
+                record TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_evolution_round ON evolution(round)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_evolution_phase ON evolution(phase)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                label TEXT PRIMARY KEY,
+                snapshot TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def append(self, record: Dict):
+        self._conn.execute(
+            "INSERT INTO evolution (round, phase, coordination_effectiveness, trust_mean, record) VALUES (?, ?, ?, ?, ?)",
+            (
+                record['round'],
+                record['phase'],
+                record['coordination_effectiveness'],
+                record['trust_distribution']['mean'],
+                json.dumps(record)
+            )
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_interval:
+            self.flush()
+
+    def iter_records(self) -> Iterator[Dict]:
+        self.flush()
+        cursor = self._conn.execute("SELECT record FROM evolution ORDER BY id")
+        for (payload,) in cursor:
+            yield json.loads(payload)
+
+    def iter_records_for(self, round_number: Optional[int] = None, phase: Optional[str] = None) -> Iterator[Dict]:
+        """Indexed lookup of records by round and/or phase"""
+        clauses, params = [], []
+        if round_number is not None:
+            clauses.append("round = ?")
+            params.append(round_number)
+        if phase is not None:
+            clauses.append("phase = ?")
+            params.append(phase)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        cursor = self._conn.execute(f"SELECT record FROM evolution{where} ORDER BY id", params)
+        for (payload,) in cursor:
+            yield json.loads(payload)
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM evolution").fetchone()[0]
+
+    def put_snapshot(self, label: str, snapshot: Dict):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO snapshots (label, snapshot) VALUES (?, ?)",
+            (label, json.dumps(snapshot))
+        )
+        self.flush()
+
+    def get_snapshots(self) -> Dict[str, Dict]:
+        return {label: json.loads(payload) for label, payload in self._conn.execute("SELECT label, snapshot FROM snapshots")}
+
+    def summary(self) -> Dict[str, Any]:
+        count, max_round, peak, trust_avg = self._conn.execute(
+            "SELECT COUNT(*), MAX(round), MAX(coordination_effectiveness), AVG(trust_mean) FROM evolution"
+        ).fetchone()
+        if not count:
+            return {}
+        initial_effectiveness, initial_trust = self._conn.execute(
+            "SELECT coordination_effectiveness, trust_mean FROM evolution ORDER BY id ASC LIMIT 1"
+        ).fetchone()
+        final_effectiveness, final_trust = self._conn.execute(
+            "SELECT coordination_effectiveness, trust_mean FROM evolution ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        volatility = 0.0
+        if count > 1:
+            squared_deviation = self._conn.execute(
+                "SELECT SUM((trust_mean - ?) * (trust_mean - ?)) FROM evolution", (trust_avg, trust_avg)
+            ).fetchone()[0]
+            volatility = (squared_deviation / (count - 1)) ** 0.5
+        return {
+            'total_rounds': max_round,
+            'effectiveness_trend': {
+                'initial': initial_effectiveness,
+                'final': final_effectiveness,
+                'peak': peak
+            },
+            'trust_evolution': {
+                'initial_mean': initial_trust,
+                'final_mean': final_trust,
+                'volatility': volatility
+            }
+        }
+
+    def flush(self):
+        self._conn.commit()
+        self._uncommitted = 0
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+def create_state_backend(kind: str = "memory", path: Optional[str] = None, **options) -> StateHistoryBackend:
+    """Build a backend by name: "memory", "jsonl" or "sqlite" """
+    if kind == "memory":
+        return InMemoryStateBackend()
+    if path is None:
+        raise ValueError(f"The '{kind}' state backend requires a path")
+    if kind == "jsonl":
+        return JSONLStateBackend(path, **options)
+    if kind == "sqlite":
+        return SQLiteStateBackend(path, **options)
+    raise ValueError(f"Unknown state backend '{kind}'")
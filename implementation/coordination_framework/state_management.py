@@ -4,8 +4,14 @@ State Management - Centralized state management for distributed coordination sys
 
 from typing import Dict, List, Any, Optional
 from coordination_framework.shared_types import ProcessorState, SystemState
+from coordination_framework.state_backends import StateHistoryBackend, InMemoryStateBackend
+from coordination_framework.incremental_metrics import IncrementalStateAggregator, StreamingVocabulary
+from coordination_framework.event_log import get_event_logger, DEBUG
 import json
 from datetime import datetime
+
+_event_log = get_event_logger()
+
 class StateValidator:
     """
     Validates state transitions and ensures system integrity.
@@ -147,65 +153,132 @@ class StateLogger:
     
     @staticmethod
     def log_phase_transition(old_phase: str, new_phase: str, round_number: int):
-        print(f"Round {round_number}: {old_phase} → {new_phase}")
+        _event_log.info("workflow", "phase_transition", "Round {round}: {old_phase} → {new_phase}",
+                        round=round_number, old_phase=old_phase, new_phase=new_phase)
     
     @staticmethod
     def log_processor_action(processor_id: str, action: str, details: Dict = None):
         """Log individual processor actions"""
         detail_str = f" ({details})" if details else ""
-        print(f"{processor_id}: {action}{detail_str}")
+        _event_log.debug("agent", "processor_action", "{processor_id}: {action}{detail_str}",
+                         processor_id=processor_id, action=action, detail_str=detail_str)
     
     @staticmethod
     def log_trust_update(processor_id: str, old_trust: float, new_trust: float, reason: str):
         """Log trust score changes"""
         direction = "↗" if new_trust > old_trust else "↘" if new_trust < old_trust else "->"
-        print(f"{processor_id}: Trust {old_trust:.2f} {direction} {new_trust:.2f} ({reason})")
+        _event_log.debug("trust", "trust_update", "{processor_id}: Trust {old_trust:.2f} {direction} {new_trust:.2f} ({reason})",
+                         processor_id=processor_id, old_trust=old_trust, direction=direction, new_trust=new_trust, reason=reason)
     
     @staticmethod
     def log_coalition_event(event_type: str, proposer: str, partners: List[str], success: bool = True):
         status = "Successful" if success else "Unsuccessful"
         partners_str = ", ".join(partners) if partners else "none"
-        print(f"{status} Coalition {event_type}: {proposer} + [{partners_str}]")
+        _event_log.info("coalition", "coalition_event", "{status} Coalition {event_type}: {proposer} + [{partners_str}]",
+                        status=status, event_type=event_type, proposer=proposer, partners_str=partners_str)
     
     @staticmethod
     def log_bidding_results(bids: Dict[str, float], winner: str):
         """Log bidding competition results"""
-        print(f"Bidding Results:")
+        if not _event_log.enabled(DEBUG, "bidding"):
+            return
+        _event_log.debug("bidding", "results", "Bidding Results:")
         for proc_id, bid in sorted(bids.items(), key=lambda x: x[1], reverse=True):
             winner_mark = "Win-Win situation" if proc_id == winner else "  "
-            print(f"  {winner_mark} {proc_id}: {bid:.2f}")
+            _event_log.debug("bidding", "result", "  {winner_mark} {processor_id}: {bid:.2f}",
+                             winner_mark=winner_mark, processor_id=proc_id, bid=bid)
     
     @staticmethod
     def log_system_summary(state: SystemState, active_count: int, completed_count: int):
         """Log system-level coordination summary"""
-        print(f"System Summary - Round {state.round_number}:")
-        print(f"  Active: {active_count}, Completed: {completed_count}")
-        print(f"  Phase: {state.current_phase}")
-        print(f"  Coalitions: {len(state.coalition_formations)}")
-        print(f"  Messages: {len(state.negotiation_messages)}")
+        _event_log.info(
+            "state", "system_summary",
+            "System Summary - Round {round}:\n  Active: {active}, Completed: {completed}\n"
+            "  Phase: {phase}\n  Coalitions: {coalitions}\n  Messages: {messages}",
+            round=state.round_number, active=active_count, completed=completed_count, phase=state.current_phase,
+            coalitions=len(state.coalition_formations), messages=len(state.negotiation_messages)
+        )
 
 class StateMetrics:
     """
     Calculates detailed metrics for coordination system performance analysis.
+
+    `processors` may map ids to agents or directly to ProcessorState objects.
     """
     
+    @staticmethod
+    def _processor_states(processors: Dict) -> List[ProcessorState]:
+        return [getattr(p, 'state', p) for p in processors.values()]
+    
     @staticmethod
     def calculate_coordination_effectiveness(state: SystemState, processors: Dict) -> float:
-        trust_scores = [p.trust_score for p in processors.values()]
+        processor_states = StateMetrics._processor_states(processors)
+        trust_scores = [p.trust_score for p in processor_states]
         trust_variance = StateAnalytics._calculate_std(trust_scores) ** 2
         coalition_score = min(1.0, len(state.coalition_formations) / 10.0)
-        total_burst = sum(p.state.true_burst_time for p in processors.values())
-        total_executed = sum(getattr(p.state, 'execution_slots_used', 0) for p in processors.values())
+        total_burst = sum(p.true_burst_time for p in processor_states)
+        total_executed = sum(getattr(p, 'execution_slots_used', 0) for p in processor_states)
         execution_efficiency = total_executed / total_burst if total_burst > 0 else 0
         effectiveness = (trust_variance * 0.3 + coalition_score * 0.3 + execution_efficiency * 0.4)
         return min(1.0, effectiveness)
     
+    @staticmethod
+    def calculate_core_utilisation(execution_history: List[Dict], cores: int = 1) -> Dict[str, Any]:
+        """
+        Busy fraction of each execution unit over the time slots in which
+        anything ran; throughput is processor-slots completed per time slot.
+        """
+        time_slots = max((execution['time_slot'] for execution in execution_history), default=-1) + 1
+        busy = [0] * cores
+        for execution in execution_history:
+            busy[execution.get('core', 0)] += 1
+        return {
+            'cores': cores,
+            'time_slots': time_slots,
+            'busy_core_slots': len(execution_history),
+            'core_utilisation': len(execution_history) / (cores * time_slots) if time_slots else 0.0,
+            'per_core_utilisation': [count / time_slots if time_slots else 0.0 for count in busy],
+            'throughput': len(execution_history) / time_slots if time_slots else 0.0
+        }
+    
+    @staticmethod
+    def calculate_responsiveness(execution_history: List[Dict], processors: Dict) -> Dict[str, float]:
+        """
+        Per-processor response time (time slot of first execution) and
+        turnaround (slot after the last one, for completed processors), from
+        a common start at slot 0, averaged over the fleet, plus how evenly
+        completed processors were slowed down.
+        """
+        first_slot = {}
+        last_slot = {}
+        for execution in execution_history:
+            first_slot.setdefault(execution['processor_id'], execution['time_slot'])
+            last_slot[execution['processor_id']] = execution['time_slot']
+        states = {proc_id: getattr(p, 'state', p) for proc_id, p in processors.items()}
+        completed = [
+            proc_id for proc_id, state in states.items()
+            if proc_id in last_slot and getattr(state, 'execution_slots_used', 0) >= state.true_burst_time
+        ]
+        response = list(first_slot.values())
+        turnaround = [last_slot[proc_id] + 1 for proc_id in completed]
+        waiting = [last_slot[proc_id] + 1 - states[proc_id].true_burst_time for proc_id in completed]
+        slowdown = [(last_slot[proc_id] + 1) / states[proc_id].true_burst_time for proc_id in completed]
+        return {
+            'mean_response_time': sum(response) / len(response) if response else 0.0,
+            'max_response_time': max(response, default=0),
+            'mean_turnaround': sum(turnaround) / len(turnaround) if turnaround else 0.0,
+            'mean_waiting_time': sum(waiting) / len(waiting) if waiting else 0.0,
+            # Jain's index of turnaround / burst time: 1.0 when every processor is slowed down equally
+            'slowdown_fairness': sum(slowdown) ** 2 / (len(slowdown) * sum(x * x for x in slowdown)) if slowdown else 1.0,
+            'never_executed': len(states) - len(first_slot)
+        }
+    
     @staticmethod
     def calculate_trust_stability(processors: Dict) -> float:
         trust_changes = []
         
-        for processor in processors.values():
-            history = processor.state.reputation_history
+        for processor_state in StateMetrics._processor_states(processors):
+            history = processor_state.reputation_history
             if len(history) >= 2:
                 recent_changes = [abs(h.get('trust_change', 0)) for h in history[-5:]]
                 avg_change = sum(recent_changes) / len(recent_changes)
@@ -218,7 +291,11 @@ class StateMetrics:
         return stability
     
     @staticmethod
-    def calculate_strategic_diversity(state: SystemState) -> float:
+    def calculate_strategic_diversity(state: SystemState, vocabulary: Optional[StreamingVocabulary] = None) -> float:
+        """Vocabulary richness of negotiation messages; pass a StreamingVocabulary fed
+        as messages are appended to avoid re-tokenising them"""
+        if vocabulary is not None:
+            return vocabulary.diversity()
         if not state.negotiation_messages:
             return 0.0
         unique_words = set()
@@ -234,7 +311,7 @@ class StateMetrics:
     @staticmethod
     def calculate_emergence_indicators(state: SystemState, processors: Dict) -> Dict[str, float]:
         indicators = {}
-        trust_scores = [p.trust_score for p in processors.values()]
+        trust_scores = [p.trust_score for p in StateMetrics._processor_states(processors)]
         trust_range = max(trust_scores) - min(trust_scores) if trust_scores else 0
         indicators['trust_stratification'] = trust_range
         coalition_count = len(state.coalition_formations)
@@ -249,15 +326,35 @@ class StateMetrics:
 class StateRepository:
     """
     Manages persistent storage and retrieval of coordination state history.
+
+    Records go to a pluggable StateHistoryBackend (in-memory by default, or
+    append-only JSONL / SQLite for long runs). With incremental=True records
+    are built from delta-updated aggregators instead of full rescans, and
+    vocabulary_mode="approximate" swaps the exact word set for a sketch.
     """
     
-    def __init__(self):
-        self.history = []
-        self.snapshots = {}
+    def __init__(self, backend: Optional[StateHistoryBackend] = None, incremental: bool = False,
+                 vocabulary_mode: str = "exact", vocabulary_error: float = 0.01):
+        self.backend = backend if backend is not None else InMemoryStateBackend()
+        self.aggregator = None
+        if incremental:
+            vocabulary = StreamingVocabulary(mode=vocabulary_mode, relative_error=vocabulary_error)
+            self.aggregator = IncrementalStateAggregator(vocabulary)
+    
+    @property
+    def history(self) -> List[Dict]:
+        """All evolution records; materialises the list for persistent backends"""
+        if isinstance(self.backend, InMemoryStateBackend):
+            return self.backend.records
+        return list(self.backend.iter_records())
+    
+    @property
+    def snapshots(self) -> Dict[str, Dict]:
+        return self.backend.get_snapshots()
     
     def save_state_snapshot(self, state: SystemState, label: str):
         snapshot = {
-            'timestamp': len(self.history),
+            'timestamp': len(self.backend),
             'round': state.round_number,
             'phase': state.current_phase,
             'processor_count': len(state.processors),
@@ -265,9 +362,17 @@ class StateRepository:
             'message_count': len(state.negotiation_messages),
             'label': label
         }
-        self.snapshots[label] = snapshot
+        self.backend.put_snapshot(label, snapshot)
     
-    def record_state_evolution(self, state: SystemState, processors: Dict):
+    def record_state_evolution(self, state: SystemState, processors: Dict, changed_processors: Optional[List[str]] = None):
+        """
+        Append an evolution record. In incremental mode only `changed_processors`
+        are re-read (all processors when None).
+        """
+        if self.aggregator is not None:
+            self.aggregator.update(state, changed_processors)
+            self.backend.append(self.aggregator.build_record(state))
+            return
         record = {
             'round': state.round_number,
             'phase': state.current_phase,
@@ -277,44 +382,42 @@ class StateRepository:
             'coordination_effectiveness': StateMetrics.calculate_coordination_effectiveness(state, processors),
             'emergence_indicators': StateMetrics.calculate_emergence_indicators(state, processors)
         }
-        self.history.append(record)
+        self.backend.append(record)
     
     def get_evolution_summary(self) -> Dict[str, Any]:
-        if not self.history:
+        summary = self.backend.summary()
+        if not summary:
             return {"error": "No history recorded"}
-        rounds = [r['round'] for r in self.history]
-        effectiveness = [r['coordination_effectiveness'] for r in self.history]
-        trust_means = [r['trust_distribution']['mean'] for r in self.history]
-        
-        return {
-            'total_rounds': max(rounds) if rounds else 0,
-            'effectiveness_trend': {
-                'initial': effectiveness[0] if effectiveness else 0,
-                'final': effectiveness[-1] if effectiveness else 0,
-                'peak': max(effectiveness) if effectiveness else 0
-            },
-            'trust_evolution': {
-                'initial_mean': trust_means[0] if trust_means else 0.5,
-                'final_mean': trust_means[-1] if trust_means else 0.5,
-                'volatility': StateAnalytics._calculate_std(trust_means)
-            },
-            'snapshots': list(self.snapshots.keys())
-        }
+        summary['snapshots'] = list(self.snapshots.keys())
+        return summary
     
     def export_history(self, filename: str = None):
-        export_data = {
-            'metadata': {
-                'export_time': datetime.now().isoformat(),
-                'total_records': len(self.history),
-                'snapshots': len(self.snapshots)
-            },
-            'history': self.history,
-            'snapshots': self.snapshots
+        snapshots = self.snapshots
+        metadata = {
+            'export_time': datetime.now().isoformat(),
+            'total_records': len(self.backend),
+            'snapshots': len(snapshots)
         }
         
         if filename:
+            # Stream records one at a time instead of building the whole document
             with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2)
+                f.write('{\n  "metadata": ')
+                f.write(json.dumps(metadata))
+                f.write(',\n  "history": [')
+                for i, record in enumerate(self.backend.iter_records()):
+                    f.write(',\n    ' if i else '\n    ')
+                    f.write(json.dumps(record))
+                f.write('\n  ],\n  "snapshots": ')
+                f.write(json.dumps(snapshots))
+                f.write('\n}\n')
             return f"History exported to {filename}"
         else:
-            return export_data
\ No newline at end of file
+            return {
+                'metadata': metadata,
+                'history': self.history,
+                'snapshots': snapshots
+            }
+    
+    def close(self):
+        self.backend.close()
@@ -2,22 +2,100 @@
 System Coordinator - Main coordination orchestration for distributed processor system.
 """
 
+import heapq
 import random
-from typing import Dict, List, Any
-from langgraph.graph import StateGraph, END
+import numpy as np
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 # from coordination_framework.state_management import SystemState
-from agents.processor_agent import ProcessorLLMAgent
+from agents.processor_agent import AgentMemoryManager, ProcessorLLMAgent
 from coordination_framework.shared_types import SystemState
+from coordination_framework.state_management import StateMetrics, StateRepository
 from agents.agent_behaviors import TrustBasedBehavior, CompetitiveBiddingBehavior
+from agents.deception_detector import DeceptivePatternDetector
+from coordination_framework.trust_engine import BatchTrustEngine, PATTERN_NAMES, PATTERN_SEVERITY
+from coordination_framework.relationship_store import RelationshipStore
+from coordination_framework.coalition_registry import CoalitionRegistry
+from coordination_framework.peer_state import PeerStateTable
+from coordination_framework.scheduling import QuantumController, SchedulingConfig
+from coordination_framework.sharding import ShardMap
+from coordination_framework.event_log import get_event_logger, DEBUG
+from coordination_framework.tracing import ChromeTracer, get_tracer, set_tracer
+from coordination_framework.profiling import PhaseProfiler, set_phase_profiler
+from coordination_framework.memory_tracking import MemoryTracker, set_memory_tracker
+
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
+
+_event_log = get_event_logger()
 
 class DistributedCoordinationSystem:
-    def __init__(self, processors: List[ProcessorLLMAgent]):
+    def __init__(self, processors: List[ProcessorLLMAgent], trust_engine: str = "scalar",
+                 pattern_window: int = 5, pattern_decay: float = 1.0,
+                 state_repository: Optional[StateRepository] = None, seed: Optional[int] = None,
+                 max_rounds: int = 50, partner_ranking: str = "scalar",
+                 scheduling: Optional[SchedulingConfig] = None):
         self.processors = {proc.state.processor_id: proc for proc in processors}
+        self.max_rounds = max_rounds
+        self.scheduling = scheduling if scheduling is not None else SchedulingConfig()
+        self.quantum_controller = QuantumController(self.scheduling)
+        self.seed = seed
+        self.rng = random.Random(seed) if seed is not None else random
+        if seed is not None:
+            # Each agent gets its own stream so trajectories don't depend on call order
+            for proc_id, processor in self.processors.items():
+                processor.rng = random.Random(f"{seed}:{proc_id}")
         self.system_state = SystemState(
             processors=[proc.state for proc in processors]
         )
         self.execution_history = [] 
-        self.workflow = self._build_coordination_workflow()
+        # Time slots in which at least one core executed, and each processor's core in the last one
+        self.time_slots_executed = 0
+        self._core_assignment: Dict[str, int] = {}
+        self.phase_profile = None
+        self.memory_profile = None
+        self.state_repository = state_repository
+        self.pattern_detector_config = {"window": pattern_window, "decay": pattern_decay}
+        self.pattern_detectors: Dict[str, DeceptivePatternDetector] = {}
+        self.batch_trust_engine = None
+        if trust_engine == "batched":
+            if pattern_decay != 1.0:
+                raise ValueError("The batched trust engine only supports pattern_decay=1.0")
+            self.batch_trust_engine = BatchTrustEngine(list(self.processors.keys()), window=pattern_window)
+            for proc_id, processor in self.processors.items():
+                self.batch_trust_engine.load_history(proc_id, processor.state.reputation_history)
+        elif trust_engine != "scalar":
+            raise ValueError(f"Unknown trust engine '{trust_engine}'")
+        # Coalition membership lives here; each agent's coalition_members is a live read-only view
+        self.coalitions = CoalitionRegistry(self.processors.keys())
+        for proc_id, processor in self.processors.items():
+            if processor.state.coalition_members:
+                self.coalitions.form(proc_id, processor.state.coalition_members)
+        for proc_id, processor in self.processors.items():
+            processor.state.coalition_members = self.coalitions.view(proc_id)
+        if partner_ranking not in ("scalar", "batched"):
+            raise ValueError(f"Unknown partner ranking '{partner_ranking}'")
+        # Batched ranking scores coalition partners from one shared table instead of per-agent dicts
+        self.peer_table = PeerStateTable(self.processors.keys(), self.coalitions) if partner_ranking == "batched" else None
+        for processor in self.processors.values():
+            processor.peer_table = self.peer_table
+        # Hierarchical auctions bid and observe within shards of the fleet
+        self.shard_map = None
+        if self.scheduling.auction == "hierarchical":
+            self.shard_map = ShardMap(self.processors.keys(), self.scheduling.shard_size,
+                                      self.scheduling.shard_by, self.coalitions)
+        self.shard_winners: Dict[int, List[str]] = {}
+        # Pairwise relationships live here; each agent's memory manager reads and writes its own row
+        self.relationship_store = RelationshipStore(self.processors.keys())
+        for processor in self.processors.values():
+            processor.memory_manager = AgentMemoryManager(processor, self.relationship_store)
+        self._workflow = None
+
+    @property
+    def workflow(self):
+        """Compiled LangGraph workflow, built (and langgraph imported) on first use"""
+        if self._workflow is None:
+            self._workflow = self._build_coordination_workflow()
+        return self._workflow
 
     def _get_active_processors_only(self) -> Dict[str, ProcessorLLMAgent]:
         """
@@ -34,11 +112,13 @@ class DistributedCoordinationSystem:
         Validates that a processor can participate in coordination.
         """
         if proc_id not in self.processors:
-            print(f"VIOLATION: Unknown processor {proc_id} attempted {activity}")
+            _event_log.warning("workflow", "participation_violation", "VIOLATION: Unknown processor {processor_id} attempted {activity}",
+                               processor_id=proc_id, activity=activity)
             return False
             
         if self._is_processor_completed(self.processors[proc_id]):
-            print(f"VIOLATION: Completed processor {proc_id} attempted {activity} - REJECTED")
+            _event_log.warning("workflow", "participation_violation", "VIOLATION: Completed processor {processor_id} attempted {activity} - REJECTED",
+                               processor_id=proc_id, activity=activity)
             return False
             
         return True
@@ -57,12 +137,11 @@ class DistributedCoordinationSystem:
                 remaining = self._get_remaining_time(processor)
                 active_processors.append(f"{proc_id}({remaining} slots)")
         
-        print(f"\n Round {round_num} Status:")
-        print(f"Active processors: {active_processors}")
-        print(f"Completed processors: {completed_processors}")
+        _event_log.info("workflow", "round_status", "\n Round {round} Status:\nActive processors: {active}\nCompleted processors: {completed}",
+                        round=round_num, active=active_processors, completed=completed_processors)
         
         if completed_processors:
-            print(f"Completed processors are EXCLUDED from all coordination activities")
+            _event_log.info("workflow", "completed_excluded", "Completed processors are EXCLUDED from all coordination activities")
         
         return len([p for p in active_processors if isinstance(p, str)])
 
@@ -74,21 +153,76 @@ class DistributedCoordinationSystem:
             processor.state.execution_slots_used = 0
         return max(0, processor.state.true_burst_time - processor.state.execution_slots_used)
     
-    def _execute_processor_for_one_slot(self, processor: ProcessorLLMAgent):
+    def _execute_processor_for_one_slot(self, processor: ProcessorLLMAgent, time_slot: Optional[int] = None, core: int = 0):
+        tracer = get_tracer()
+        with tracer.span("execute_slot", "execution", processor_id=processor.state.processor_id):
+            self._execute_slot(processor, tracer, time_slot, core)
+
+    def _execute_slot(self, processor: ProcessorLLMAgent, tracer, time_slot: Optional[int] = None, core: int = 0):
         if not hasattr(processor.state, 'execution_slots_used'):
             processor.state.execution_slots_used = 0
-        current_time_slot = len(self.execution_history) 
+        current_time_slot = len(self.execution_history) if time_slot is None else time_slot
         self.execution_history.append({
             'time_slot': current_time_slot,
-            'processor_id': processor.state.processor_id
+            'processor_id': processor.state.processor_id,
+            'core': core
         })
         processor.state.execution_slots_used += 1
         remaining = self._get_remaining_time(processor)
+        if self.scheduling.cores > 1:
+            tracer.simulated_slot(processor.state.processor_id, current_time_slot, remaining=remaining, core=core)
+        else:
+            tracer.simulated_slot(processor.state.processor_id, current_time_slot, remaining=remaining)
     
         if remaining <= 0:
-            print(f"Time slot {current_time_slot}: {processor.state.processor_id} executes and COMPLETES!")
+            _event_log.info("execution", "slot_executed", "Time slot {time_slot}: {processor_id} executes and COMPLETES!",
+                            time_slot=current_time_slot, processor_id=processor.state.processor_id, remaining=remaining)
         else:
-            print(f"Time slot {current_time_slot}: {processor.state.processor_id} executes ({remaining} slots remaining)")
+            _event_log.info("execution", "slot_executed", "Time slot {time_slot}: {processor_id} executes ({remaining} slots remaining)",
+                            time_slot=current_time_slot, processor_id=processor.state.processor_id, remaining=remaining)
+
+    def _assign_cores(self, winners: List[str]) -> Dict[str, int]:
+        """
+        Core for each winner of a time slot: processors that ran in the previous
+        slot keep their core, the rest take the lowest free ones.
+        """
+        assignment = {proc_id: self._core_assignment[proc_id] for proc_id in winners if proc_id in self._core_assignment}
+        free_cores = iter(sorted(set(range(self.scheduling.cores)) - set(assignment.values())))
+        for proc_id in winners:
+            if proc_id not in assignment:
+                assignment[proc_id] = next(free_cores)
+        self._core_assignment = assignment
+        return assignment
+
+    def throughput_metrics(self) -> Dict[str, Any]:
+        """Core utilisation and completed work per time slot over the executed schedule"""
+        return StateMetrics.calculate_core_utilisation(self.execution_history, self.scheduling.cores)
+
+    def scheduling_report(self) -> Dict[str, Any]:
+        """
+        Coordination overhead (auctions, agent decisions per executed slot)
+        next to responsiveness (slots until first execution and completion)
+        for the quantum this run used.
+        """
+        granted = self.quantum_controller.granted
+        slots = len(self.execution_history)
+        llm_calls = sum(getattr(processor, 'llm_calls', 0) for processor in self.processors.values())
+        report = {
+            'quantum': self.scheduling.slots_per_round,
+            'adaptive_quantum': self.scheduling.adaptive_quantum,
+            'auctions': len(granted),
+            'mean_quantum': sum(granted) / len(granted) if granted else 0.0,
+            'max_quantum_granted': max(granted, default=0),
+            'time_slots': self.time_slots_executed,
+            'executed_slots': slots,
+            'llm_calls': llm_calls,
+            'llm_calls_per_slot': llm_calls / slots if slots else 0.0,
+            'slots_per_auction': self.time_slots_executed / len(granted) if granted else 0.0,
+            'auction': self.scheduling.auction,
+            'shards': self.shard_map.shard_count if self.shard_map is not None else 1
+        }
+        report.update(StateMetrics.calculate_responsiveness(self.execution_history, self.processors))
+        return report
 
     def _process_coalitions_strict(self, state: SystemState):
         """
@@ -100,38 +234,53 @@ class DistributedCoordinationSystem:
             proposer = formation["proposer"]
             partners = formation["partners"]
             if proposer not in active_processors:
-                print(f"Coalition from {proposer} rejected: proposer not active")
+                _event_log.info("coalition", "coalition_rejected", "Coalition from {proposer} rejected: proposer not active", proposer=proposer)
                 continue
             active_partners = []
             for partner in partners:
                 if partner in active_processors:
                     active_partners.append(partner)
                 else:
-                    print(f"Partner {partner} excluded from coalition: not active")
+                    _event_log.info("coalition", "partner_excluded", "Partner {partner} excluded from coalition: not active", partner=partner)
             if active_partners:
                 accepted_partners = []
                 for partner in active_partners:
-                    if random.random() > 0.5:
+                    if self.rng.random() > 0.5:
                         accepted_partners.append(partner)
+                        self._record_relationship(proposer, partner, "coalition", "success")
+                        self._record_relationship(partner, proposer, "coalition", "success")
+                    else:
+                        self._record_relationship(proposer, partner, "coalition", "rejected")
                 
                 if accepted_partners:
-                    self.processors[proposer].state.coalition_members = accepted_partners
-                    for partner in accepted_partners:
-                        if partner in active_processors: 
-                            self.processors[partner].state.coalition_members.append(proposer)
-                    
-                    print(f"Coalition formed: {proposer} + {accepted_partners}")
+                    coalition_id = self.coalitions.form(proposer, accepted_partners)
+                    _event_log.info("coalition", "coalition_formed", "Coalition formed: {proposer} + {partners}",
+                                    proposer=proposer, partners=accepted_partners, coalition_id=coalition_id)
                 else:
-                    print(f"Coalition proposal from {proposer} rejected by all partners")
+                    _event_log.info("coalition", "coalition_rejected", "Coalition proposal from {proposer} rejected by all partners", proposer=proposer)
             else:
-                print(f"Coalition proposal from {proposer} has no active partners")
+                _event_log.info("coalition", "coalition_rejected", "Coalition proposal from {proposer} has no active partners", proposer=proposer)
+
+    def _record_relationship(self, observer_id: str, subject_id: str, interaction_type: str, outcome: str):
+        self.processors[observer_id].memory_manager.update_relationship_model(subject_id, interaction_type, outcome)
+
+    def _record_claim_verdicts(self, verdicts: Dict[str, bool]):
+        """Coalition partners of each executed processor learn whether its claim held up"""
+        for proc_id, honest in verdicts.items():
+            for ally_id in self.coalitions.members(proc_id):
+                if ally_id != proc_id:
+                    self._record_relationship(ally_id, proc_id, "execution", "reliable" if honest else "deception")
 
     def _update_trust_scores(self, state: SystemState):
         """
         Update trust scores with severe penalties for deception.
         Update trust scores for ACTIVE processors.
         """
+        if self.batch_trust_engine is not None:
+            self._update_trust_scores_batched(state)
+            return
         executed_processors = set(state.execution_order) if state.execution_order else set()
+        verdicts = {}
         for proc_id, processor in self.processors.items():
             if self._is_processor_completed(processor):
                 continue
@@ -148,17 +297,13 @@ class DistributedCoordinationSystem:
                 bias_level=processor.state.bias_level
             )
             new_trust = processor.state.trust_score + trust_update
-            pattern_analysis = trust_behavior.detect_deceptive_pattern(
-                processor.state.reputation_history
-            )
+            pattern_detector = self._get_pattern_detector(proc_id)
+            pattern_analysis = pattern_detector.classify()
             final_trust = trust_behavior.apply_pattern_penalty(new_trust, pattern_analysis)
             old_trust = processor.state.trust_score
             processor.state.trust_score = max(0.0, min(1.0, final_trust))
-            status = "ACTIVE"
-            reason = self._determine_trust_change_reason(trust_update, pattern_analysis)
-            
-            if abs(processor.state.trust_score - old_trust) > 0.01:
-                print(f"  {proc_id} ({status}): {old_trust:.2f} → {processor.state.trust_score:.2f} ({reason})")
+            if abs(processor.state.trust_score - old_trust) > 0.01 and _event_log.enabled(DEBUG, "trust"):
+                self._log_trust_change(proc_id, old_trust, processor.state.trust_score, trust_update, pattern_analysis)
             processor.state.reputation_history.append({
                 "round": state.round_number,
                 "claimed_burst_time": processor.state.claimed_burst_time,
@@ -167,6 +312,78 @@ class DistributedCoordinationSystem:
                 "trust_score": processor.state.trust_score,
                 "pattern": pattern_analysis.get("pattern", "unknown")
             })
+            pattern_detector.observe(processor.state.claimed_burst_time, actual_remaining_before_execution)
+            if proc_id in executed_processors:
+                verdicts[proc_id] = trust_update >= 0
+        self._record_claim_verdicts(verdicts)
+
+    def _get_pattern_detector(self, proc_id: str) -> DeceptivePatternDetector:
+        """Streaming deception detector for a processor, seeded from its reputation history"""
+        detector = self.pattern_detectors.get(proc_id)
+        if detector is None:
+            detector = DeceptivePatternDetector.from_history(
+                self.processors[proc_id].state.reputation_history,
+                **self.pattern_detector_config
+            )
+            self.pattern_detectors[proc_id] = detector
+        return detector
+
+    def _update_trust_scores_batched(self, state: SystemState):
+        """
+        Same trust update as _update_trust_scores, computed for all active
+        processors in one vectorised pass of the batch trust engine.
+        """
+        executed_processors = set(state.execution_order) if state.execution_order else set()
+        proc_ids, states, actual = [], [], []
+        for proc_id, processor in self.processors.items():
+            processor_state = processor.state
+            remaining = processor_state.true_burst_time - getattr(processor_state, 'execution_slots_used', 0)
+            if remaining <= 0:
+                continue
+            proc_ids.append(proc_id)
+            states.append(processor_state)
+            actual.append(remaining + (1 if proc_id in executed_processors else 0))
+        if not proc_ids:
+            return
+        claimed = [s.claimed_burst_time for s in states]
+        old_trust = np.fromiter((s.trust_score for s in states), dtype=np.float64, count=len(states))
+        result = self.batch_trust_engine.step(
+            proc_ids,
+            old_trust,
+            claimed,
+            actual,
+            [s.bias_level for s in states]
+        )
+        final_trust = result["final_trust"].tolist()
+        trust_change = (result["final_trust"] - old_trust).tolist()
+        patterns = [PATTERN_NAMES[p] for p in result["pattern"].tolist()]
+        if _event_log.enabled(DEBUG, "trust"):
+            for i in np.flatnonzero(np.abs(result["final_trust"] - old_trust) > 0.01).tolist():
+                pattern_analysis = {"pattern": patterns[i], "severity": float(PATTERN_SEVERITY[result["pattern"][i]])}
+                self._log_trust_change(proc_ids[i], float(old_trust[i]), final_trust[i],
+                                       float(result["trust_update"][i]), pattern_analysis)
+        self._record_claim_verdicts({
+            proc_ids[i]: update >= 0 for i, update in enumerate(result["trust_update"].tolist())
+            if proc_ids[i] in executed_processors
+        })
+        round_number = state.round_number
+        for i, processor_state in enumerate(states):
+            processor_state.trust_score = final_trust[i]
+            processor_state.reputation_history.append({
+                "round": round_number,
+                "claimed_burst_time": claimed[i],
+                "actual_remaining": actual[i],
+                "trust_change": trust_change[i],
+                "trust_score": final_trust[i],
+                "pattern": patterns[i]
+            })
+
+    def _log_trust_change(self, proc_id: str, old_trust: float, new_trust: float, trust_update: float, pattern_analysis: Dict):
+        reason = self._determine_trust_change_reason(trust_update, pattern_analysis)
+        _event_log.debug("trust", "trust_changed", "  {processor_id} (ACTIVE): {old_trust:.2f} → {new_trust:.2f} ({reason})",
+                         processor_id=proc_id, old_trust=old_trust, new_trust=new_trust,
+                         pattern=pattern_analysis.get("pattern", "unknown"), reason=reason)
+
     def _determine_trust_change_reason(self, trust_update: float, pattern_analysis: Dict) -> str:
         pattern = pattern_analysis.get("pattern", "unknown")
         
@@ -188,22 +405,56 @@ class DistributedCoordinationSystem:
         Calculate bids using enhanced behavior with severe trust penalties.
         This ensures aggressive processors with low trust get severely handicapped.
         """
-        bids = {}
+        return self._run_auction(self._get_active_processors_only(), context)
+
+    def calculate_hierarchical_bids(self, context: Dict) -> Dict[str, float]:
+        """
+        Two-level auction: every shard bids among its own active members and
+        its top `cores` bidders go through to a final auction, where they
+        re-bid against the other shard winners so competition is judged
+        against one common field. Returns the final-auction bids (finalists
+        only, in fleet order); each shard's winners are kept in shard_winners.
+        """
         active_processors = self._get_active_processors_only()
+        cores = self.scheduling.cores
+        self.shard_winners = {}
+        for shard, members in self.shard_map.partition(active_processors).items():
+            shard_bids = self._run_auction({proc_id: active_processors[proc_id] for proc_id in members}, context)
+            self.shard_winners[shard] = heapq.nlargest(cores, shard_bids, key=shard_bids.get)
+        finalist_ids = {proc_id for winners in self.shard_winners.values() for proc_id in winners}
+        finalists = {proc_id: proc for proc_id, proc in active_processors.items() if proc_id in finalist_ids}
+        _event_log.info("bidding", "shard_winners", "{finalists} shard winners from {shards} shards go to the final auction",
+                        finalists=len(finalists), shards=len(self.shard_winners))
+        return self._run_auction(finalists, context)
+
+    def _competing_peers(self, proc_id: str, active_processors: Dict[str, ProcessorLLMAgent]) -> List[str]:
+        """
+        Other active processors this one claims, negotiates and forms coalitions
+        against: the whole active fleet, or only its shard with hierarchical auctions.
+        """
+        if self.shard_map is None:
+            return [other_id for other_id in active_processors if other_id != proc_id]
+        return [peer_id for peer_id in self.shard_map.peers(proc_id) if peer_id in active_processors]
+
+    def _run_auction(self, bidders: Dict[str, ProcessorLLMAgent], context: Dict) -> Dict[str, float]:
+        """Effective bid of every bidder, each judging competition against the other bidders"""
+        bids = {}
+        log_bids = _event_log.enabled(DEBUG, "bidding")
+        entries = [
+            {
+                "id": proc_id,
+                "trust": proc.state.trust_score,
+                "remaining_time": self._get_remaining_time(proc)
+            }
+            for proc_id, proc in bidders.items()
+        ]
         
-        for proc_id, processor in active_processors.items():
+        for proc_id, processor in bidders.items():
             bidding_behavior = CompetitiveBiddingBehavior(processor)
             bidding_context = {
                 **context,
                 "current_round": context.get("round_number", 0),
-                "competitors": [
-                    {
-                        "id": other_id,
-                        "trust": other_proc.state.trust_score,
-                        "remaining_time": self._get_remaining_time(other_proc)
-                    }
-                    for other_id, other_proc in active_processors.items() if other_id != proc_id
-                ]
+                "competitors": [entry for entry in entries if entry["id"] != proc_id]
             }
             bid_result = bidding_behavior.execute({
                 "action": "calculate_bid",
@@ -214,26 +465,34 @@ class DistributedCoordinationSystem:
             fairness_bonus = bid_result.get("fairness_bonus", 0)
             rationale = bid_result.get("strategy_rationale", "")
             bids[proc_id] = effective_bid
+            if not log_bids:
+                continue
             remaining = self._get_remaining_time(processor)
-            print(f"{proc_id}: bids {effective_bid:.2f} (trust: {processor.state.trust_score:.2f}, remaining: {remaining})")
+            _event_log.debug("bidding", "bid", "{processor_id}: bids {bid:.2f} (trust: {trust:.2f}, remaining: {remaining})",
+                             processor_id=proc_id, bid=effective_bid, trust=processor.state.trust_score, remaining=remaining)
             
             if trust_penalty > 0.5:
-                print(f"TRUST PENALTY: {trust_penalty*100:.1f}% - {rationale}")
+                _event_log.debug("bidding", "trust_penalty", "TRUST PENALTY: {penalty_pct:.1f}% - {rationale}",
+                                 processor_id=proc_id, penalty_pct=trust_penalty * 100, rationale=rationale)
             if fairness_bonus > 5:
-                print(f"FAIRNESS BONUS: +{fairness_bonus:.1f}")
+                _event_log.debug("bidding", "fairness_bonus", "FAIRNESS BONUS: +{bonus:.1f}",
+                                 processor_id=proc_id, bonus=fairness_bonus)
         
         return bids
 
 
     def _update_processor_observations(self, state: SystemState):
         """
-        Update observations for active processors only.
+        Update observations for active processors only. With hierarchical
+        auctions each processor observes its shard peers only.
         """
         active_processors = self._get_active_processors_only()
         
         for proc_id, processor in active_processors.items():
             observations = {}
-            for other_id, other_proc in self.processors.items():
+            peer_ids = self.processors if self.shard_map is None else self.shard_map.peers(proc_id)
+            for other_id in peer_ids:
+                other_proc = self.processors[other_id]
                 if other_id != proc_id:
                     observations[other_id] = {
                         "claimed_burst": other_proc.state.claimed_burst_time,
@@ -245,21 +504,89 @@ class DistributedCoordinationSystem:
                     }
             
             processor.update_observations(observations)
+        
+        if self.peer_table is not None:
+            self.peer_table.update(
+                (processor.state.trust_score for processor in self.processors.values()),
+                (self._get_remaining_time(processor) for processor in self.processors.values())
+            )
 
-    def run_coordination_simulation(self):
+    def _record_round_evolution(self, state: SystemState, changed_processors: List[str]):
+        """Record this round in the attached StateRepository, if any"""
+        if self.state_repository is not None:
+            self.state_repository.record_state_evolution(state, self.processors, changed_processors)
+
+    def run_coordination_simulation(self, trace_path: Optional[str] = None, profile=None, memory=None):
+        """
+        Run the workflow to completion. trace_path writes a Chrome trace-event
+        JSON file (open it in Perfetto) covering phases, LLM calls and slots.
+        profile enables per-phase profiling: True for cProfile on every phase,
+        a list of phase names, or a configured PhaseProfiler (e.g. memory=True).
+        The aggregated report is printed and kept in self.phase_profile.
+        memory enables per-round memory accounting: True, a CSV path for the
+        per-round rows, or a configured MemoryTracker. Its growth summary is
+        printed and kept in self.memory_profile.
+        """
         config = {
-            "recursion_limit": 1000,  
+            # Five workflow steps per round, so large max_rounds needs a higher limit
+            "recursion_limit": max(1000, 5 * self.max_rounds + 10),  
             "timeout": 300  
         }
+        tracer = ChromeTracer(trace_path) if trace_path else None
+        previous_tracer = set_tracer(tracer) if tracer else None
+        profiler = self._build_phase_profiler(profile)
+        previous_profiler = None
+        if profiler:
+            profiler.start()
+            previous_profiler = set_phase_profiler(profiler)
+        tracker = self._build_memory_tracker(memory)
+        previous_tracker = None
+        if tracker:
+            tracker.start()
+            previous_tracker = set_memory_tracker(tracker)
         try:
             final_state = self.workflow.invoke(self.system_state, config=config)
             
             self._print_final_analysis(final_state)
             
         except Exception as e:
-            print(f"Coordination error: {e}")
+            _event_log.error("workflow", "coordination_error", "Coordination error: {error}", error=str(e))
             import traceback
             traceback.print_exc()
+        finally:
+            if tracer:
+                set_tracer(previous_tracer)
+                tracer.write()
+            if profiler:
+                set_phase_profiler(previous_profiler)
+                profiler.stop()
+                self.phase_profile = profiler.report()
+                print(profiler.format_report())
+            if tracker:
+                set_memory_tracker(previous_tracker)
+                tracker.stop()
+                self.memory_profile = tracker.summary()
+                print(tracker.format_summary())
+
+    @staticmethod
+    def _build_phase_profiler(profile) -> Optional[PhaseProfiler]:
+        if not profile:
+            return None
+        if isinstance(profile, PhaseProfiler):
+            return profile
+        if profile is True:
+            return PhaseProfiler()
+        return PhaseProfiler(phases=profile)
+
+    @staticmethod
+    def _build_memory_tracker(memory) -> Optional[MemoryTracker]:
+        if not memory:
+            return None
+        if isinstance(memory, MemoryTracker):
+            return memory
+        if memory is True:
+            return MemoryTracker()
+        return MemoryTracker(csv_path=memory)
 
     def visualize_coordination_graph(self):
         """Display the coordination workflow graph"""
@@ -275,7 +602,7 @@ class DistributedCoordinationSystem:
             print("No execution history tracked!")
             return
         
-        total_slots = len(self.execution_history)
+        total_slots = self.execution_history[-1]['time_slot'] + 1
         print(f"\nTotal Time Slots: {total_slots}")
         processor_timelines = {}
         for proc_id in sorted(self.processors.keys()):
@@ -309,17 +636,18 @@ class DistributedCoordinationSystem:
             
             print(f"{proc_id:>7}  {timeline_str} [{status}] ({slots_used} slots)")
         
+        if self.scheduling.cores > 1:
+            self._print_core_lanes(total_slots)
+        
         print()
         print("Legend: █ = Processor executing at that time slot")
         print(f"\nDetailed Time Slot Execution:")
         print("-" * 40)
         
-        for i, execution in enumerate(self.execution_history):
+        for execution in self.execution_history:
             proc_id = execution['processor_id']
-            processor = self.processors[proc_id]
-            remaining_after = self._get_remaining_time(processor)
-            
-            print(f"Time Slot {i:>2}: Processor {proc_id} executes")
+            core_label = f" on core {execution['core']}" if self.scheduling.cores > 1 else ""
+            print(f"Time Slot {execution['time_slot']:>2}: Processor {proc_id} executes{core_label}")
         print(f"Completion Summary:")
         print("-" * 30)
         
@@ -339,6 +667,18 @@ class DistributedCoordinationSystem:
         #     burst_time = processor.state.true_burst_time
         #     # print(f"{i}. Processor {proc_id}: Completed at time slot {completion_time} (needed {burst_time} slots)")
 
+    def _print_core_lanes(self, total_slots: int):
+        """One lane per execution unit; each cell names the processor that ran there"""
+        width = max(len(proc_id) for proc_id in self.processors)
+        lanes = [["." * width] * total_slots for _ in range(self.scheduling.cores)]
+        for execution in self.execution_history:
+            lanes[execution['core']][execution['time_slot']] = execution['processor_id'].rjust(width)
+        metrics = self.throughput_metrics()
+        print(f"\nCore lanes ({self.scheduling.cores} cores, utilisation {metrics['core_utilisation']:.0%}, "
+              f"{metrics['throughput']:.2f} processor-slots per time slot):")
+        for core, lane in enumerate(lanes):
+            print(f"core {core:>2}  {' '.join(lane)}  ({metrics['per_core_utilisation'][core]:.0%})")
+
     def _print_final_analysis(self, final_state):
         if isinstance(final_state, dict):
             execution_order = final_state.get('execution_order', [])
@@ -378,7 +718,7 @@ class DistributedCoordinationSystem:
             bias = processor.state.bias_level
             print(f"   {i}. {proc_id} (completed in {slots_used} slots) - {strategy} strategy, bias={bias:.1f}")
         self._print_gantt_chart(final_state)
-    def _build_coordination_workflow(self) -> StateGraph:
+    def _build_coordination_workflow(self) -> "StateGraph":
         from .workflow_engine import CoordinationWorkflowEngine
         workflow_engine = CoordinationWorkflowEngine(self)
         return workflow_engine.build_workflow()
\ No newline at end of file
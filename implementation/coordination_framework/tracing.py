@@ -0,0 +1,189 @@
+"""
+Tracing - Chrome trace-event / Perfetto export of coordination timing.
+
+An opt-in ChromeTracer records wall-clock spans for workflow phases, agent LLM
+calls and slot executions, plus a simulated CPU timeline built from executed
+time slots. The default NullTracer makes every span a no-op.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+WALL_CLOCK_PID = 1
+SIMULATED_CPU_PID = 2
+
+# One simulated time slot is drawn as 1ms on the simulated CPU lane
+SIMULATED_SLOT_US = 1000
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class NullTracer:
+    """Default tracer: records nothing"""
+
+    enabled = False
+
+    def span(self, name: str, category: str = "workflow", track: Optional[str] = None, **args):
+        return _NULL_SPAN
+
+    def instant(self, name: str, category: str = "workflow", track: Optional[str] = None, **args):
+        pass
+
+    def simulated_slot(self, processor_id: str, time_slot: int, **args):
+        pass
+
+    def write(self, path: Optional[str] = None):
+        pass
+
+class _Span:
+    __slots__ = ("tracer", "name", "category", "tid", "args", "start")
+
+    def __init__(self, tracer: "ChromeTracer", name: str, category: str, tid: int, args: Dict):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.tid = tid
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer._append({
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "pid": WALL_CLOCK_PID,
+            "tid": self.tid,
+            "ts": (self.start - self.tracer._origin) / 1000.0,
+            "dur": (end - self.start) / 1000.0,
+            "args": self.args
+        })
+        return False
+
+class ChromeTracer:
+    """
+    Collects trace events in memory and writes a Chrome trace-event JSON file
+    that opens in Perfetto or chrome://tracing.
+
+    Wall-clock spans live in one process with a "workflow" track plus one
+    track per agent; the simulated CPU timeline is a second process with one
+    track per processor, one event per executed time slot.
+    """
+
+    enabled = True
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.events: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter_ns()
+        self._tracks: Dict[str, int] = {}
+        self._simulated_tracks: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _append(self, event: Dict[str, Any]):
+        with self._lock:
+            self.events.append(event)
+
+    def _track_id(self, track: Optional[str]) -> int:
+        name = track or "workflow"
+        tid = self._tracks.get(name)
+        if tid is None:
+            tid = self._tracks[name] = len(self._tracks)
+        return tid
+
+    def span(self, name: str, category: str = "workflow", track: Optional[str] = None, **args) -> _Span:
+        return _Span(self, name, category, self._track_id(track), args)
+
+    def instant(self, name: str, category: str = "workflow", track: Optional[str] = None, **args):
+        self._append({
+            "name": name,
+            "cat": category,
+            "ph": "i",
+            "s": "t",
+            "pid": WALL_CLOCK_PID,
+            "tid": self._track_id(track),
+            "ts": (time.perf_counter_ns() - self._origin) / 1000.0,
+            "args": args
+        })
+
+    def simulated_slot(self, processor_id: str, time_slot: int, **args):
+        tid = self._simulated_tracks.get(processor_id)
+        if tid is None:
+            tid = self._simulated_tracks[processor_id] = len(self._simulated_tracks)
+        self._append({
+            "name": processor_id,
+            "cat": "simulated_cpu",
+            "ph": "X",
+            "pid": SIMULATED_CPU_PID,
+            "tid": tid,
+            "ts": time_slot * SIMULATED_SLOT_US,
+            "dur": SIMULATED_SLOT_US,
+            "args": dict(args, time_slot=time_slot)
+        })
+
+    def _metadata_events(self) -> List[Dict[str, Any]]:
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": WALL_CLOCK_PID, "tid": 0, "args": {"name": "Coordination (wall clock)"}},
+            {"name": "process_name", "ph": "M", "pid": SIMULATED_CPU_PID, "tid": 0, "args": {"name": "Simulated CPU (1 slot = 1ms)"}}
+        ]
+        for name, tid in self._tracks.items():
+            metadata.append({"name": "thread_name", "ph": "M", "pid": WALL_CLOCK_PID, "tid": tid, "args": {"name": name}})
+            metadata.append({"name": "thread_sort_index", "ph": "M", "pid": WALL_CLOCK_PID, "tid": tid, "args": {"sort_index": tid}})
+        for name, tid in self._simulated_tracks.items():
+            metadata.append({"name": "thread_name", "ph": "M", "pid": SIMULATED_CPU_PID, "tid": tid, "args": {"name": name}})
+        return metadata
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            events = list(self.events)
+        return {"traceEvents": self._metadata_events() + events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Optional[str] = None) -> str:
+        path = path or self.path
+        if path is None:
+            raise ValueError("ChromeTracer.write requires a path")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, default=str)
+        return path
+
+_active_tracer = NullTracer()
+
+def get_tracer():
+    """Process-wide tracer used by the workflow, coordinator and agents"""
+    return _active_tracer
+
+def set_tracer(tracer) -> Any:
+    """Install a tracer (None restores the NullTracer) and return the previous one"""
+    global _active_tracer
+    previous = _active_tracer
+    _active_tracer = tracer if tracer is not None else NullTracer()
+    return previous
+
+@contextmanager
+def tracing(path: str):
+    """Trace everything inside the block and write the trace file on exit"""
+    tracer = ChromeTracer(path)
+    previous = set_tracer(tracer)
+    try:
+        yield tracer
+    finally:
+        set_tracer(previous)
+        tracer.write()
@@ -0,0 +1,171 @@
+"""
+Trust Engine - Batched fleet-wide trust updates for large processor populations.
+
+Computes the same trust trajectory as the per-processor TrustBasedBehavior path
+(discrepancy penalty ladder, bias amplification, rolling-window deception pattern
+classification and clamping) for every active processor at once from arrays.
+"""
+
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+PATTERN_NAMES = (
+    "insufficient_data",
+    "no_data",
+    "chronic_deception",
+    "frequent_deception",
+    "occasional_deception",
+    "mostly_honest"
+)
+PATTERN_SEVERITY = np.array([0.0, 0.0, 1.0, 0.7, 0.3, 0.0])
+
+INSUFFICIENT_DATA, NO_DATA, CHRONIC, FREQUENT, OCCASIONAL, MOSTLY_HONEST = range(len(PATTERN_NAMES))
+
+def discrepancy_ratios(claimed: np.ndarray, actual: np.ndarray) -> np.ndarray:
+    """Deception severity |claimed - actual| / max(actual, 1), element-wise"""
+    return np.abs(claimed - actual) / np.maximum(actual, 1.0)
+
+def compute_trust_batch(trust: np.ndarray,
+                        claimed: np.ndarray,
+                        has_claim: np.ndarray,
+                        actual: np.ndarray,
+                        bias: np.ndarray,
+                        window_discrepancy: np.ndarray,
+                        window_valid: np.ndarray,
+                        history_length: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Vectorised equivalent of calculate_trust_update + detect_deceptive_pattern +
+    apply_pattern_penalty + clamping.
+
+    window_discrepancy/window_valid hold the last `window` reputation entries per
+    processor, oldest first, and history_length is the full reputation_history
+    length (used for the insufficient-data check).
+    """
+    n = trust.shape[0]
+
+    # Trust update: penalty ladder amplified by bias, reward for honest claims
+    ratio = discrepancy_ratios(np.where(has_claim, claimed, 0.0), actual)
+    penalty = np.select(
+        [ratio > 0.8, ratio > 0.6, ratio > 0.4],
+        [-0.5, -0.4, -0.3],
+        default=-0.2
+    )
+    multiplier = np.select([bias > 0.8, bias > 0.6, bias > 0.4], [2.0, 1.7, 1.3], default=1.0)
+    trust_update = np.where(ratio > 0.2, penalty * multiplier, 0.15)
+    trust_update = np.where(has_claim, trust_update, 0.05)
+    new_trust = trust + trust_update
+
+    # Pattern classification, summed oldest -> newest to match the scalar float order
+    valid_count = window_valid.sum(axis=1)
+    discrepancy_sum = np.zeros(n)
+    above_threshold = np.zeros(n, dtype=np.int64)
+    for column in range(window_discrepancy.shape[1]):
+        values = np.where(window_valid[:, column], window_discrepancy[:, column], 0.0)
+        discrepancy_sum = discrepancy_sum + values
+        above_threshold += window_valid[:, column] & (values > 0.3)
+    safe_count = np.maximum(valid_count, 1)
+    avg_discrepancy = discrepancy_sum / safe_count
+    consistency = above_threshold / safe_count
+
+    pattern = np.select(
+        [
+            history_length < 3,
+            valid_count == 0,
+            (avg_discrepancy > 0.6) & (consistency > 0.6),
+            (avg_discrepancy > 0.4) & (consistency > 0.4),
+            avg_discrepancy > 0.2
+        ],
+        [INSUFFICIENT_DATA, NO_DATA, CHRONIC, FREQUENT, OCCASIONAL],
+        default=MOSTLY_HONEST
+    )
+
+    penalised = np.select(
+        [pattern == CHRONIC, pattern == FREQUENT, pattern == OCCASIONAL],
+        [
+            np.maximum(0.05, new_trust - 0.3),
+            np.maximum(0.1, new_trust - 0.2),
+            np.maximum(0.2, new_trust - 0.1)
+        ],
+        default=new_trust
+    )
+    final_trust = np.maximum(0.0, np.minimum(1.0, penalised))
+
+    return {
+        "trust_update": trust_update,
+        "final_trust": final_trust,
+        "pattern": pattern,
+        "severity": PATTERN_SEVERITY[pattern]
+    }
+
+class BatchTrustEngine:
+    """
+    Keeps per-processor rolling discrepancy windows as arrays and applies
+    fleet-wide trust updates in one vectorised pass per round.
+    """
+
+    def __init__(self, processor_ids: Sequence[str], window: int = 5):
+        self.window = window
+        self.index = {proc_id: i for i, proc_id in enumerate(processor_ids)}
+        count = len(self.index)
+        self.window_discrepancy = np.zeros((count, window))
+        self.window_valid = np.zeros((count, window), dtype=bool)
+        self.history_length = np.zeros(count, dtype=np.int64)
+
+    def load_history(self, proc_id: str, reputation_history: List[Dict]):
+        """Seed a processor's window from an existing reputation_history"""
+        i = self.index[proc_id]
+        self.window_discrepancy[i] = 0.0
+        self.window_valid[i] = False
+        self.history_length[i] = len(reputation_history)
+        recent = reputation_history[-self.window:]
+        offset = self.window - len(recent)
+        for column, entry in enumerate(recent, start=offset):
+            claimed = entry.get("claimed_burst_time")
+            actual = entry.get("actual_remaining")
+            if claimed is not None and actual is not None:
+                self.window_discrepancy[i, column] = abs(claimed - actual) / max(actual, 1)
+                self.window_valid[i, column] = True
+
+    def indices_for(self, proc_ids: Sequence[str]) -> np.ndarray:
+        return np.fromiter((self.index[p] for p in proc_ids), dtype=np.int64, count=len(proc_ids))
+
+    def compute(self, indices: np.ndarray, trust: np.ndarray, claimed: np.ndarray,
+                has_claim: np.ndarray, actual: np.ndarray, bias: np.ndarray) -> Dict[str, np.ndarray]:
+        """Compute this round's trust results without recording it in the windows"""
+        return compute_trust_batch(
+            trust, claimed, has_claim, actual, bias,
+            self.window_discrepancy[indices],
+            self.window_valid[indices],
+            self.history_length[indices]
+        )
+
+    def record(self, indices: np.ndarray, claimed: np.ndarray, has_claim: np.ndarray, actual: np.ndarray):
+        """Shift this round's reputation entries into the rolling windows"""
+        discrepancy = discrepancy_ratios(np.where(has_claim, claimed, 0.0), actual)
+        shifted = self.window_discrepancy[indices]
+        shifted[:, :-1] = shifted[:, 1:]
+        shifted[:, -1] = np.where(has_claim, discrepancy, 0.0)
+        self.window_discrepancy[indices] = shifted
+        valid = self.window_valid[indices]
+        valid[:, :-1] = valid[:, 1:]
+        valid[:, -1] = has_claim
+        self.window_valid[indices] = valid
+        self.history_length[indices] += 1
+
+    def step(self, proc_ids: Sequence[str], trust: Sequence[float], claimed: Sequence[Optional[int]],
+             actual: Sequence[int], bias: Sequence[float]) -> Dict[str, np.ndarray]:
+        """Compute and record one round of trust updates for the given processors"""
+        indices = self.indices_for(proc_ids)
+        has_claim = np.fromiter((c is not None for c in claimed), dtype=bool, count=len(claimed))
+        claimed_values = np.fromiter((0 if c is None else c for c in claimed), dtype=np.float64, count=len(claimed))
+        actual_values = np.asarray(actual, dtype=np.float64)
+        result = self.compute(
+            indices,
+            np.asarray(trust, dtype=np.float64),
+            claimed_values,
+            has_claim,
+            actual_values,
+            np.asarray(bias, dtype=np.float64)
+        )
+        self.record(indices, claimed_values, has_claim, actual_values)
+        return result
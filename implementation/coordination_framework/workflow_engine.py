@@ -1,6 +1,17 @@
-from langgraph.graph import StateGraph, END
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Callable, Dict, List, Any
 from coordination_framework.state_management import SystemState
+from coordination_framework.event_log import get_event_logger, DEBUG
+from coordination_framework.tracing import get_tracer
+from coordination_framework.profiling import get_phase_profiler
+from coordination_framework.memory_tracking import get_memory_tracker
+from coordination_framework.scheduling import allocate_slots
+
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
+
+_event_log = get_event_logger()
+_RULE = "=" * 60
+_DIVIDER = "-" * 40
 
 class CoordinationWorkflowEngine:
     """
@@ -10,18 +21,23 @@ class CoordinationWorkflowEngine:
     def __init__(self, coordination_system):
         self.coordinator = coordination_system
     
-    def build_workflow(self) -> StateGraph:
+    def build_phase_functions(self) -> Dict[str, Callable]:
+        """
+        Phase node functions keyed by node name, plus the check_termination
+        router. Exposed separately from build_workflow so benchmarks can call
+        each phase directly.
+        """
         def initialization_phase(state: SystemState) -> SystemState:
-            print(f"\n{'='*60}")
-            print(f"ROUND {state.round_number} - INITIALIZATION PHASE")
-            print(f"{'='*60}")
+            _event_log.info("workflow", "phase_start", "\n" + _RULE + "\nROUND {round} - INITIALIZATION PHASE\n" + _RULE,
+                            round=state.round_number, phase="initialization")
             state.current_phase = "initialization"
             active_processors = self.coordinator._get_active_processors_only()
             
             if not active_processors:
-                print("ALL PROCESSORS COMPLETED!")
+                _event_log.info("workflow", "all_completed", "ALL PROCESSORS COMPLETED!")
                 return state
             active_count = self.coordinator._log_processor_status(state.round_number)
+            log_claims = _event_log.enabled(DEBUG, "agent")
             for proc_id, processor in active_processors.items():
                 if not self.coordinator._validate_processor_participation(proc_id, "burst_time_claim"):
                     continue
@@ -29,11 +45,11 @@ class CoordinationWorkflowEngine:
                 other_active_processors = [
                     {
                         "id": oid, 
-                        "claimed_burst": other_proc.state.claimed_burst_time or "unknown",
-                        "trust": other_proc.state.trust_score,
-                        "remaining": self.coordinator._get_remaining_time(other_proc)
+                        "claimed_burst": active_processors[oid].state.claimed_burst_time or "unknown",
+                        "trust": active_processors[oid].state.trust_score,
+                        "remaining": self.coordinator._get_remaining_time(active_processors[oid])
                     }
-                    for oid, other_proc in active_processors.items() if oid != proc_id
+                    for oid in self.coordinator._competing_peers(proc_id, active_processors)
                 ]
                 
                 claimed_time = processor.claim_burst_time({
@@ -41,8 +57,10 @@ class CoordinationWorkflowEngine:
                     "other_processors": other_active_processors
                 })
                 
-                actual_remaining = self.coordinator._get_remaining_time(processor)
-                print(f"Processor {proc_id}: Claims {claimed_time}ms remaining (actual: {actual_remaining}ms)")
+                if log_claims:
+                    _event_log.debug("agent", "claim_recorded", "Processor {processor_id}: Claims {claimed}ms remaining (actual: {actual}ms)",
+                                     processor_id=proc_id, claimed=claimed_time,
+                                     actual=self.coordinator._get_remaining_time(processor))
             
             return state
 
@@ -51,35 +69,38 @@ class CoordinationWorkflowEngine:
             Phase 2 - ONLY active processors negotiate.
             Completed processors are completely excluded from all negotiations.
             """
-            print(f"NEGOTIATION PHASE")
-            print("-" * 40)
+            _event_log.info("workflow", "phase_start", "NEGOTIATION PHASE\n" + _DIVIDER,
+                            round=state.round_number, phase="negotiation")
             state.current_phase = "negotiation"
             state.negotiation_messages = []
             active_processors = self.coordinator._get_active_processors_only()
             
             if not active_processors:
-                print("No active processors remaining for negotiation")
+                _event_log.info("negotiation", "no_participants", "No active processors remaining for negotiation")
                 return state
             
-            print(f"Negotiating processors: {list(active_processors.keys())}")
+            _event_log.info("negotiation", "participants", "Negotiating processors: {processors}",
+                            processors=list(active_processors.keys()))
             for proc_id, processor in active_processors.items():
                 if not self.coordinator._validate_processor_participation(proc_id, "negotiation"):
                     continue
                 
+                peer_ids = self.coordinator._competing_peers(proc_id, active_processors)
                 other_active_processors = [
                     {
                         "id": oid,
-                        "claimed_burst": other_proc.state.claimed_burst_time,
-                        "trust": other_proc.state.trust_score,
-                        "remaining": self.coordinator._get_remaining_time(other_proc)
+                        "claimed_burst": active_processors[oid].state.claimed_burst_time,
+                        "trust": active_processors[oid].state.trust_score,
+                        "remaining": self.coordinator._get_remaining_time(active_processors[oid])
                     }
-                    for oid, other_proc in active_processors.items() if oid != proc_id
+                    for oid in peer_ids
                 ]
                 
                 negotiation_context = {
                     "round": state.round_number,
                     "phase": "negotiation",
-                    "active_processors": list(active_processors.keys()),
+                    "active_processors": list(active_processors.keys()) if self.coordinator.shard_map is None
+                                         else [proc_id] + peer_ids,
                     "my_remaining": self.coordinator._get_remaining_time(processor)
                 }
                 
@@ -91,29 +112,32 @@ class CoordinationWorkflowEngine:
                     "round": state.round_number
                 })
                 
-                print(f"{proc_id}: \"{message}\"")
+                _event_log.debug("negotiation", "message", "{processor_id}: \"{message}\"",
+                                 processor_id=proc_id, message=message)
             
             return state
 
         def coalition_formation_phase(state: SystemState) -> SystemState:
-            print(f"\nCOALITION FORMATION PHASE")
-            print("-" * 40)
+            _event_log.info("workflow", "phase_start", "\nCOALITION FORMATION PHASE\n" + _DIVIDER,
+                            round=state.round_number, phase="coalition")
             
             state.current_phase = "coalition"
             state.coalition_formations = []
             active_processors = self.coordinator._get_active_processors_only()
             
             if not active_processors:
-                print("No active processors for coalition formation")
+                _event_log.info("coalition", "no_participants", "No active processors for coalition formation")
                 return state
             
-            print(f"Coalition-forming processors: {list(active_processors.keys())}")
+            _event_log.info("coalition", "participants", "Coalition-forming processors: {processors}",
+                            processors=list(active_processors.keys()))
             for proc_id, processor in active_processors.items():
                 if not self.coordinator._validate_processor_participation(proc_id, "coalition_formation"):
                     continue
-                potential_partners = [oid for oid in active_processors.keys() if oid != proc_id]
+                potential_partners = self.coordinator._competing_peers(proc_id, active_processors)
                 if not potential_partners:
-                    print(f"  {proc_id}: No other active processors to form coalition with")
+                    _event_log.debug("coalition", "no_partners", "  {processor_id}: No other active processors to form coalition with",
+                                     processor_id=proc_id)
                     continue
                 coalition_context = {
                     "round": state.round_number,
@@ -128,7 +152,7 @@ class CoordinationWorkflowEngine:
                         if partner in active_processors:
                             active_partners.append(partner)
                         else:
-                            print(f"Partner {partner} excluded: not active")
+                            _event_log.debug("coalition", "partner_excluded", "Partner {partner} excluded: not active", partner=partner)
                     
                     if active_partners:
                         state.coalition_formations.append({
@@ -138,28 +162,31 @@ class CoordinationWorkflowEngine:
                             "round": state.round_number
                         })
                         
-                        print(f"{proc_id} proposes coalition with {active_partners}: {coalition_proposal['proposal']}")
+                        _event_log.debug("coalition", "proposal", "{processor_id} proposes coalition with {partners}: {proposal}",
+                                         processor_id=proc_id, partners=active_partners, proposal=coalition_proposal["proposal"])
                     else:
-                        print(f"  {proc_id}: All proposed partners are inactive - no coalition formed")
+                        _event_log.debug("coalition", "no_partners", "  {processor_id}: All proposed partners are inactive - no coalition formed",
+                                         processor_id=proc_id)
                 else:
-                    print(f"  {proc_id}: No coalition proposal")
+                    _event_log.debug("coalition", "no_proposal", "  {processor_id}: No coalition proposal", processor_id=proc_id)
             self.coordinator._process_coalitions_strict(state)
             
             return state
 
         def bidding_phase(state: SystemState) -> SystemState:
-            print(f"\nBIDDING PHASE - COMPETING FOR TIME SLOT {state.round_number}")
-            print("-" * 40)
+            _event_log.info("workflow", "phase_start", "\nBIDDING PHASE - COMPETING FOR TIME SLOT {round}\n" + _DIVIDER,
+                            round=state.round_number, phase="bidding")
             
             state.current_phase = "bidding"
             active_processors = self.coordinator._get_active_processors_only()
             
             if not active_processors:
-                print("No active processors to bid")
+                _event_log.info("bidding", "no_participants", "No active processors to bid")
                 state.execution_order = []
                 return state
             
-            print(f"Active processors competing: {list(active_processors.keys())}")
+            _event_log.info("bidding", "participants", "Active processors competing: {processors}",
+                            processors=list(active_processors.keys()))
             competition_info = {
                 "total_competitors": len(active_processors),
                 "competitors": [
@@ -172,61 +199,64 @@ class CoordinationWorkflowEngine:
                     for proc_id, proc in active_processors.items()
                 ]
             }
-            bids = self.coordinator.calculate_enhanced_bids({
+            calculate_bids = self.coordinator.calculate_enhanced_bids if self.coordinator.shard_map is None \
+                else self.coordinator.calculate_hierarchical_bids
+            bids = calculate_bids({
             "round_number": state.round_number,
             "competition_info": competition_info
             })
             if bids:
-                winner_id = max(bids, key=bids.get)
-                print(f"Winner: {winner_id} with bid {bids[winner_id]:.2f}")
-                print(f"{winner_id} will execute during time slot {state.round_number}")
-                
-                state.execution_order = [winner_id]
+                scheduling = self.coordinator.scheduling
+                # Never allocate past max_rounds, which counts time slots
+                quantum = self.coordinator.quantum_controller.next_quantum(bids)
+                slots = max(1, min(quantum, self.coordinator.max_rounds - state.round_number))
+                remaining = {proc_id: self.coordinator._get_remaining_time(proc) for proc_id, proc in active_processors.items()}
+                state.slot_allocation = allocate_slots(bids, remaining, slots, scheduling.rebid_on_completion, scheduling.cores)
+                state.execution_order = list(state.slot_allocation[0])
+                winner_id = state.execution_order[0]
+                _event_log.info("bidding", "winner", "Winner: {processor_id} with bid {bid:.2f}\n{processor_id} will execute during time slot {round}",
+                                processor_id=winner_id, bid=bids[winner_id], round=state.round_number)
+                if len(state.execution_order) > 1:
+                    _event_log.info("bidding", "parallel_winners", "Winners on {cores} cores: {winners}",
+                                    cores=scheduling.cores, winners=state.execution_order)
+                if len(state.slot_allocation) > 1:
+                    _event_log.info("bidding", "allocation", "Allocated time slots {first}-{last} (quantum {quantum}): {allocation}",
+                                    first=state.round_number, last=state.round_number + len(state.slot_allocation) - 1,
+                                    quantum=quantum, allocation=state.slot_allocation)
             else:
-                print("No bids received - no winner for this time slot")
+                _event_log.info("bidding", "no_winner", "No bids received - no winner for this time slot")
                 state.execution_order = []
 
             
             return state
 
         def execution_phase(state: SystemState) -> SystemState:
-            print(f"\nEXECUTION PHASE - TIME SLOT {state.round_number}")
-            print("-" * 40)
+            _event_log.info("workflow", "phase_start", "\nEXECUTION PHASE - TIME SLOT {round}\n" + _DIVIDER,
+                            round=state.round_number, phase="execution")
             
             state.current_phase = "execution"
             active_processors = self.coordinator._get_active_processors_only()
-            winner_id = None
-            if state.execution_order and state.execution_order[0] in self.coordinator.processors:
-                potential_winner = state.execution_order[0]
-                if potential_winner in active_processors:
-                    winner_id = potential_winner
-                else:
-                    print(f"Winner {potential_winner} is no longer active! Skipping execution.")
-            
-            if winner_id:
-                winner = self.coordinator.processors[winner_id]
-                
-                print(f"Time slot {state.round_number}: {winner_id} executes")
-                slots_used_before = getattr(winner.state, 'execution_slots_used', 0)
-                burst_progress = f"{slots_used_before + 1}/{winner.state.true_burst_time}"
-                print(f"   Burst progress: {burst_progress}")
-                self.coordinator._execute_processor_for_one_slot(winner)
-                current_active = self.coordinator._get_active_processors_only()
-                for proc_id, processor in current_active.items():
-                    if proc_id == winner_id:
-                        continue 
-                    
-                    remaining = self.coordinator._get_remaining_time(processor)
-                    total = processor.state.true_burst_time
-                    print(f"{proc_id} waits (remaining: {remaining}/{total})")
-            else:
-                print("No valid winner determined for this time slot")
-            self.coordinator._update_trust_scores(state)
+            allocation = state.slot_allocation or [state.execution_order]
+            for slot_index, winners in enumerate(allocation):
+                if slot_index:
+                    state.round_number += 1
+                state.execution_order = list(winners)
+                executed = self._execute_allocated_slot(state, winners)
+                self.coordinator._update_trust_scores(state)
+                if len(allocation) > 1:
+                    # Claims are remaining time: age each winner's by the slot it just used so
+                    # the next slot of this round checks it against the new remaining time
+                    for winner_id in executed:
+                        winner_state = self.coordinator.processors[winner_id].state
+                        if winner_state.claimed_burst_time is not None:
+                            winner_state.claimed_burst_time = max(0, winner_state.claimed_burst_time - 1)
             self.coordinator._update_processor_observations(state)
+            self.coordinator._record_round_evolution(state, list(active_processors.keys()))
             for processor in self.coordinator.processors.values():
                 processor.state.execution_position = None
                 processor.state.current_bid = 0.0
             state.execution_order = []
+            state.slot_allocation = []
             state.round_number += 1
             
             return state
@@ -236,32 +266,50 @@ class CoordinationWorkflowEngine:
             active_count = len(active_processors)
             total_count = len(self.coordinator.processors)
             
-            print(f"\nTermination Check - Round {state.round_number}:")
-            for proc_id, processor in self.coordinator.processors.items():
-                is_completed = self.coordinator._is_processor_completed(processor)
-                remaining = self.coordinator._get_remaining_time(processor)
-                status = "COMPLETED" if is_completed else f"{remaining} slots remaining"
-                print(f"{proc_id}: {status}")
+            _event_log.info("termination", "check", "\nTermination Check - Round {round}:", round=state.round_number)
+            # Per-processor status is O(N) per round, so it is only built when DEBUG is on
+            if _event_log.enabled(DEBUG, "termination"):
+                for proc_id, processor in self.coordinator.processors.items():
+                    is_completed = self.coordinator._is_processor_completed(processor)
+                    remaining = self.coordinator._get_remaining_time(processor)
+                    status = "COMPLETED" if is_completed else f"{remaining} slots remaining"
+                    _event_log.debug("termination", "processor_status", "{processor_id}: {status}",
+                                     processor_id=proc_id, status=status, remaining=remaining)
             
-            print(f"Active processors: {active_count}/{total_count}")
+            _event_log.info("termination", "active_count", "Active processors: {active}/{total}",
+                            active=active_count, total=total_count)
             
             if active_count == 0:
-                print(f"ALL PROCESSORS COMPLETED! Simulation finished after {state.round_number} time slots.")
+                _event_log.info("termination", "terminate", "ALL PROCESSORS COMPLETED! Simulation finished after {round} time slots.",
+                                round=state.round_number, reason="completed")
                 return "terminate"
-            elif state.round_number >= 50:
-                print(f"Maximum time slots reached ({state.round_number}). Ending simulation.")
+            elif state.round_number >= self.coordinator.max_rounds:
+                _event_log.info("termination", "terminate", "Maximum time slots reached ({round}). Ending simulation.",
+                                round=state.round_number, reason="max_rounds")
                 return "terminate"
             else:
-                active_ids = list(active_processors.keys())
-                print(f"Time slot {state.round_number} complete. Active processors: {active_ids}")
+                _event_log.info("termination", "continue", "Time slot {round} complete. Active processors: {active_ids}",
+                                round=state.round_number, active_ids=list(active_processors.keys()))
                 return "continue"
+        return {
+            "initialization": initialization_phase,
+            "negotiation": negotiation_phase,
+            "coalition": coalition_formation_phase,
+            "bidding": bidding_phase,
+            "execution": execution_phase,
+            "check_termination": check_termination
+        }
+
+    def build_workflow(self) -> "StateGraph":
+        from langgraph.graph import StateGraph, END
+        phases = self.build_phase_functions()
         workflow = StateGraph(SystemState)
         
-        workflow.add_node("initialization", initialization_phase)
-        workflow.add_node("negotiation", negotiation_phase)
-        workflow.add_node("coalition", coalition_formation_phase)
-        workflow.add_node("bidding", bidding_phase)
-        workflow.add_node("execution", execution_phase)
+        workflow.add_node("initialization", self._traced_phase("initialization", phases["initialization"]))
+        workflow.add_node("negotiation", self._traced_phase("negotiation", phases["negotiation"]))
+        workflow.add_node("coalition", self._traced_phase("coalition", phases["coalition"]))
+        workflow.add_node("bidding", self._traced_phase("bidding", phases["bidding"]))
+        workflow.add_node("execution", self._sampled_round(self._traced_phase("execution", phases["execution"])))
         
         workflow.set_entry_point("initialization")
         
@@ -272,7 +320,7 @@ class CoordinationWorkflowEngine:
         
         workflow.add_conditional_edges(
             "execution",
-            check_termination,
+            phases["check_termination"],
             {
                 "continue": "initialization",
                 "terminate": END
@@ -281,6 +329,63 @@ class CoordinationWorkflowEngine:
         
         return workflow.compile()
 
+    def _execute_allocated_slot(self, state: SystemState, winners: List[str]) -> List[str]:
+        """Run one allocated time slot (state.round_number), one winner per core; returns who executed"""
+        executing = []
+        for potential_winner in winners:
+            if potential_winner not in self.coordinator.processors:
+                continue
+            if self.coordinator._is_processor_completed(self.coordinator.processors[potential_winner]):
+                _event_log.warning("execution", "inactive_winner", "Winner {processor_id} is no longer active! Skipping execution.",
+                                   processor_id=potential_winner)
+            else:
+                executing.append(potential_winner)
+        
+        if not executing:
+            _event_log.info("execution", "no_winner", "No valid winner determined for this time slot")
+            return executing
+        
+        cores = self.coordinator._assign_cores(executing)
+        time_slot = self.coordinator.time_slots_executed
+        for winner_id in executing:
+            winner = self.coordinator.processors[winner_id]
+            slots_used_before = getattr(winner.state, 'execution_slots_used', 0)
+            _event_log.info("execution", "slot_start", "Time slot {time_slot}: {processor_id} executes\n   Burst progress: {slot}/{total}",
+                            time_slot=state.round_number, processor_id=winner_id,
+                            slot=slots_used_before + 1, total=winner.state.true_burst_time, core=cores[winner_id])
+            self.coordinator._execute_processor_for_one_slot(winner, time_slot, cores[winner_id])
+        self.coordinator.time_slots_executed += 1
+        if _event_log.enabled(DEBUG, "execution"):
+            current_active = self.coordinator._get_active_processors_only()
+            for proc_id, processor in current_active.items():
+                if proc_id in cores:
+                    continue 
+                
+                _event_log.debug("execution", "waiting", "{processor_id} waits (remaining: {remaining}/{total})",
+                                 processor_id=proc_id, remaining=self.coordinator._get_remaining_time(processor),
+                                 total=processor.state.true_burst_time)
+        return executing
+
+    @staticmethod
+    def _traced_phase(phase: str, phase_function):
+        """Wrap a phase node in a tracer span and profiler hook (no-ops unless enabled)"""
+        def traced(state: SystemState) -> SystemState:
+            with get_tracer().span(phase, "phase", round=state.round_number), get_phase_profiler().phase(phase):
+                return phase_function(state)
+        traced.__name__ = phase_function.__name__
+        return traced
+
+    def _sampled_round(self, execution_phase):
+        """Hand the end-of-round state to the memory tracker, outside the traced span"""
+        def sampled(state: SystemState) -> SystemState:
+            state = execution_phase(state)
+            tracker = get_memory_tracker()
+            if tracker.enabled:
+                tracker.record_round(self.coordinator, state)
+            return state
+        sampled.__name__ = execution_phase.__name__
+        return sampled
+
 class WorkflowMetrics:
     def __init__(self):
         self.phase_durations = {}
@@ -5,12 +5,22 @@ Main Entry Point - Distributed Processor Coordination System
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from dotenv import load_dotenv
+from typing import Optional
+from dotenv import load_dotenv, find_dotenv
 from agents.processor_agent import ProcessorLLMAgent
 from coordination_framework.system_coordinator import DistributedCoordinationSystem
-load_dotenv('/Users/deepalijain/Documents/CrewAI_Experiments/langgraph_tutorials/.env')
-def main():
+from scenarios.population import processor_id as generate_processor_id
+
+def load_environment(env_file: Optional[str] = None) -> bool:
+    """
+    Load API keys from env_file, else $COORDINATION_ENV_FILE, else the first
+    .env found walking up from the working directory.
+    """
+    path = env_file or os.environ.get("COORDINATION_ENV_FILE") or find_dotenv(usecwd=True)
+    return bool(path) and load_dotenv(path)
 
+def main():
+    load_environment()
     try:
         print("Configure 3 processor agents:")
         print("Strategy types: cooperative, aggressive, strategic")
@@ -25,7 +35,7 @@ def main():
         ]
         
         for i, (default_burst, default_strategy, default_bias) in enumerate(default_configs):
-            processor_id = chr(65 + i)  # A, B, C
+            processor_id = generate_processor_id(i)  # A, B, C
             
             try:
                 print(f"\n--- Processor {processor_id} Configuration ---")
@@ -0,0 +1,40 @@
+"""
+Scenarios - Resource contention scenarios, population generation and parameter sweeps.
+
+Exports are resolved on first access (PEP 562) so importing the package does
+not build the standard scenario registry or load the coordinator.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "ScenarioConfig": "scenarios.resource_contention_scenario",
+    "ResourceContentionScenario": "scenarios.resource_contention_scenario",
+    "StandardThreeProcessorScenario": "scenarios.resource_contention_scenario",
+    "HighContentionScenario": "scenarios.resource_contention_scenario",
+    "TrustCrisisScenario": "scenarios.resource_contention_scenario",
+    "AsymmetricProcessorScenario": "scenarios.resource_contention_scenario",
+    "ScalabilityTestScenario": "scenarios.resource_contention_scenario",
+    "CustomScenarioBuilder": "scenarios.resource_contention_scenario",
+    "ScenarioRunner": "scenarios.resource_contention_scenario",
+    "STANDARD_SCENARIOS": "scenarios.resource_contention_scenario",
+    "generate_processor_configs": "scenarios.population",
+    "generate_processor_ids": "scenarios.population",
+    "ParameterSweep": "scenarios.parameter_sweep",
+    "grid_design": "scenarios.parameter_sweep",
+    "random_design": "scenarios.parameter_sweep",
+    "load_scenario_file": "scenarios.scenario_files"
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,330 @@
+"""
+Parameter Sweep - Grid and random designs over population mixes, run in parallel with resume.
+
+A sweep point describes one generated population: processor count, strategy
+proportions, bias range, burst-time distribution, round budget and seed.
+Points are deduplicated by a hash of their canonical form, run in worker
+processes and streamed to a CSV (one row per point, fixed columns). Points
+whose hash is already in the output file are skipped, so re-running an
+interrupted sweep picks up where it stopped.
+
+Usage (from implementation/):
+    python -m scenarios.parameter_sweep --output sweep.csv --counts 3 6 12 \
+        --mixes 1:1:1 3:1:1 1:3:1 --bias-ranges 0:0.3 0.3:0.9 --seeds 0 1 2
+"""
+
+import argparse
+import csv
+import functools
+import hashlib
+import itertools
+import json
+import io
+import os
+import random
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from agents.heuristic_agent import HeuristicProcessorAgent
+from coordination_framework.shared_types import SystemState
+from coordination_framework.state_management import StateMetrics
+from coordination_framework.system_coordinator import DistributedCoordinationSystem
+from scenarios.population import STRATEGIES, generate_processor_configs, sample_burst_time
+from scenarios.resource_contention_scenario import (
+    ResourceContentionScenario,
+    ScenarioConfig,
+    _iter_in_workers
+)
+
+DEFAULT_POINT = {
+    "processor_count": 3,
+    "strategy_mix": {strategy: 1.0 for strategy in STRATEGIES},
+    "bias_range": None,
+    "burst_distribution": {"kind": "uniform", "low": 3, "high": 5},
+    "max_rounds": 50,
+    "seed": 0
+}
+
+SWEEP_CRITERIA = {
+    "trust_differentiation": 0.3,
+    "coalition_formation_rate": 0.2,
+    "system_completion_efficiency": 0.5
+}
+
+PARAMETER_COLUMNS = (
+    ["processor_count"]
+    + [f"mix_{strategy}" for strategy in STRATEGIES]
+    + ["bias_low", "bias_high", "burst_kind", "burst_params", "max_rounds", "seed"]
+)
+METRIC_COLUMNS = [
+    "success", "error", "rounds", "completed", "completion_fraction",
+    "coordination_effectiveness", "trust_differentiation", "coalition_formation_rate",
+    "system_completion_efficiency", "honest_mean_trust", "deceptive_mean_trust"
+]
+CSV_COLUMNS = ["config_hash"] + PARAMETER_COLUMNS + METRIC_COLUMNS + ["point"]
+
+# Biases at or below this are counted as honest in the trust split
+HONEST_BIAS = 0.2
+
+def normalize_point(point: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill defaults and put values in canonical form so equal points hash equally"""
+    unknown = set(point) - set(DEFAULT_POINT)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+    normalized = dict(DEFAULT_POINT, **point)
+    mix = {strategy: float(weight) for strategy, weight in normalized["strategy_mix"].items() if weight}
+    if not mix or set(mix) - set(STRATEGIES):
+        raise ValueError(f"strategy_mix needs positive weights for some of {STRATEGIES}")
+    total = sum(mix.values())
+    normalized["strategy_mix"] = {strategy: round(mix.get(strategy, 0.0) / total, 6) for strategy in STRATEGIES}
+    if normalized["bias_range"] is not None:
+        low, high = normalized["bias_range"]
+        normalized["bias_range"] = [round(float(low), 6), round(float(high), 6)]
+    normalized["burst_distribution"] = dict(sorted(normalized["burst_distribution"].items()))
+    normalized["processor_count"] = int(normalized["processor_count"])
+    normalized["max_rounds"] = int(normalized["max_rounds"])
+    normalized["seed"] = int(normalized["seed"])
+    return normalized
+
+def point_hash(point: Dict[str, Any]) -> str:
+    canonical = json.dumps(normalize_point(point), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+def grid_design(**axes: Sequence) -> List[Dict[str, Any]]:
+    """Cartesian product of the given parameter values, e.g. grid_design(processor_count=[3, 6], seed=range(5))"""
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(list(axes[name]) for name in names))]
+
+def dirichlet_mix(concentration: float = 1.0) -> Callable[[random.Random], Dict[str, float]]:
+    """Sampler for random_design: strategy proportions drawn from a symmetric Dirichlet"""
+    def sample(rng: random.Random) -> Dict[str, float]:
+        draws = [rng.gammavariate(concentration, 1.0) for _ in STRATEGIES]
+        total = sum(draws) or 1.0
+        return {strategy: draw / total for strategy, draw in zip(STRATEGIES, draws)}
+    return sample
+
+def random_design(samples: int, design_seed: int = 0, /, **axes) -> List[Dict[str, Any]]:
+    """
+    `samples` random points drawn with random.Random(design_seed). Each axis is a list (uniform choice), a (low, high)
+    tuple (uniform int when both ends are ints, float otherwise) or a callable
+    taking the design's random.Random.
+    """
+    rng = random.Random(design_seed)
+
+    def draw(spec):
+        if callable(spec):
+            return spec(rng)
+        if isinstance(spec, tuple) and len(spec) == 2:
+            low, high = spec
+            if isinstance(low, int) and isinstance(high, int):
+                return rng.randint(low, high)
+            return rng.uniform(low, high)
+        return rng.choice(list(spec))
+
+    return [{name: draw(spec) for name, spec in axes.items()} for _ in range(samples)]
+
+def build_scenario(point: Dict[str, Any], agent_class=HeuristicProcessorAgent) -> ResourceContentionScenario:
+    """Generate the population a sweep point describes"""
+    point = normalize_point(point)
+    seed = point["seed"]
+    processors = generate_processor_configs(
+        point["processor_count"],
+        strategy_weights={strategy: weight for strategy, weight in point["strategy_mix"].items() if weight},
+        seed=seed
+    )
+    burst_rng = random.Random(f"{seed}:burst")
+    bias_rng = random.Random(f"{seed}:bias")
+    for processor in processors:
+        processor["burst_time"] = sample_burst_time(burst_rng, point["burst_distribution"])
+        if point["bias_range"] is not None:
+            processor["bias"] = bias_rng.uniform(*point["bias_range"])
+    config = ScenarioConfig(
+        name=f"Sweep {point_hash(point)}",
+        description=f"Generated population of {point['processor_count']} processors",
+        processors=processors,
+        expected_behaviors=[],
+        success_criteria=dict(SWEEP_CRITERIA),
+        difficulty_level="generated"
+    )
+    return ResourceContentionScenario(config, agent_class=agent_class)
+
+def _parameter_columns(point: Dict[str, Any]) -> Dict[str, Any]:
+    bias_range = point["bias_range"] or [None, None]
+    burst = dict(point["burst_distribution"])
+    columns = {
+        "processor_count": point["processor_count"],
+        "bias_low": bias_range[0],
+        "bias_high": bias_range[1],
+        "burst_kind": burst.pop("kind", "uniform"),
+        "burst_params": json.dumps(burst, sort_keys=True),
+        "max_rounds": point["max_rounds"],
+        "seed": point["seed"]
+    }
+    for strategy in STRATEGIES:
+        columns[f"mix_{strategy}"] = point["strategy_mix"][strategy]
+    return columns
+
+def _mean(values: List[float]) -> Optional[float]:
+    return sum(values) / len(values) if values else None
+
+def summarize_run(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Metric columns from a ScenarioRunner result"""
+    row = {column: None for column in METRIC_COLUMNS}
+    row["success"] = bool(result.get("success"))
+    row["error"] = result.get("error")
+    final_state = result.get("final_state")
+    if not final_state:
+        return row
+    states = final_state["processors"]
+    total_burst = sum(state.true_burst_time for state in states)
+    executed = sum(min(getattr(state, "execution_slots_used", 0), state.true_burst_time) for state in states)
+    rounds = final_state.get("round_number", 0)
+    row.update({
+        "rounds": rounds,
+        "completed": executed >= total_burst,
+        "completion_fraction": executed / total_burst if total_burst else 1.0,
+        "coordination_effectiveness": StateMetrics.calculate_coordination_effectiveness(
+            SystemState(processors=states, coalition_formations=final_state.get("coalition_formations", [])),
+            {state.processor_id: state for state in states}
+        ),
+        "honest_mean_trust": _mean([s.trust_score for s in states if s.bias_level <= HONEST_BIAS]),
+        "deceptive_mean_trust": _mean([s.trust_score for s in states if s.bias_level > HONEST_BIAS])
+    })
+    for criterion, entry in result.get("evaluation", {}).get("success_criteria_met", {}).items():
+        if criterion in row and row[criterion] is None:
+            row[criterion] = entry["actual"]
+    return row
+
+def read_completed(path: str) -> Dict[str, Dict[str, str]]:
+    """
+    Rows already in a sweep CSV, keyed by config hash (the last row wins when
+    a point was re-run). A half-written last line from an interrupted run is
+    not a row: only newline-terminated lines are read.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        text = f.read()
+    complete = text[:text.rfind("\n") + 1]
+    return {row["config_hash"]: row for row in csv.DictReader(io.StringIO(complete, newline="")) if row.get("config_hash")}
+
+def _open_for_append(path: str):
+    """Open the CSV for appending, dropping a half-written last line from an interrupted run"""
+    exists = os.path.exists(path) and os.path.getsize(path) > 0
+    if exists:
+        with open(path, "rb+") as f:
+            data = f.read()
+            if not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+    f = open(path, "a", newline="", encoding="utf-8")
+    writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+    if not exists:
+        writer.writeheader()
+    return f, writer
+
+class ParameterSweep:
+    """
+    Runs sweep points in parallel worker processes and streams one CSV row per
+    point to output_path. Points already present in the file are skipped,
+    except ones whose row records an error (worker crash or timeout) when
+    retry_errors is set.
+    """
+
+    def __init__(self, output_path: str, coordination_system_class=DistributedCoordinationSystem,
+                 agent_class=HeuristicProcessorAgent, max_workers: Optional[int] = None,
+                 timeout: Optional[float] = None, retry_errors: bool = True):
+        self.output_path = output_path
+        self.coordination_system_class = coordination_system_class
+        self.agent_class = agent_class
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.retry_errors = retry_errors
+
+    def pending_points(self, points: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Normalized, deduplicated points not yet in the output file"""
+        done = {
+            key for key, row in read_completed(self.output_path).items()
+            if not (self.retry_errors and row.get("error"))
+        }
+        pending = {}
+        for point in points:
+            normalized = normalize_point(point)
+            key = point_hash(normalized)
+            if key not in done and key not in pending:
+                pending[key] = normalized
+        return list(pending.values())
+
+    def iter_run(self, points: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Run pending points, yielding each row as soon as it is written"""
+        pending = self.pending_points(points)
+        if not pending:
+            return
+        # Points with different round budgets need differently configured systems
+        by_rounds: Dict[int, List[Dict[str, Any]]] = {}
+        for point in pending:
+            by_rounds.setdefault(point["max_rounds"], []).append(point)
+
+        f, writer = _open_for_append(self.output_path)
+        try:
+            for max_rounds, group in by_rounds.items():
+                system_class = functools.partial(self.coordination_system_class, max_rounds=max_rounds)
+                jobs = {point_hash(point): point for point in group}
+                job_list = [
+                    (key, f"sweep-{key}", build_scenario(point, self.agent_class), point["seed"])
+                    for key, point in jobs.items()
+                ]
+                for key, (result, _output) in _iter_in_workers(job_list, system_class, self.max_workers, self.timeout):
+                    point = jobs[key]
+                    row = {"config_hash": key, "point": json.dumps(point, sort_keys=True)}
+                    row.update(_parameter_columns(point))
+                    row.update(summarize_run(result))
+                    writer.writerow(row)
+                    f.flush()
+                    yield row
+        finally:
+            f.close()
+
+    def run(self, points: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return list(self.iter_run(points))
+
+def _parse_pairs(values: Optional[List[str]], cast=float) -> Optional[List[List]]:
+    return [[cast(part) for part in value.split(":")] for value in values] if values else None
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Parameter sweep over generated processor populations")
+    parser.add_argument("--output", required=True, help="CSV file to stream results to (resumed if it exists)")
+    parser.add_argument("--counts", type=int, nargs="+", default=[DEFAULT_POINT["processor_count"]])
+    parser.add_argument("--mixes", nargs="+", help="Strategy weights cooperative:aggressive:strategic, e.g. 2:1:1")
+    parser.add_argument("--bias-ranges", nargs="+", help="Bias ranges low:high, e.g. 0:0.3")
+    parser.add_argument("--bursts", nargs="+", help="Burst distributions as JSON, e.g. '{\"kind\": \"bimodal\"}'")
+    parser.add_argument("--max-rounds", type=int, nargs="+", default=[DEFAULT_POINT["max_rounds"]])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0])
+    parser.add_argument("--random", type=int, metavar="N", help="Sample N random points from the axes instead of the full grid")
+    parser.add_argument("--design-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--timeout", type=float, help="Seconds before a single point is abandoned")
+    parser.add_argument("--no-retry-errors", action="store_true",
+                        help="Keep points whose earlier run failed instead of re-running them")
+    args = parser.parse_args(argv)
+
+    axes = {
+        "processor_count": args.counts,
+        "strategy_mix": [dict(zip(STRATEGIES, mix)) for mix in _parse_pairs(args.mixes)] if args.mixes
+                        else [DEFAULT_POINT["strategy_mix"]],
+        "bias_range": _parse_pairs(args.bias_ranges) or [None],
+        "burst_distribution": [json.loads(burst) for burst in args.bursts] if args.bursts
+                              else [DEFAULT_POINT["burst_distribution"]],
+        "max_rounds": args.max_rounds,
+        "seed": args.seeds
+    }
+    points = random_design(args.random, args.design_seed, **axes) if args.random else grid_design(**axes)
+
+    sweep = ParameterSweep(args.output, max_workers=args.workers, timeout=args.timeout,
+                           retry_errors=not args.no_retry_errors)
+    pending = sweep.pending_points(points)
+    print(f"{len(points)} points, {len(pending)} to run")
+    for index, row in enumerate(sweep.iter_run(pending), 1):
+        status = row["error"] or f"rounds={row['rounds']} effectiveness={row['coordination_effectiveness']:.3f}"
+        print(f"[{index}/{len(pending)}] {row['config_hash']} N={row['processor_count']} {status}")
+
+if __name__ == "__main__":
+    main()
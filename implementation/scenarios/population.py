@@ -0,0 +1,94 @@
+"""
+Population - Processor id and configuration generation for scenarios of any size.
+"""
+
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+STRATEGIES = ("cooperative", "aggressive", "strategic")
+DEFAULT_BIAS_BY_STRATEGY = {"cooperative": 0.1, "aggressive": 0.7, "strategic": 0.4}
+
+def processor_id(index: int) -> str:
+    """
+    Spreadsheet-style id for a zero-based index: A..Z, AA..AZ, BA.., AAA..
+    Stable for any population size and identical to chr(65 + i) below 26.
+    """
+    if index < 0:
+        raise ValueError("Processor index must be non-negative")
+    letters = []
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters.append(chr(65 + remainder))
+    return "".join(reversed(letters))
+
+def generate_processor_ids(count: int) -> List[str]:
+    return [processor_id(i) for i in range(count)]
+
+def generate_processor_configs(count: int,
+                               burst_range: Tuple[int, int] = (3, 5),
+                               strategy_weights: Optional[Dict[str, float]] = None,
+                               bias_by_strategy: Optional[Dict[str, float]] = None,
+                               bias_jitter: float = 0.0,
+                               seed: Optional[int] = None) -> List[Dict]:
+    """
+    Build `count` processor configs in the ScenarioConfig format.
+
+    Without a seed or strategy_weights the population is the deterministic
+    rotation ScalabilityTestScenario always used (strategies cycle, burst
+    times step through burst_range). With a seed, burst times are drawn
+    uniformly from burst_range, strategies by strategy_weights and biases
+    jittered by +/- bias_jitter.
+    """
+    bias_by_strategy = bias_by_strategy or DEFAULT_BIAS_BY_STRATEGY
+    low, high = burst_range
+    if seed is None and strategy_weights is None:
+        span = high - low + 1
+        return [
+            {
+                "id": processor_id(i),
+                "burst_time": low + (i % span),
+                "strategy": STRATEGIES[i % len(STRATEGIES)],
+                "bias": bias_by_strategy[STRATEGIES[i % len(STRATEGIES)]]
+            }
+            for i in range(count)
+        ]
+
+    rng = random.Random(seed)
+    weights = strategy_weights or {strategy: 1.0 for strategy in STRATEGIES}
+    strategies: Sequence[str] = list(weights.keys())
+    chosen = rng.choices(strategies, weights=[weights[s] for s in strategies], k=count)
+    configs = []
+    for i, strategy in enumerate(chosen):
+        bias = bias_by_strategy[strategy]
+        if bias_jitter:
+            bias = min(1.0, max(0.0, bias + rng.uniform(-bias_jitter, bias_jitter)))
+        configs.append({
+            "id": processor_id(i),
+            "burst_time": rng.randint(low, high),
+            "strategy": strategy,
+            "bias": bias
+        })
+    return configs
+
+BURST_DISTRIBUTIONS = ("uniform", "geometric", "bimodal")
+
+def sample_burst_time(rng: random.Random, distribution: Dict) -> int:
+    """
+    One burst time (>= 1) from a distribution spec:
+      {"kind": "uniform", "low": 3, "high": 5}
+      {"kind": "geometric", "mean": 4, "max": 20}   (heavy tail of short jobs)
+      {"kind": "bimodal", "short": 2, "long": 10, "p_long": 0.2}
+    """
+    kind = distribution.get("kind", "uniform")
+    if kind == "uniform":
+        return rng.randint(distribution.get("low", 3), distribution.get("high", 5))
+    if kind == "geometric":
+        mean = max(1.0, float(distribution.get("mean", 4)))
+        burst = 1
+        while burst < distribution.get("max", 20) and rng.random() > 1.0 / mean:
+            burst += 1
+        return burst
+    if kind == "bimodal":
+        return distribution.get("long", 10) if rng.random() < distribution.get("p_long", 0.2) else distribution.get("short", 2)
+    raise ValueError(f"Unknown burst distribution '{kind}', expected one of {BURST_DISTRIBUTIONS}")
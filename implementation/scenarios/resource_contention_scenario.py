@@ -5,9 +5,19 @@ This module provides various scenario configurations that test different
 aspects of distributed coordination under resource contention constraints.
 """
 
-from typing import List, Dict, Any
+import copy
+import io
+import multiprocessing
+import multiprocessing.connection
+import math
+import os
+import time
+from contextlib import redirect_stdout, redirect_stderr
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass
+import numpy as np
 from agents.processor_agent import ProcessorLLMAgent
+from scenarios.population import generate_processor_configs
 
 @dataclass
 class ScenarioConfig:
@@ -27,8 +37,9 @@ class ResourceContentionScenario:
     and measuring emergent coordination effectiveness.
     """
     
-    def __init__(self, config: ScenarioConfig):
+    def __init__(self, config: ScenarioConfig, agent_class=ProcessorLLMAgent):
         self.config = config
+        self.agent_class = agent_class
         self.processors = []
         self.results = {}
     
@@ -37,7 +48,7 @@ class ResourceContentionScenario:
         processors = []
         
         for proc_config in self.config.processors:
-            processor = ProcessorLLMAgent(
+            processor = self.agent_class(
                 processor_id=proc_config["id"],
                 true_burst_time=proc_config["burst_time"],
                 strategy_type=proc_config["strategy"],
@@ -82,7 +93,7 @@ class ResourceContentionScenario:
         if metric_name == "coordination_effectiveness":
             return final_state.get("coordination_effectiveness", 0.0)
         elif metric_name == "trust_differentiation":
-            trust_scores = [p.trust_score for p in self.processors]
+            trust_scores = [p.state.trust_score for p in self.processors]
             return max(trust_scores) - min(trust_scores) if trust_scores else 0.0
         elif metric_name == "coalition_formation_rate":
             formations = final_state.get("coalition_formations", [])
@@ -300,19 +311,16 @@ class ScalabilityTestScenario(ResourceContentionScenario):
     and complexity.
     """
     
-    def __init__(self, processor_count: int = 4):
-        # Generate processors dynamically based on count
-        strategies = ["cooperative", "aggressive", "strategic"]
-        bias_levels = [0.1, 0.7, 0.4]
-        
-        processors = []
-        for i in range(processor_count):
-            processors.append({
-                "id": chr(65 + i),  # A, B, C, D, ...
-                "burst_time": 3 + (i % 3),  # Vary between 3-5
-                "strategy": strategies[i % 3],
-                "bias": bias_levels[i % 3]
-            })
+    def __init__(self, processor_count: int = 4, burst_range: Tuple[int, int] = (3, 5),
+                 strategy_weights: Optional[Dict[str, float]] = None, seed: Optional[int] = None,
+                 agent_class=ProcessorLLMAgent):
+        # Generate processors dynamically based on count (ids A..Z, AA, AB, ...)
+        processors = generate_processor_configs(
+            processor_count,
+            burst_range=burst_range,
+            strategy_weights=strategy_weights,
+            seed=seed
+        )
         
         config = ScenarioConfig(
             name=f"Scalability Test - {processor_count} Processors",
@@ -333,7 +341,7 @@ class ScalabilityTestScenario(ResourceContentionScenario):
             difficulty_level="advanced" if processor_count > 5 else "intermediate"
         )
         self.processor_count = processor_count
-        super().__init__(config)
+        super().__init__(config, agent_class=agent_class)
     
     def _extract_metric(self, final_state: Dict, metric_name: str) -> float:
         """Extract metrics specific to scalability testing"""
@@ -421,8 +429,8 @@ class ScenarioRunner:
         """Register a scenario for execution"""
         self.scenarios[name] = scenario
     
-    def run_scenario(self, name: str, coordination_system_class) -> Dict[str, Any]:
-        """Run a specific scenario and return results"""
+    def run_scenario(self, name: str, coordination_system_class, seed: Optional[int] = None) -> Dict[str, Any]:
+        """Run a specific scenario and return results; a seed makes the run reproducible"""
         if name not in self.scenarios:
             raise ValueError(f"Scenario '{name}' not registered")
         
@@ -430,7 +438,10 @@ class ScenarioRunner:
         processors = scenario.setup_processors()
         
         # Create coordination system and run simulation
-        coordination_system = coordination_system_class(processors)
+        if seed is None:
+            coordination_system = coordination_system_class(processors)
+        else:
+            coordination_system = coordination_system_class(processors, seed=seed)
         
         try:
             final_state = coordination_system.workflow.invoke(coordination_system.system_state)
@@ -456,8 +467,18 @@ class ScenarioRunner:
             self.results[name] = error_result
             return error_result
     
-    def run_all_scenarios(self, coordination_system_class) -> Dict[str, Any]:
-        """Run all registered scenarios"""
+    def run_all_scenarios(self, coordination_system_class, parallel: bool = False,
+                          max_workers: Optional[int] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run all registered scenarios. With parallel=True each scenario runs in
+        its own worker process (at most max_workers at once, default one per
+        CPU) with its stdout captured; a scenario exceeding `timeout` seconds
+        is terminated and recorded as failed. Results are merged into
+        self.results in registration order either way.
+        """
+        if parallel:
+            return self._run_scenarios_parallel(coordination_system_class, max_workers, timeout)
+        
         all_results = {}
         
         for name in self.scenarios:
@@ -472,6 +493,102 @@ class ScenarioRunner:
         
         return all_results
     
+    def _run_scenarios_parallel(self, coordination_system_class, max_workers: Optional[int],
+                                timeout: Optional[float]) -> Dict[str, Any]:
+        names = list(self.scenarios)
+        jobs = [(name, name, self.scenarios[name], None) for name in names]
+        finished = _run_in_workers(jobs, coordination_system_class, max_workers, timeout)
+        
+        all_results = {}
+        for name in names:
+            result, output = finished[name]
+            print(f"\n🔄 Running scenario: {name}")
+            if output:
+                print(output, end="" if output.endswith("\n") else "\n")
+            self.results[name] = result
+            all_results[name] = result
+            
+            if result["success"]:
+                print(f"✅ Scenario '{name}' completed successfully")
+            else:
+                print(f"❌ Scenario '{name}' failed")
+        
+        return all_results
+    
+    def run_replications(self, name: str, coordination_system_class, replications: int = 30,
+                         base_seed: int = 0, parallel: bool = True, max_workers: Optional[int] = None,
+                         ci_target: Optional[float] = None, min_replications: int = 5,
+                         timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Monte Carlo replication of one scenario: up to `replications` runs with
+        independent seeds, each success-criterion metric summarised as mean,
+        standard deviation and 95% confidence interval.
+        
+        Runs are executed in batches (one per worker when parallel). With
+        ci_target set, replication stops once at least min_replications runs
+        succeeded and every metric's CI width is at or below the target.
+        The aggregate is stored in self.results[name] (criterion "actual" is
+        the mean) so compare_scenarios and generate_scenario_report use it.
+        """
+        if name not in self.scenarios:
+            raise ValueError(f"Scenario '{name}' not registered")
+        
+        scenario = self.scenarios[name]
+        seeds = [int(seed) for seed in np.random.SeedSequence(base_seed).generate_state(replications, dtype=np.uint64)]
+        batch_size = max(1, min(max_workers or os.cpu_count() or 1, replications)) if parallel else 1
+        runs = []
+        
+        while len(runs) < replications:
+            batch = seeds[len(runs):len(runs) + batch_size]
+            if parallel:
+                jobs = [(seed, name, scenario, seed) for seed in batch]
+                finished = _run_in_workers(jobs, coordination_system_class, max_workers, timeout)
+                batch_results = [finished[seed][0] for seed in batch]
+            else:
+                batch_results = []
+                for seed in batch:
+                    with redirect_stdout(io.StringIO()):
+                        batch_results.append(self.run_scenario(name, coordination_system_class, seed=seed))
+            for seed, result in zip(batch, batch_results):
+                runs.append({"seed": seed, "result": result})
+            
+            if ci_target is not None:
+                summary = _summarize_replications(scenario, runs)
+                if summary["completed_replications"] >= min_replications and all(
+                    metric["ci95_width"] is not None and metric["ci95_width"] <= ci_target
+                    for metric in summary["metrics"].values()
+                ):
+                    break
+        
+        summary = _summarize_replications(scenario, runs)
+        summary["scenario_name"] = name
+        summary["ci_target"] = ci_target
+        summary["stopped_early"] = len(runs) < replications
+        
+        result = {
+            "scenario_name": name,
+            "scenario_config": scenario.config,
+            "evaluation": summary["evaluation"],
+            "success": summary["evaluation"]["overall_success"],
+            "replication_summary": summary
+        }
+        if not summary["completed_replications"]:
+            result["error"] = runs[0]["result"].get("error", "All replications failed") if runs else "No replications run"
+        self.results[name] = result
+        return summary
+    
+    def run_all_replications(self, coordination_system_class, **replication_options) -> Dict[str, Any]:
+        """Run run_replications for every registered scenario in registration order"""
+        summaries = {}
+        for name in self.scenarios:
+            print(f"\n🔄 Replicating scenario: {name}")
+            summary = self.run_replications(name, coordination_system_class, **replication_options)
+            summaries[name] = summary
+            print(f"{'✅' if self.results[name]['success'] else '❌'} {name}: "
+                  f"{summary['completed_replications']}/{summary['replications']} runs, "
+                  f"success rate {summary['success_rate']:.1%}")
+        return summaries
+    
     def compare_scenarios(self) -> Dict[str, Any]:
         """Compare results across all run scenarios"""
         if not self.results:
@@ -563,6 +680,19 @@ class ScenarioRunner:
                 ""
             ])
             
+            replication = result.get("replication_summary")
+            if replication:
+                report_lines.append(
+                    f"**Replications:** {replication['completed_replications']}/{replication['replications']} "
+                    f"completed, per-run success rate {replication['success_rate']:.1%}"
+                )
+                for metric, stats in replication["metrics"].items():
+                    interval = f"95% CI {stats['ci95'][0]:.3f}–{stats['ci95'][1]:.3f}" if stats["ci95"] else "no CI"
+                    report_lines.append(
+                        f"- {metric}: {stats['mean']:.3f} ± {stats['std']:.3f} ({interval}, n={stats['count']})"
+                    )
+                report_lines.append("")
+            
             if "scenario_config" in result:
                 config = result["scenario_config"]
                 report_lines.extend([
@@ -583,12 +713,174 @@ class ScenarioRunner:
         
         return "\n".join(report_lines)
 
-# Pre-configured scenario instances for easy use
-STANDARD_SCENARIOS = {
-    "standard": StandardThreeProcessorScenario(),
-    "high_contention": HighContentionScenario(), 
-    "trust_crisis": TrustCrisisScenario(),
-    "asymmetric": AsymmetricProcessorScenario(),
-    "scalability_4": ScalabilityTestScenario(4),
-    "scalability_6": ScalabilityTestScenario(6)
-}
\ No newline at end of file
+# Two-sided 95% Student t critical values by degrees of freedom; 1.96 beyond 30
+_T_CRITICAL_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+    9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131,
+    16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086, 21: 2.080, 22: 2.074,
+    23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042
+}
+
+def _metric_statistics(values: List[float]) -> Dict[str, Any]:
+    count = len(values)
+    mean = sum(values) / count
+    if count < 2:
+        # One sample has no confidence interval; None keeps the summary valid JSON
+        return {"mean": mean, "std": 0.0, "count": count, "ci95": None, "ci95_width": None}
+    std = math.sqrt(sum((v - mean) ** 2 for v in values) / (count - 1))
+    half_width = _T_CRITICAL_95.get(count - 1, 1.96) * std / math.sqrt(count)
+    return {
+        "mean": mean,
+        "std": std,
+        "count": count,
+        "ci95": (mean - half_width, mean + half_width),
+        "ci95_width": 2 * half_width
+    }
+
+def _summarize_replications(scenario: ResourceContentionScenario, runs: List[Dict]) -> Dict[str, Any]:
+    """Aggregate replication results into per-criterion statistics and an evaluation"""
+    completed = [run["result"] for run in runs if "evaluation" in run["result"]]
+    metrics = {}
+    for criterion in scenario.config.success_criteria:
+        values = [
+            result["evaluation"]["success_criteria_met"][criterion]["actual"]
+            for result in completed
+            if result["evaluation"]["success_criteria_met"][criterion]["actual"] is not None
+        ]
+        if values:
+            metrics[criterion] = _metric_statistics(values)
+    
+    evaluation = {"success_criteria_met": {}, "overall_success": False, "scenario_insights": []}
+    for criterion, threshold in scenario.config.success_criteria.items():
+        stats = metrics.get(criterion)
+        mean = stats["mean"] if stats else None
+        evaluation["success_criteria_met"][criterion] = {
+            "threshold": threshold,
+            "actual": mean,
+            "met": mean >= threshold if mean is not None else False,
+            "std": stats["std"] if stats else None,
+            "ci95": stats["ci95"] if stats else None
+        }
+    met_count = sum(1 for v in evaluation["success_criteria_met"].values() if v["met"])
+    evaluation["overall_success"] = bool(completed) and met_count >= (len(scenario.config.success_criteria) * 0.6)
+    evaluation["scenario_insights"] = scenario._generate_scenario_insights(evaluation)
+    
+    return {
+        "replications": len(runs),
+        "completed_replications": len(completed),
+        "success_rate": sum(1 for result in completed if result.get("success")) / len(runs) if runs else 0.0,
+        "seeds": [run["seed"] for run in runs],
+        "metrics": metrics,
+        "evaluation": evaluation
+    }
+
+def _run_in_workers(jobs: List[tuple], coordination_system_class, max_workers: Optional[int],
+                    timeout: Optional[float]) -> Dict[Any, tuple]:
+    """
+    Run (key, scenario_name, scenario, seed) jobs, one worker process each and
+    at most max_workers at once. Returns {key: (result, captured_output)}.
+    """
+    return dict(_iter_in_workers(jobs, coordination_system_class, max_workers, timeout))
+
+def _iter_in_workers(jobs: List[tuple], coordination_system_class, max_workers: Optional[int],
+                     timeout: Optional[float]) -> Iterator[Tuple[Any, tuple]]:
+    """Like _run_in_workers, but yields (key, (result, captured_output)) as each job finishes"""
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(jobs) or 1))
+    pending = list(jobs)
+    running = {}
+    
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                key, name, scenario, seed = pending.pop(0)
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(
+                    target=_scenario_worker,
+                    args=(sender, name, _detached_scenario(scenario), coordination_system_class, seed),
+                    name=f"scenario-{name}",
+                    daemon=True
+                )
+                process.start()
+                sender.close()
+                running[key] = (name, process, receiver, time.monotonic())
+        
+            multiprocessing.connection.wait(
+                [receiver for _, _, receiver, _ in running.values()] + [process.sentinel for _, process, _, _ in running.values()],
+                timeout=0.1
+            )
+        
+            for key, (name, process, receiver, started) in list(running.items()):
+                payload = None
+                if receiver.poll():
+                    payload = _receive_result(name, process, receiver)
+                elif not process.is_alive():
+                    # The worker may have sent its result and exited between the poll and the liveness check
+                    payload = _receive_result(name, process, receiver) if receiver.poll() else _worker_failure(name, process)
+                elif timeout is not None and time.monotonic() - started > timeout:
+                    process.terminate()
+                    payload = ({"scenario_name": name, "error": f"Timed out after {timeout:g}s", "success": False}, "")
+                if payload is None:
+                    continue
+                process.join()
+                receiver.close()
+                del running[key]
+                yield key, payload
+    finally:
+        # Abandoned early (e.g. interrupted sweep): don't leave workers running
+        for _, process, receiver, _ in running.values():
+            process.terminate()
+            process.join()
+            receiver.close()
+
+def _worker_failure(name: str, process) -> tuple:
+    return ({"scenario_name": name, "error": f"Worker exited with code {process.exitcode}", "success": False}, "")
+
+def _receive_result(name: str, process, receiver) -> tuple:
+    try:
+        return receiver.recv()
+    except EOFError:
+        process.join()
+        return _worker_failure(name, process)
+
+def _detached_scenario(scenario: ResourceContentionScenario) -> ResourceContentionScenario:
+    """Copy of a scenario without live agents, safe to send to a worker process"""
+    detached = copy.copy(scenario)
+    detached.processors = []
+    detached.results = {}
+    return detached
+
+def _scenario_worker(connection, name: str, scenario: ResourceContentionScenario, coordination_system_class,
+                     seed: Optional[int] = None):
+    """Run one scenario in a worker process and send back (result, captured output)"""
+    output = io.StringIO()
+    try:
+        with redirect_stdout(output), redirect_stderr(output):
+            runner = ScenarioRunner()
+            runner.register_scenario(name, scenario)
+            result = runner.run_scenario(name, coordination_system_class, seed=seed)
+    except BaseException as e:
+        result = {"scenario_name": name, "error": f"{type(e).__name__}: {e}", "success": False}
+    try:
+        connection.send((result, output.getvalue()))
+    except Exception as e:
+        connection.send(({"scenario_name": name, "error": f"Unpicklable result: {e}", "success": False}, output.getvalue()))
+    finally:
+        connection.close()
+
+# Pre-configured scenario instances for easy use. Built on first access of
+# STANDARD_SCENARIOS (PEP 562) so importing this module stays cheap.
+STANDARD_SCENARIO_FACTORIES = {
+    "standard": StandardThreeProcessorScenario,
+    "high_contention": HighContentionScenario,
+    "trust_crisis": TrustCrisisScenario,
+    "asymmetric": AsymmetricProcessorScenario,
+    "scalability_4": lambda: ScalabilityTestScenario(4),
+    "scalability_6": lambda: ScalabilityTestScenario(6)
+}
+
+def __getattr__(name: str):
+    if name == "STANDARD_SCENARIOS":
+        scenarios = {key: factory() for key, factory in STANDARD_SCENARIO_FACTORIES.items()}
+        globals()["STANDARD_SCENARIOS"] = scenarios
+        return scenarios
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
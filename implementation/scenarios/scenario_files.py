@@ -0,0 +1,158 @@
+"""
+Scenario Files - Load coordination scenarios from JSON or TOML files.
+
+A file either lists its processors explicitly or describes a generated
+population:
+
+    name = "Bursty mix"
+    description = "Two long jobs among many short ones"
+    difficulty = "intermediate"
+    expected_behaviors = ["Short jobs finish first"]
+
+    [success_criteria]
+    trust_differentiation = 0.3
+
+    [[processors]]
+    id = "A"
+    burst_time = 5
+    strategy = "aggressive"
+    bias = 0.7
+
+or, instead of [[processors]]:
+
+    [population]
+    count = 12
+    burst_range = [3, 8]
+    strategy_weights = { cooperative = 2, aggressive = 1, strategic = 1 }
+    seed = 7
+
+Optional top-level run settings (max_rounds, trust_engine, slots_per_round,
+cores, adaptive_quantum, max_quantum, auction, shard_size, shard_by) are
+checked and returned separately so callers can apply them to the coordination
+system.
+"""
+
+import json
+import os
+from typing import Any, Dict, Tuple
+
+from coordination_framework.scheduling import AUCTIONS
+from coordination_framework.sharding import SHARD_STRATEGIES
+from scenarios.population import STRATEGIES, generate_processor_configs
+from scenarios.resource_contention_scenario import ResourceContentionScenario, ScenarioConfig
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+DEFAULT_SUCCESS_CRITERIA = {
+    "trust_differentiation": 0.3,
+    "coalition_formation_rate": 0.2,
+    "system_completion_efficiency": 0.5
+}
+POPULATION_KEYS = ("count", "burst_range", "strategy_weights", "bias_by_strategy", "bias_jitter", "seed")
+RUN_SETTINGS = ("max_rounds", "trust_engine", "slots_per_round", "cores", "adaptive_quantum", "max_quantum",
+                "auction", "shard_size", "shard_by")
+TRUST_ENGINES = ("scalar", "batched")
+# Run settings that must be integers >= 1, and those limited to a set of names
+POSITIVE_RUN_SETTINGS = ("max_rounds", "slots_per_round", "cores", "max_quantum", "shard_size")
+CHOICE_RUN_SETTINGS = {"trust_engine": TRUST_ENGINES, "auction": AUCTIONS, "shard_by": SHARD_STRATEGIES}
+
+def read_scenario_file(path: str) -> Dict[str, Any]:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    if extension == ".toml":
+        if tomllib is None:
+            raise RuntimeError("TOML scenario files need Python 3.11+ (tomllib)")
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    raise ValueError(f"Unsupported scenario file '{path}': expected .json or .toml")
+
+def _validate_processor(entry: Dict[str, Any], index: int) -> Dict[str, Any]:
+    missing = {"id", "burst_time", "strategy"} - set(entry)
+    if missing:
+        raise ValueError(f"Processor {index} is missing {sorted(missing)}")
+    if entry["strategy"] not in STRATEGIES:
+        raise ValueError(f"Processor {entry['id']}: unknown strategy '{entry['strategy']}'")
+    burst_time = int(entry["burst_time"])
+    if burst_time < 1:
+        raise ValueError(f"Processor {entry['id']}: burst_time must be at least 1")
+    return {
+        "id": str(entry["id"]),
+        "burst_time": burst_time,
+        "strategy": entry["strategy"],
+        "bias": max(0.0, min(1.0, float(entry.get("bias", 0.0))))
+    }
+
+def _validate_population(population: Any) -> Dict[str, Any]:
+    if not isinstance(population, dict):
+        raise ValueError("'population' must be a table")
+    if "count" not in population:
+        raise ValueError("Population is missing 'count'")
+    unknown = set(population) - set(POPULATION_KEYS)
+    if unknown:
+        raise ValueError(f"Population has unknown keys {sorted(unknown)} (expected some of {list(POPULATION_KEYS)})")
+    population = dict(population)
+    if isinstance(population["count"], bool) or not isinstance(population["count"], int):
+        raise ValueError(f"Population count must be an integer, got {population['count']!r}")
+    if population["count"] < 1:
+        raise ValueError("Population count must be at least 1")
+    if "burst_range" in population:
+        burst_range = population["burst_range"]
+        if not isinstance(burst_range, (list, tuple)) or len(burst_range) != 2:
+            raise ValueError("Population burst_range must be [min, max]")
+        population["burst_range"] = (int(burst_range[0]), int(burst_range[1]))
+    return population
+
+def _validate_run_settings(data: Dict[str, Any]) -> Dict[str, Any]:
+    settings = {key: data[key] for key in RUN_SETTINGS if key in data}
+    for key in POSITIVE_RUN_SETTINGS:
+        if key not in settings:
+            continue
+        value = settings[key]
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f"Run setting '{key}' must be an integer, got {value!r}")
+        if value < 1:
+            raise ValueError(f"Run setting '{key}' must be at least 1")
+    for key, choices in CHOICE_RUN_SETTINGS.items():
+        if key in settings and settings[key] not in choices:
+            raise ValueError(f"Run setting '{key}' must be one of {list(choices)}, got {settings[key]!r}")
+    if "adaptive_quantum" in settings and not isinstance(settings["adaptive_quantum"], bool):
+        raise ValueError(f"Run setting 'adaptive_quantum' must be true or false, got {settings['adaptive_quantum']!r}")
+    if settings.get("adaptive_quantum") and settings.get("max_quantum", 16) < settings.get("slots_per_round", 1):
+        raise ValueError("Run setting 'max_quantum' must be at least 'slots_per_round'")
+    return settings
+
+def scenario_config_from_dict(data: Dict[str, Any], default_name: str = "File Scenario") -> ScenarioConfig:
+    if "processors" in data and "population" in data:
+        raise ValueError("Give either 'processors' or 'population', not both")
+    if "processors" in data:
+        processors = [_validate_processor(entry, i) for i, entry in enumerate(data["processors"])]
+        ids = [processor["id"] for processor in processors]
+        if len(set(ids)) != len(ids):
+            raise ValueError("Processor ids must be unique")
+    elif "population" in data:
+        processors = generate_processor_configs(**_validate_population(data["population"]))
+    else:
+        raise ValueError("Scenario needs a 'processors' list or a 'population' table")
+    if not processors:
+        raise ValueError("Scenario has no processors")
+
+    return ScenarioConfig(
+        name=data.get("name", default_name),
+        description=data.get("description", "Scenario loaded from file"),
+        processors=processors,
+        expected_behaviors=list(data.get("expected_behaviors", [])),
+        success_criteria=dict(data.get("success_criteria", DEFAULT_SUCCESS_CRITERIA)),
+        difficulty_level=data.get("difficulty", "intermediate")
+    )
+
+def load_scenario_file(path: str) -> Tuple[ResourceContentionScenario, Dict[str, Any]]:
+    """Scenario described by a JSON/TOML file plus its run settings (see RUN_SETTINGS)"""
+    data = read_scenario_file(path)
+    default_name = os.path.splitext(os.path.basename(path))[0]
+    scenario = ResourceContentionScenario(scenario_config_from_dict(data, default_name))
+    return scenario, _validate_run_settings(data)